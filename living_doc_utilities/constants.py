@@ -18,11 +18,54 @@
 This module contains all constants and enums used across the project.
 """
 
+from enum import StrEnum
+
 # General Action inputs
 GITHUB_TOKEN = "GITHUB_TOKEN"
+PROFILE = "PROFILE"
 
 # Output related
 OUTPUT_PATH = "./output"
 
 # Symbol, when no project is attached to an issue
 NO_PROJECT_DATA = "---"
+
+
+class SnapshotFormat(StrEnum):
+    """
+    Supported file formats of the issues snapshot.
+    """
+
+    JSON = "json"
+    JSONL = "jsonl"
+    BINARY = "binary"
+
+
+class RateLimitResource(StrEnum):
+    """
+    GitHub API resources with separate rate limit quotas.
+    """
+
+    CORE = "core"
+    SEARCH = "search"
+    GRAPHQL = "graphql"
+
+
+class CircuitState(StrEnum):
+    """
+    States of the circuit breaker around GitHub API calls.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class ProfileMode(StrEnum):
+    """
+    Profilers capturing an action run, selected by the profile input.
+    """
+
+    CPU = "cpu"
+    MEMORY = "memory"
+    ALL = "all"
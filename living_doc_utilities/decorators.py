@@ -19,72 +19,308 @@ This module contains decorators for adding debug logging to method calls
 and for creating rate-limited safe call functions.
 """
 
+import asyncio
 import logging
+import reprlib
+import time
 
 from typing import Callable, Optional, Any
 from functools import wraps
 from github import GithubException
 from requests import Timeout, RequestException
 
-from living_doc_utilities.github.rate_limiter import GithubRateLimiter
+from living_doc_utilities.constants import CircuitState, RateLimitResource
+from living_doc_utilities.github.circuit_breaker import CircuitBreaker
+from living_doc_utilities.github.rate_limiter import AsyncGithubRateLimiter, GithubRateLimiter
+from living_doc_utilities.github.retry_policy import RetryPolicy, has_builtin_retry
+from living_doc_utilities.metrics import MetricsRegistry
+from living_doc_utilities.tracing import traced, tracer
 
 logger = logging.getLogger(__name__)
 
+# Limits of the logged representations of arguments and return values, e.g. of whole issue bodies.
+DEBUG_REPR = reprlib.Repr()
+DEBUG_REPR.maxlevel = 3
+DEBUG_REPR.maxstring = DEBUG_REPR.maxother = 200
+DEBUG_REPR.maxlist = DEBUG_REPR.maxtuple = DEBUG_REPR.maxdict = DEBUG_REPR.maxset = 10
+
+
+# pylint: disable=too-few-public-methods
+class _TruncatedRepr:
+    """Truncated representation of an object, computed only if the log record is emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return DEBUG_REPR.repr(self.obj)
+
+
+class _Attempts:
+    """
+    The attempts of one safe call. Keeps the retry and circuit breaker bookkeeping shared by the sync and async
+    safe call decorators, which differ only in how they call and wait.
+    """
+
+    __slots__ = ("method", "retry_policy", "circuit_breaker", "number")
+
+    def __init__(
+        self, method: Callable, retry_policy: Optional[RetryPolicy], circuit_breaker: Optional[CircuitBreaker]
+    ):
+        self.method = method
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.number = 1
+
+    def allowed(self) -> bool:
+        """
+        Check whether the next attempt may run.
+
+        @return: False if the circuit is open, True otherwise.
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            logger.debug("Circuit of %s is open, skipping call of %s.", self.circuit_breaker.name, self.method.__name__)
+            return False
+        return True
+
+    def succeeded(self) -> None:
+        """
+        Record a successful attempt.
+
+        @return: None
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record()
+
+    def aborted(self) -> None:
+        """
+        Release an attempt interrupted by an exception which is not a failure of the call, e.g. a cancellation.
+
+        @return: None
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release()
+
+    def failed(self, e: Exception) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether the call is retried. The error is logged when giving up.
+
+        @param e: The error raised by the attempt.
+        @return: The number of seconds to wait before the next attempt, None if the call gives up.
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(e)
+        if (
+            self.retry_policy is None
+            or self.number >= self.retry_policy.max_attempts
+            or not self.retry_policy.is_retryable(e)
+            # no retries once the failure opened the circuit
+            or (self.circuit_breaker is not None and self.circuit_breaker.state == CircuitState.OPEN)
+        ):
+            _log_call_error(self.method, e)
+            return None
+
+        delay = self.retry_policy.delay(self.number, e)
+        logger.warning(
+            "Attempt %d of %d calling %s failed: %s. Retrying in %.1f seconds.",
+            self.number,
+            self.retry_policy.max_attempts,
+            self.method.__name__,
+            e,
+            delay,
+        )
+        self.number += 1
+        return delay
+
 
 def debug_log_decorator(method: Callable) -> Callable:
     """
     Decorator to add debug logging for a method call.
 
+    The method is returned unchanged if debug logging is disabled when it is decorated, so decorate after
+    the logging is set up. Logged arguments and return values are truncated.
+
     @param method: The method to decorate.
     @return: The decorated method.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return method
 
     @wraps(method)
     def wrapped(*args, **kwargs) -> Optional[Any]:
-        logger.debug("Calling method %s with args: %s and kwargs: %s.", method.__name__, args, kwargs)
+        logger.debug(
+            "Calling method %s with args: %s and kwargs: %s.",
+            method.__name__,
+            _TruncatedRepr(args),
+            _TruncatedRepr(kwargs),
+        )
         result = method(*args, **kwargs)
-        logger.debug("Method %s returned %s.", method.__name__, result)
+        logger.debug("Method %s returned %s.", method.__name__, _TruncatedRepr(result))
         return result
 
     return wrapped
 
 
-def safe_call_decorator(rate_limiter: GithubRateLimiter) -> Callable:
+def safe_call_decorator(
+    rate_limiter: GithubRateLimiter,
+    resource: str = RateLimitResource.CORE,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Callable:
     """
     Decorator factory to create a rate-limited safe call function.
 
     @param rate_limiter: The rate limiter to use.
+    @param resource: The GitHub API resource consumed by the decorated methods: 'core', 'search' or 'graphql'.
+    @param retry_policy: The policy of retrying calls failed with transient errors; no retries if not set.
+    @param circuit_breaker: The circuit breaker failing calls fast during an outage; calls return None while it is
+        open. Share one breaker among the methods calling the same host, or give every method its own.
+    @param metrics: The registry recording every attempt, its latency and rate limit wait; no metrics if not set.
     @return: The decorator.
+    @raises ValueError: If a retry policy is given and a client of the rate limiter retries failed requests itself.
     """
+    _check_retry_policy(rate_limiter, retry_policy)
 
     def decorator(method: Callable) -> Callable:
+        # Every attempt goes through the rate limiter.
+        limited_method = rate_limiter.for_resource(resource)(method)
+        if metrics is not None:
+            limited_method = metrics.instrument(limited_method, getattr(method, "__qualname__", method.__name__))
+
         # Note: Keep the log decorator first to log the correct method name.
         @debug_log_decorator
+        @traced(f"safe_call:{method.__name__}", "safe_call")
         @wraps(method)
-        @rate_limiter
         def wrapped(*args, **kwargs) -> Optional[Any]:
-            try:
-                return method(*args, **kwargs)
-            except (ConnectionError, Timeout) as e:
-                logger.error("Network error calling %s: %s.", method.__name__, e, exc_info=True)
-                return None
-            except GithubException as e:
-                logger.error("GitHub API error calling %s: %s.", method.__name__, e, exc_info=True)
-                return None
-            except RequestException as e:
-                logger.error("HTTP error calling %s: %s.", method.__name__, e, exc_info=True)
-                return None
-            # pylint: disable=broad-exception-caught
-            except Exception as e:
-                logger.error(
-                    "Unexpected error of type %s occurred in %s: %s.",
-                    type(e).__name__,
-                    method.__name__,
-                    e,
-                    exc_info=True,
-                )
-                return None
+            attempts = _Attempts(method, retry_policy, circuit_breaker)
+            while attempts.allowed():
+                try:
+                    result = limited_method(*args, **kwargs)
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    delay = attempts.failed(e)
+                    if delay is None:
+                        return None
+                    with tracer.span("retry.backoff", "safe_call", seconds=delay):
+                        time.sleep(delay)
+                except BaseException:
+                    attempts.aborted()
+                    raise
+                else:
+                    attempts.succeeded()
+                    return result
+            return None
+
+        return wrapped
+
+    return decorator
+
+
+def async_debug_log_decorator(method: Callable) -> Callable:
+    """
+    Decorator to add debug logging for a coroutine function call.
+
+    Like `debug_log_decorator`, the coroutine function is returned unchanged if debug logging is disabled when
+    it is decorated.
+
+    @param method: The coroutine function to decorate.
+    @return: The decorated coroutine function.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return method
+
+    @wraps(method)
+    async def wrapped(*args, **kwargs) -> Optional[Any]:
+        logger.debug(
+            "Calling method %s with args: %s and kwargs: %s.",
+            method.__name__,
+            _TruncatedRepr(args),
+            _TruncatedRepr(kwargs),
+        )
+        result = await method(*args, **kwargs)
+        logger.debug("Method %s returned %s.", method.__name__, _TruncatedRepr(result))
+        return result
+
+    return wrapped
+
+
+def async_safe_call_decorator(
+    rate_limiter: AsyncGithubRateLimiter,
+    resource: str = RateLimitResource.CORE,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    metrics: Optional[MetricsRegistry] = None,
+) -> Callable:
+    """
+    Decorator factory to create a rate-limited safe call coroutine function.
+
+    @param rate_limiter: The asyncio rate limiter to use.
+    @param resource: The GitHub API resource consumed by the decorated methods: 'core', 'search' or 'graphql'.
+    @param retry_policy: The policy of retrying calls failed with transient errors; no retries if not set.
+    @param circuit_breaker: The circuit breaker failing calls fast during an outage; calls return None while it is
+        open. Share one breaker among the methods calling the same host, or give every method its own.
+    @param metrics: The registry recording every attempt, its latency and rate limit wait; no metrics if not set.
+    @return: The decorator of coroutine functions or blocking callables, the latter run in a worker thread.
+    @raises ValueError: If a retry policy is given and a client of the rate limiter retries failed requests itself.
+    """
+    _check_retry_policy(rate_limiter, retry_policy)
+
+    def decorator(method: Callable) -> Callable:
+        # Every attempt goes through the rate limiter.
+        limited_method = rate_limiter.for_resource(resource)(method)
+        if metrics is not None:
+            limited_method = metrics.instrument(limited_method, getattr(method, "__qualname__", method.__name__))
+
+        # Note: Keep the log decorator first to log the correct method name.
+        @async_debug_log_decorator
+        @traced(f"safe_call:{method.__name__}", "safe_call")
+        @wraps(method)
+        async def wrapped(*args, **kwargs) -> Optional[Any]:
+            attempts = _Attempts(method, retry_policy, circuit_breaker)
+            while attempts.allowed():
+                try:
+                    result = await limited_method(*args, **kwargs)
+                # pylint: disable=broad-exception-caught
+                except Exception as e:
+                    delay = attempts.failed(e)
+                    if delay is None:
+                        return None
+                    with tracer.span("retry.backoff", "safe_call", seconds=delay):
+                        await asyncio.sleep(delay)
+                except BaseException:
+                    attempts.aborted()
+                    raise
+                else:
+                    attempts.succeeded()
+                    return result
+            return None
 
         return wrapped
 
     return decorator
+
+
+def _check_retry_policy(rate_limiter: GithubRateLimiter, retry_policy: Optional[RetryPolicy]) -> None:
+    # The retries of PyGithub would multiply the attempts of the policy.
+    if retry_policy is not None and any(has_builtin_retry(client) for client in rate_limiter.github_clients):
+        raise ValueError("GitHub clients used with a retry policy must be created with retry=None.")
+
+
+def _log_call_error(method: Callable, e: Exception) -> None:
+    if isinstance(e, (ConnectionError, Timeout)):
+        logger.error("Network error calling %s: %s.", method.__name__, e, exc_info=True)
+    elif isinstance(e, GithubException):
+        logger.error("GitHub API error calling %s: %s.", method.__name__, e, exc_info=True)
+    elif isinstance(e, RequestException):
+        logger.error("HTTP error calling %s: %s.", method.__name__, e, exc_info=True)
+    else:
+        logger.error(
+            "Unexpected error of type %s occurred in %s: %s.",
+            type(e).__name__,
+            method.__name__,
+            e,
+            exc_info=True,
+        )
@@ -17,12 +17,21 @@
 This module contains a parent class for creating exporters.
 """
 
+from living_doc_utilities.tracing import traced
+
 
 class Exporter:
     """
     A parent class for creating exporters.
+
+    The `export` method of every subclass is traced.
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "export" in cls.__dict__:
+            cls.export = traced(category="export")(cls.__dict__["export"])  # type: ignore[method-assign]
+
     def export(self, **kwargs) -> bool:
         """
         A method for exporting the output in the selected format.
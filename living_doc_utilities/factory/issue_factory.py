@@ -35,21 +35,22 @@ class IssueFactory:
     """
 
     @classmethod
-    def get(cls, class_name: str, values: dict[str, Any]) -> "Issue":
+    def get(cls, class_name: str, values: dict[str, Any], compact: bool = False) -> "Issue":
         """
         Return an instance of the Issue subclass by name.
 
         @param class_name: The name of the Issue class to instantiate.
         @param values: A dictionary of values to initialize the Issue instance.
+        @param compact: If True, identical project statuses share one immutable ProjectStatus instance.
 
         @return: An instance of the matched Issue subclass, or base Issue.
         """
         match class_name:
             case "UserStoryIssue":
-                return UserStoryIssue.from_dict(values)
+                return UserStoryIssue.from_dict(values, compact)
             case "FeatureIssue":
-                return FeatureIssue.from_dict(values)
+                return FeatureIssue.from_dict(values, compact)
             case "FunctionalityIssue":
-                return FunctionalityIssue.from_dict(values)
+                return FunctionalityIssue.from_dict(values, compact)
             case _:
-                return Issue.from_dict(values)
+                return Issue.from_dict(values, compact)
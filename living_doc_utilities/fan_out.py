@@ -0,0 +1,132 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a helper for calling a safe-called function for many arguments concurrently.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from living_doc_utilities.constants import RateLimitResource
+from living_doc_utilities.github.rate_limiter import ThreadSafeGithubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class FanOutResult:
+    """
+    The outcome of one call made by `fan_out`.
+    """
+
+    def __init__(self, index: int, args: tuple, value: Any = None, error: Optional[BaseException] = None):
+        self.index: int = index
+        self.args: tuple = args
+        self.value: Any = value
+        self.error: Optional[BaseException] = error
+
+    @property
+    def ok(self) -> bool:
+        """Getter of the flag telling whether the call finished without raising an error."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"FanOutResult(index={self.index}, args={self.args!r}, value={self.value!r}, error={self.error!r})"
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def fan_out(
+    function: Callable,
+    arguments: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+    rate_limiter: Optional[ThreadSafeGithubRateLimiter] = None,
+    resource: str = RateLimitResource.CORE,
+) -> Iterator[FanOutResult]:
+    """
+    Call the function for every item of the arguments on a thread pool and stream the results.
+
+    The arguments are consumed lazily and at most `max_workers` calls are in flight at once. Given the rate limiter
+    used by the function, the calls in flight are also limited by its remaining budget, so the threads do not pile
+    up waiting for the reset. An error raised by a call is captured in its result and does not stop the others.
+
+    The calls may share a circuit breaker, metrics registry, response cache, single flight and the tracer; all of
+    them are thread-safe. Issues collections are not, so merge the results on the consuming thread.
+
+    @param function: The function to call, usually decorated by `safe_call_decorator`.
+    @param arguments: Argument tuples of the calls; an item which is not a tuple is passed as a single argument.
+    @param max_workers: The maximum number of calls in flight.
+    @param ordered: If True, results are yielded in the order of the arguments, otherwise as soon as they finish.
+    @param rate_limiter: The thread-safe rate limiter used by the function, if any.
+    @param resource: The GitHub API resource consumed by the function.
+    @return: Iterator of the results, one per item of the arguments.
+    @raises ValueError: If max_workers is less than 1.
+    @raises TypeError: If the rate limiter is not thread-safe.
+    """
+    if max_workers < 1:
+        raise ValueError("At least one worker is required.")
+    if rate_limiter is not None and not isinstance(rate_limiter, ThreadSafeGithubRateLimiter):
+        raise TypeError("Concurrent calls require a ThreadSafeGithubRateLimiter.")
+
+    items = enumerate(arguments)
+    pending: dict[Future, tuple[int, tuple]] = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fan-out")
+
+    def submit() -> None:
+        while len(pending) < _capacity(max_workers, rate_limiter, resource):
+            item = next(items, None)
+            if item is None:
+                return
+            index, args = item
+            args = args if isinstance(args, tuple) else (args,)
+            pending[executor.submit(function, *args)] = (index, args)
+
+    try:
+        submit()
+        while pending:
+            if ordered:
+                future = min(pending, key=lambda submitted: pending[submitted][0])
+                wait([future])
+            else:
+                future = wait(pending, return_when=FIRST_COMPLETED).done.pop()
+
+            index, args = pending.pop(future)
+            error = future.exception()
+            if error is not None:
+                logger.debug("Call %d of %s failed: %s.", index, getattr(function, "__name__", function), error)
+                yield FanOutResult(index, args, error=error)
+            else:
+                yield FanOutResult(index, args, value=future.result())
+            submit()
+    finally:
+        # Stops the remaining calls if the consumer ends the iteration early.
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _capacity(max_workers: int, rate_limiter: Optional[ThreadSafeGithubRateLimiter], resource: str) -> int:
+    if rate_limiter is None:
+        return max_workers
+    budget = 0
+    for client_index in range(len(rate_limiter.github_clients)):
+        remaining = rate_limiter.bucket(resource, client_index).remaining
+        if remaining is None:
+            return max_workers
+        budget += max(0, remaining - rate_limiter.THRESHOLD)
+    # keep at least one call in flight, it waits for the reset in the rate limiter
+    return max(1, min(max_workers, budget))
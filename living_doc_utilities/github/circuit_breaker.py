@@ -0,0 +1,176 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the CircuitBreaker class, which stops calling the GitHub API while it keeps failing.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from requests import ConnectionError as RequestsConnectionError, Timeout
+
+from living_doc_utilities.constants import CircuitState
+from living_doc_utilities.github.retry_policy import error_status
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class CircuitBreaker:
+    """
+    A circuit breaker failing calls fast while the GitHub API is unavailable.
+
+    The breaker is closed while calls succeed. It opens once the failure rate of the last `window_size` calls
+    reaches `failure_rate`, given at least `minimum_calls` calls. While open, calls are rejected without a request.
+    After `open_duration` seconds it is half-open and lets `half_open_calls` probe calls through: if they succeed,
+    the breaker closes, otherwise it opens again.
+
+    Only network errors, timeouts and server errors count as failures; other errors, e.g. a missing resource,
+    prove the API is available. Share one breaker among the methods calling the same host, or give every method
+    its own.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        name: str = "GitHub API",
+    ):
+        if not 0 < failure_rate <= 1:
+            raise ValueError("Failure rate must be within (0, 1].")
+        if window_size < 1 or minimum_calls < 1 or half_open_calls < 1:
+            raise ValueError("Window size, minimum calls and half-open calls must be positive.")
+        if open_duration < 0:
+            raise ValueError("Open duration must not be negative.")
+        self.failure_rate: float = failure_rate
+        self.minimum_calls: int = minimum_calls
+        self.open_duration: float = open_duration
+        self.half_open_calls: int = half_open_calls
+        self.name: str = name
+        self.rejected: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        # outcomes of the last calls, True for a failure
+        self.__outcomes: deque[bool] = deque(maxlen=window_size)
+        self.__failures: int = 0
+        self.__state: CircuitState = CircuitState.CLOSED
+        self.__opened_at: float = 0.0
+        self.__probes: int = 0
+        self.__probe_successes: int = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Getter of the breaker state."""
+        with self.__lock:
+            self.__update_state()
+            return self.__state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be made now; in the half-open state, the allowed call is a probe.
+
+        @return: True if the call may be made, False if it should fail fast.
+        """
+        with self.__lock:
+            self.__update_state()
+            if self.__state == CircuitState.CLOSED:
+                return True
+            if self.__state == CircuitState.HALF_OPEN and self.__probes < self.half_open_calls:
+                self.__probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of an allowed call.
+
+        @param error: The error raised by the call, None if it succeeded.
+        @return: None
+        """
+        failed = error is not None and self.is_failure(error)
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN:
+                if failed:
+                    logger.warning("Probe call of %s failed. Circuit opened again.", self.name)
+                    self.__open()
+                else:
+                    self.__probe_successes += 1
+                    if self.__probe_successes >= self.half_open_calls:
+                        self.__close()
+            elif self.__state == CircuitState.CLOSED:
+                if len(self.__outcomes) == self.__outcomes.maxlen:
+                    self.__failures -= self.__outcomes[0]
+                self.__outcomes.append(failed)
+                self.__failures += failed
+                calls = len(self.__outcomes)
+                if failed and calls >= self.minimum_calls and self.__failures >= self.failure_rate * calls:
+                    logger.warning(
+                        "Circuit of %s opened after %d failed of %d calls. Failing calls fast for %.1f seconds.",
+                        self.name,
+                        self.__failures,
+                        calls,
+                        self.open_duration,
+                    )
+                    self.__open()
+            # Calls finishing while the breaker is open were allowed before it opened; they are ignored.
+
+    def release(self) -> None:
+        """
+        Release an allowed call which ended without an outcome, e.g. was cancelled, so a probe is not lost.
+
+        @return: None
+        """
+        with self.__lock:
+            if self.__state == CircuitState.HALF_OPEN and self.__probes > 0:
+                self.__probes -= 1
+
+    @staticmethod
+    def is_failure(error: BaseException) -> bool:
+        """
+        Check whether the error shows the API is unavailable.
+
+        @param error: The error raised by the call.
+        @return: True for network errors, timeouts and server errors, False otherwise.
+        """
+        if isinstance(error, (ConnectionError, RequestsConnectionError, Timeout)):
+            return True
+        status = error_status(error)
+        return status is not None and status >= 500
+
+    def __update_state(self) -> None:
+        if self.__state == CircuitState.OPEN and time.monotonic() - self.__opened_at >= self.open_duration:
+            logger.info("Circuit of %s is half-open, probing with %d calls.", self.name, self.half_open_calls)
+            self.__state = CircuitState.HALF_OPEN
+            self.__probes = 0
+            self.__probe_successes = 0
+
+    def __open(self) -> None:
+        self.__state = CircuitState.OPEN
+        self.__opened_at = time.monotonic()
+
+    def __close(self) -> None:
+        logger.info("Circuit of %s closed.", self.name)
+        self.__state = CircuitState.CLOSED
+        self.__outcomes.clear()
+        self.__failures = 0
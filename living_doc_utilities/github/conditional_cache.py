@@ -0,0 +1,288 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the ConditionalRequestCache class, a disk cache of HTTP responses revalidated by conditional
+requests.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional
+
+import requests
+
+from living_doc_utilities.github.rate_limiter import GithubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+TEMP_PREFIX = ".tmp-"
+# Payload files are named by the SHA-256 of their key.
+PAYLOAD_NAME = re.compile(r"[0-9a-f]{64}")
+ETAG = "etag"
+LAST_MODIFIED = "last_modified"
+SIZE = "size"
+
+
+# pylint: disable=too-many-instance-attributes
+class ConditionalRequestCache:
+    """
+    A disk cache of GET responses, revalidated with `If-None-Match` / `If-Modified-Since` instead of refetched.
+
+    GitHub answers an unchanged resource with 304 Not Modified, which does not count against the primary rate limit
+    and carries no payload. The cache keeps the payloads with their ETag and Last-Modified validators, bounded by
+    the total payload size; the least recently used entries are evicted first.
+
+    The index of the entries is written every `INDEX_FLUSH_CHANGES` changes and when the cache is flushed or closed,
+    at the latest at interpreter exit. Payloads not indexed because of a crash are removed when the cache is opened.
+
+    Entries are keyed by the URL, the Accept header and a hash of the Authorization header, so a response fetched
+    with one token is never served to another. Use it inside a method decorated by `safe_call_decorator`, so the
+    requests are rate limited and their errors handled; given the rate limiter, the token taken for a request
+    answered by 304 Not Modified is given back.
+    """
+
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    DEFAULT_TIMEOUT = 30.0
+    INDEX_FLUSH_CHANGES = 100
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        session: Optional[requests.Session] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        rate_limiter: Optional[GithubRateLimiter] = None,
+    ):
+        if max_bytes < 0:
+            raise ValueError("Cache size must not be negative.")
+        self.cache_dir: Path = Path(cache_dir)
+        self.max_bytes: int = max_bytes
+        self.session: requests.Session = session if session is not None else requests.Session()
+        self.timeout: float = timeout
+        self.rate_limiter: Optional[GithubRateLimiter] = rate_limiter
+        self.revalidated: int = 0
+        self.fetched: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        # changes of the entries not yet written to the index
+        self.__unsaved_changes: int = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # least recently used entries first
+        self.__entries: OrderedDict[str, dict[str, Any]] = self.__load_index()
+        self.__size: int = sum(entry[SIZE] for entry in self.__entries.values())
+        self.__remove_unindexed_payloads()
+        atexit.register(self.flush)
+
+    def __enter__(self) -> "ConditionalRequestCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Getter of the total size of the cached payloads in bytes."""
+        return self.__size
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, url: str, headers: Optional[dict[str, str]] = None) -> bytes:
+        """
+        Get the payload of the URL, revalidating a cached payload instead of fetching it again.
+
+        @param url: The URL to request.
+        @param headers: Additional request headers, e.g. the authorization.
+        @return: The response payload.
+        @raises requests.RequestException: If the request fails or the response is an error.
+        """
+        request_headers = dict(headers or {})
+        key = self.__key(url, request_headers)
+        with self.__lock:
+            entry = self.__entries.get(key)
+        if entry is not None:
+            if entry.get(ETAG):
+                request_headers["If-None-Match"] = entry[ETAG]
+            if entry.get(LAST_MODIFIED):
+                request_headers["If-Modified-Since"] = entry[LAST_MODIFIED]
+
+        response = self.session.get(url, headers=request_headers, timeout=self.timeout)
+        if response.status_code == 304 and self.rate_limiter is not None:
+            self.rate_limiter.refund()
+        if response.status_code == 304 and entry is not None:
+            # Read without the lock; payloads are replaced atomically, and an evicted one is a cache miss.
+            payload = self.__read(key)
+            if payload is not None:
+                with self.__lock:
+                    self.revalidated += 1
+                    if key in self.__entries:
+                        self.__entries.move_to_end(key)
+                logger.debug("Response of %s not modified, served from cache.", url)
+                return payload
+            # The payload was evicted meanwhile; fetch it without validators.
+            return self.get(url, headers)
+
+        response.raise_for_status()
+        payload = response.content
+        with self.__lock:
+            self.fetched += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.__store(key, payload, etag, last_modified)
+        return payload
+
+    def get_json(self, url: str, headers: Optional[dict[str, str]] = None) -> Any:
+        """
+        Get the JSON payload of the URL, revalidating a cached payload instead of fetching it again.
+
+        @param url: The URL to request.
+        @param headers: Additional request headers, e.g. the authorization.
+        @return: The decoded JSON payload.
+        @raises requests.RequestException: If the request fails or the response is an error.
+        @raises ValueError: If the payload is not valid JSON.
+        """
+        return json.loads(self.get(url, headers))
+
+    def clear(self) -> None:
+        """
+        Remove all cached entries.
+
+        @return: None
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
+            self.__save_index()
+
+    def flush(self) -> None:
+        """
+        Write the index of the entries, if it has changed since it was last written.
+
+        @return: None
+        """
+        with self.__lock:
+            if self.__unsaved_changes > 0:
+                self.__save_index()
+
+    def close(self) -> None:
+        """
+        Flush the index. The cache may still be used afterward, but its index is then written only in batches.
+
+        @return: None
+        """
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __store(self, key: str, payload: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        if len(payload) > self.max_bytes:
+            return
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            # Written to a temporary file first, so a concurrent read never sees a partial payload.
+            payload_path = self.__payload_path(key)
+            temp_path = payload_path.with_name(f"{TEMP_PREFIX}{payload_path.name}")
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, payload_path)
+            self.__entries[key] = {ETAG: etag, LAST_MODIFIED: last_modified, SIZE: len(payload)}
+            self.__size += len(payload)
+
+            while self.__size > self.max_bytes:
+                evicted = next(iter(self.__entries))
+                logger.debug("Evicting %s from the response cache.", evicted)
+                self.__remove(evicted)
+            self.__index_changed()
+
+    def __read(self, key: str) -> Optional[bytes]:
+        try:
+            with open(self.__payload_path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            with self.__lock:
+                if key in self.__entries:
+                    self.__remove(key)
+                    self.__index_changed()
+            return None
+
+    def __remove(self, key: str) -> None:
+        entry = self.__entries.pop(key)
+        self.__size -= entry[SIZE]
+        try:
+            os.remove(self.__payload_path(key))
+        except FileNotFoundError:
+            pass
+
+    def __index_changed(self) -> None:
+        # Called under the lock. Writing the whole index on every change would be quadratic in the entries.
+        self.__unsaved_changes += 1
+        if self.__unsaved_changes >= self.INDEX_FLUSH_CHANGES:
+            self.__save_index()
+
+    def __remove_unindexed_payloads(self) -> None:
+        indexed = {self.__payload_path(key).name for key in self.__entries}
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith(TEMP_PREFIX) or (PAYLOAD_NAME.fullmatch(path.name) and path.name not in indexed):
+                logger.debug("Removing unindexed payload %s from the response cache.", path.name)
+                path.unlink(missing_ok=True)
+
+    def __payload_path(self, key: str) -> Path:
+        return self.cache_dir / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def __load_index(self) -> OrderedDict[str, dict[str, Any]]:
+        index_path = self.cache_dir / INDEX_FILE
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                return OrderedDict(json.load(f))
+        except FileNotFoundError:
+            return OrderedDict()
+        except (json.JSONDecodeError, TypeError, ValueError):
+            logger.warning("Invalid response cache index at %s. Starting with an empty cache.", index_path)
+            return OrderedDict()
+
+    def __save_index(self) -> None:
+        # Written to a temporary file first, so an interrupted write does not corrupt the index.
+        index_path = self.cache_dir / INDEX_FILE
+        temp_path = index_path.with_name(f"{TEMP_PREFIX}{INDEX_FILE}")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self.__entries.items()), f)
+        os.replace(temp_path, index_path)
+        self.__unsaved_changes = 0
+
+    @staticmethod
+    def __key(url: str, headers: dict[str, str]) -> str:
+        accept = next((value for name, value in headers.items() if name.lower() == "accept"), "")
+        authorization = next((value for name, value in headers.items() if name.lower() == "authorization"), "")
+        # the token itself is not written to the index
+        token_hash = hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16] if authorization else ""
+        return f"{accept} {token_hash} {url}"
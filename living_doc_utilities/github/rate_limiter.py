@@ -19,74 +19,685 @@ This module contains a GitHub Rate Limiter class methods,
 which acts as a rate limiter for GitHub API calls.
 """
 
+import asyncio
+import copy
+import inspect
 import logging
+import threading
 import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Callable, Optional, Any
-from github import Github
+from typing import Callable, Iterator, Optional, Any, Sequence, cast
+from github import Auth, Github
+
+from living_doc_utilities.constants import RateLimitResource
+from living_doc_utilities.metrics import measure_rate_limit_wait
+from living_doc_utilities.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 
-# It is fine to have a single method in this class, since we use it as a callable class
+class PacingStrategy:
+    """
+    A pacing strategy spreading the remaining calls evenly over the time left until the rate limit reset.
+
+    Calls are spaced by the time left divided by the calls remaining above the reserve, so the budget runs out
+    around the reset instead of the limiter stalling at the cliff. After an idle period, up to `burst` calls may
+    run back to back.
+    """
+
+    DEFAULT_RESERVE = 5
+    DEFAULT_BURST = 10
+
+    def __init__(self, reserve: int = DEFAULT_RESERVE, burst: int = DEFAULT_BURST):
+        if reserve < 0 or burst < 0:
+            raise ValueError("Reserve and burst must not be negative.")
+        self.reserve: int = reserve
+        self.burst: int = burst
+        # earliest time the next call would run if calls were spaced exactly by the interval
+        self.__next_time: Optional[float] = None
+        self.__reset_time: Optional[float] = None
+
+    def delay(self, remaining: int, reset_time: float, now: float) -> float:
+        """
+        Compute how long the next call must wait and book its time slot.
+
+        @param remaining: The number of calls remaining in the current window, including the next one.
+        @param reset_time: The reset time of the current window as a Unix timestamp.
+        @param now: The current time as a Unix timestamp.
+        @return: The number of seconds to wait before the call.
+        """
+        seconds_left = max(reset_time - now, 0.0)
+        budget = remaining - self.reserve
+        if budget <= 0:
+            return seconds_left
+
+        if self.__next_time is None or reset_time != self.__reset_time:
+            # a new window starts with a full burst
+            self.__next_time = now
+            self.__reset_time = reset_time
+
+        interval = seconds_left / budget
+        # the call itself is the first one of a burst
+        call_time = max(now, self.__next_time - max(self.burst - 1, 0) * interval)
+        self.__next_time = max(self.__next_time, call_time) + interval
+        return call_time - now
+
+
+class RateLimitBucket:
+    """
+    The locally tracked state of the rate limit of one GitHub API resource.
+    """
+
+    def __init__(self, pacing: Optional[PacingStrategy] = None):
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_time: Optional[float] = None
+        self.refreshed_at: float = 0.0
+        self.pacing: Optional[PacingStrategy] = pacing
+
+    def set_state(self, remaining: int, reset_time: float, limit: Optional[int] = None) -> None:
+        """
+        Replace the tracked state.
+
+        @param remaining: The number of remaining calls.
+        @param reset_time: The reset time as a Unix timestamp.
+        @param limit: The number of calls allowed per window, if known.
+        @return: None
+        """
+        self.remaining = remaining
+        self.reset_time = reset_time
+        if isinstance(limit, int):
+            self.limit = limit
+        self.refreshed_at = time.time()
+
+
 class GithubRateLimiter:
     """
     A class that acts as a rate limiter for GitHub API calls.
 
+    The core, search and GraphQL resources have separate quotas, each tracked in its own bucket, so a depleted
+    quota only holds back the calls consuming it. The remaining calls and the reset time of a bucket are tracked
+    locally. The rate limit headers of the last GitHub response, cached by the client, are merged into the bucket
+    of the resource consumed by the last call, and the rate limit API is queried only when the local view is
+    unknown, stale or close to exhaustion.
+
+    Given several clients, authenticated by different tokens, every call is routed to the client with the most
+    remaining budget, and the limiter waits only when all of them are exhausted. A wrapped bound method of one of
+    the clients is called on the selected client instead; other callables reach it via `github_client`. A bound
+    method of an object fetched through one of the clients, e.g. `repo.get_issues`, always runs on that client,
+    so it is charged to that client's budget.
+
+    By default, calls run at full speed until the threshold and then wait for the reset. With a pacing strategy,
+    the calls are spread over the whole window instead.
+
     Note:
         This class is used as a callable class, hence the `__call__` method.
     """
 
-    def __init__(self, github_client: Github):
-        self.__github_client: Github = github_client
+    # Number of remaining calls below which the limiter waits for the reset.
+    THRESHOLD = 5
+    # Seconds after which the locally tracked state is refreshed from the rate limit API.
+    REFRESH_INTERVAL = 60.0
+    # Seconds waited after the reset time, so the reset has surely happened on the server.
+    RESET_BUFFER = 5
+
+    def __init__(
+        self,
+        github_client: Github | Sequence[Github],
+        refresh_interval: float = REFRESH_INTERVAL,
+        pacing: Optional[PacingStrategy] = None,
+    ):
+        if isinstance(github_client, (list, tuple)):
+            clients: list[Github] = list(github_client)
+        else:
+            clients = [cast(Github, github_client)]
+        if not clients:
+            raise ValueError("At least one GitHub client is required.")
+        self.__github_clients: list[Github] = clients
+        self.__current_client: ContextVar[Github] = ContextVar("github_client", default=clients[0])
+        # client position and resource of the running call
+        self.__current_call: ContextVar[Optional[tuple[int, str]]] = ContextVar("github_call", default=None)
+        self.refresh_interval: float = refresh_interval
+        self.pacing: Optional[PacingStrategy] = pacing
+        self._buckets: dict[tuple[int, str], RateLimitBucket] = {}
+        # resource consumed by the last finished call of each client, the one its cached response headers belong to
+        self._last_resources: dict[int, str] = {}
+
+    @classmethod
+    def from_tokens(cls, tokens: Sequence[str], **kwargs) -> "GithubRateLimiter":
+        """
+        Create a rate limiter routing calls between clients authenticated by the given tokens.
+
+        The clients do not retry failed requests themselves, the retries are left to the retry policy of
+        `safe_call_decorator`.
+
+        @param tokens: The GitHub authorization tokens.
+        @param kwargs: Other arguments of the rate limiter.
+        @return: The rate limiter.
+        """
+        return cls([Github(auth=Auth.Token(token), retry=None) for token in tokens], **kwargs)
 
     @property
     def github_client(self) -> Github:
-        """Getter of the GitHub client."""
-        return self.__github_client
+        """Getter of the GitHub client selected for the running call, or the first client outside of calls."""
+        return self.__current_client.get()
 
-    def __call__(self, method: Callable) -> Callable:
+    @property
+    def github_clients(self) -> tuple[Github, ...]:
+        """Getter of all GitHub clients of the pool."""
+        return tuple(self.__github_clients)
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Getter of the locally tracked number of remaining core calls, None if unknown."""
+        return self.bucket(RateLimitResource.CORE).remaining
+
+    @property
+    def reset_time(self) -> Optional[float]:
+        """Getter of the locally tracked reset time of the core resource as a Unix timestamp, None if unknown."""
+        return self.bucket(RateLimitResource.CORE).reset_time
+
+    def bucket(self, resource: str = RateLimitResource.CORE, client_index: Optional[int] = None) -> RateLimitBucket:
+        """
+        Get the tracked rate limit state of a resource.
+
+        @param resource: The GitHub API resource: 'core', 'search' or 'graphql'.
+        @param client_index: Position of the client in the pool; the client selected for the running call if not set.
+        @return: The bucket of the resource.
+        @raises ValueError: If the resource is not supported.
+        """
+        if client_index is None:
+            client_index = self.__client_index(self.github_client)
+        return self._bucket(client_index, RateLimitResource(resource))
+
+    def _bucket(self, client_index: int, resource: str) -> RateLimitBucket:
+        bucket = self._buckets.get((client_index, resource))
+        if bucket is None:
+            # every bucket paces its own window
+            bucket = self._buckets.setdefault((client_index, resource), RateLimitBucket(copy.deepcopy(self.pacing)))
+        return bucket
+
+    def __call__(self, method: Callable, resource: str = RateLimitResource.CORE) -> Callable:
         """
         Wraps the provided method to ensure it respects the GitHub API rate limit.
 
         @param method: The method to wrap.
+        @param resource: The GitHub API resource consumed by the method: 'core', 'search' or 'graphql'.
         @return: The wrapped method.
+        @raises ValueError: If the resource is not supported.
         """
+        resource = RateLimitResource(resource)
+        owner_index = self._owner_index(method)
 
         def wrapped_method(*args, **kwargs) -> Optional[Any]:
-            rate = self.github_client.get_rate_limit().rate
-            remaining_calls = rate.remaining
-            reset_time = rate.reset.timestamp()
-
-            if remaining_calls < 5:
-                logger.info("Rate limit almost reached. Sleeping until reset time.")
-                sleep_time = reset_time - (now := time.time())
-                max_iterations = 48  # Limit to 48 iterations (48 hours) to prevent infinite loops
-                iteration = 0
-                while sleep_time <= 0:
-                    # If sleep_time is negative, it means the reset_time is in the past.
-                    # To ensure a positive sleep duration, increment reset_time by 1 hour until sleep_time is positive.
-                    reset_time += 3600  # Add 1 hour in seconds
-                    sleep_time = reset_time - now
-                    iteration += 1
-                    if iteration >= max_iterations:
-                        logger.warning("Reset time adjustment exceeded maximum iterations. Using default delay.")
-                        sleep_time = 60  # Use a default 60-second delay
-                        break
-
-                total_sleep_time = sleep_time + 5  # Total sleep time including the additional 5 seconds
-                hours, remainder = divmod(total_sleep_time, 3600)
-                minutes, seconds = divmod(remainder, 60)
-
-                logger.info(
-                    "Sleeping for %s hours, %s minutes, and %s seconds until %s.",
-                    int(hours),
-                    int(minutes),
-                    int(seconds),
-                    datetime.fromtimestamp(reset_time).strftime("%Y-%m-%d %H:%M:%S"),
-                )
-                time.sleep(sleep_time + 5)  # Sleep for the calculated time plus 5 seconds
-
-            return method(*args, **kwargs)
+            with measure_rate_limit_wait(), tracer.span("rate_limit.acquire", "rate_limit", resource=resource) as span:
+                client_index = self._acquire(resource, owner_index)
+                span.set_attribute("client", client_index)
+            with self._using_client(client_index, resource) as client:
+                with tracer.span(getattr(method, "__name__", "call"), "github"):
+                    return self._route(method, client)(*args, **kwargs)
 
         return wrapped_method
+
+    @contextmanager
+    def _using_client(self, client_index: int, resource: str) -> Iterator[Github]:
+        """
+        Expose the client selected for a call as `github_client` while the call runs.
+
+        @param client_index: Position of the selected client in the pool.
+        @param resource: The GitHub API resource consumed by the call.
+        @return: Context manager yielding the selected client.
+        """
+        client = self.__github_clients[client_index]
+        token = self.__current_client.set(client)
+        call_token = self.__current_call.set((client_index, resource))
+        try:
+            yield client
+        finally:
+            self.__current_call.reset(call_token)
+            self.__current_client.reset(token)
+            self._last_resources[client_index] = resource
+
+    def refund(self) -> None:
+        """
+        Give the token taken by the running call back to its bucket, because its response did not count against
+        the rate limit, e.g. a 304 Not Modified answer to a conditional request. Outside of wrapped calls, nothing
+        is given back.
+
+        @return: None
+        """
+        call = self.__current_call.get()
+        if call is not None:
+            self._refund(*call)
+
+    def _refund(self, client_index: int, resource: str) -> None:
+        """
+        Give one token back to the bucket of the resource, unless its state is unknown or the bucket is full.
+
+        @param client_index: Position of the client in the pool.
+        @param resource: The GitHub API resource.
+        @return: None
+        """
+        bucket = self._bucket(client_index, resource)
+        if bucket.remaining is not None and (bucket.limit is None or bucket.remaining < bucket.limit):
+            bucket.remaining += 1
+
+    def for_resource(self, resource: str) -> Callable[[Callable], Callable]:
+        """
+        Get a decorator wrapping methods which consume the given resource.
+
+        @param resource: The GitHub API resource: 'core', 'search' or 'graphql'.
+        @return: The decorator.
+        """
+        return lambda method: self(method, resource)
+
+    def _acquire(self, resource: str = RateLimitResource.CORE, owner_index: Optional[int] = None) -> int:
+        """
+        Reserve one call from the budget of the resource, waiting for the reset when all clients are almost
+        exhausted.
+
+        @param resource: The GitHub API resource consumed by the call.
+        @param owner_index: Position of the client the call is bound to, if any.
+        @return: Position of the client selected for the call.
+        """
+        client_index = self._select_client(resource, owner_index)
+        bucket = self._bucket(client_index, resource)
+
+        if bucket.remaining is not None and bucket.remaining < self.THRESHOLD:
+            self._sleep_until_reset(bucket)
+            # The budget is restored after the reset; its actual state is read by the next call.
+            bucket.remaining = None
+            return client_index
+
+        if bucket.remaining is not None:
+            delay = self._pacing_delay(bucket)
+            bucket.remaining -= 1
+            if delay > 0:
+                time.sleep(delay)
+        return client_index
+
+    def _select_client(self, resource: str, owner_index: Optional[int] = None) -> int:
+        """
+        Select the client with the most remaining budget of the resource, refreshing the unknown or stale states.
+
+        If all clients are almost exhausted, the one reset first is selected.
+
+        @param resource: The GitHub API resource consumed by the call.
+        @param owner_index: Position of the client the call is bound to, if any; then it is always selected.
+        @return: Position of the selected client.
+        """
+        client_indexes = range(len(self.__github_clients)) if owner_index is None else [owner_index]
+        refreshed = set()
+        for client_index in client_indexes:
+            bucket = self._bucket(client_index, resource)
+            self._update_from_headers(client_index, resource, bucket)
+            if self._is_stale(bucket):
+                self._refresh(client_index, resource, bucket)
+                refreshed.add(client_index)
+
+        client_index = self.__best_client(resource) if owner_index is None else owner_index
+        bucket = self._bucket(client_index, resource)
+        if client_index not in refreshed and self._needs_refresh(bucket):
+            # confirm the exhaustion, the budget may have been reset meanwhile
+            self._refresh(client_index, resource, bucket)
+            if owner_index is None:
+                client_index = self.__best_client(resource)
+        return client_index
+
+    def __best_client(self, resource: str) -> int:
+        buckets = [self._bucket(client_index, resource) for client_index in range(len(self.__github_clients))]
+        best = max(range(len(buckets)), key=lambda client_index: buckets[client_index].remaining or 0)
+        if (buckets[best].remaining or 0) >= self.THRESHOLD or len(buckets) == 1:
+            return best
+        return min(range(len(buckets)), key=lambda client_index: buckets[client_index].reset_time or 0.0)
+
+    def _pacing_delay(self, bucket: RateLimitBucket) -> float:
+        """
+        Compute the delay of the next call given by the pacing strategy of the bucket, if any.
+
+        @param bucket: The bucket of the consumed resource.
+        @return: The number of seconds to wait before the call.
+        """
+        if bucket.pacing is None or bucket.remaining is None or bucket.reset_time is None:
+            return 0.0
+        delay = bucket.pacing.delay(bucket.remaining, bucket.reset_time, time.time())
+        if delay > 0:
+            logger.debug("Pacing GitHub API calls, waiting %.2f seconds.", delay)
+        return delay
+
+    def _is_stale(self, bucket: RateLimitBucket) -> bool:
+        """
+        Check whether the local view of the rate limit is unknown or outdated.
+
+        @param bucket: The bucket of the consumed resource.
+        @return: True if the state is unknown, older than the refresh interval or past its reset, False otherwise.
+        """
+        if bucket.remaining is None or bucket.reset_time is None:
+            return True
+        now = time.time()
+        return now - bucket.refreshed_at >= self.refresh_interval or now >= bucket.reset_time
+
+    def _needs_refresh(self, bucket: RateLimitBucket) -> bool:
+        """
+        Check whether the local view of the rate limit must be refreshed from the rate limit API.
+
+        @param bucket: The bucket of the consumed resource.
+        @return: True if the state is unknown, stale or close to exhaustion, False otherwise.
+        """
+        return self._is_stale(bucket) or (bucket.remaining is not None and bucket.remaining < self.THRESHOLD)
+
+    def _refresh(self, client_index: int, resource: str, bucket: RateLimitBucket) -> None:
+        """
+        Read the current rate limit state of the resource from the rate limit API.
+
+        @param client_index: Position of the client in the pool.
+        @param resource: The GitHub API resource.
+        @param bucket: The bucket of the resource.
+        @return: None
+        """
+        overview = self.__github_clients[client_index].get_rate_limit()
+        # `rate` is the core resource
+        rate = overview.rate if resource == RateLimitResource.CORE else getattr(overview.resources, resource)
+        bucket.set_state(rate.remaining, rate.reset.timestamp(), getattr(rate, "limit", None))
+
+    def _update_from_headers(self, client_index: int, resource: str, bucket: RateLimitBucket) -> None:
+        """
+        Merge the rate limit state cached by the client from the last response headers into the local view.
+
+        The headers do not tell the resource they belong to; they are merged only into the bucket of the resource
+        consumed by the last call of the client, and only if the limits of both match. Before the first call of the
+        client they are not merged at all, so every bucket is first filled by the rate limit API. Within the same
+        window the lower of both budgets is kept, since the local view counts calls whose responses have not
+        arrived yet.
+
+        @param client_index: Position of the client in the pool.
+        @param resource: The GitHub API resource.
+        @param bucket: The bucket of the resource.
+        @return: None
+        """
+        if self._last_resources.get(client_index) != resource:
+            return
+        client = self.__github_clients[client_index]
+        try:
+            rate_limiting = client.rate_limiting
+            reset_time = client.rate_limiting_resettime
+        except AttributeError:
+            return
+        if not isinstance(rate_limiting, tuple) or not isinstance(reset_time, (int, float)):
+            return
+
+        remaining, limit = rate_limiting
+        if not isinstance(remaining, int) or limit < 0 or reset_time <= 0:
+            return
+        if bucket.limit is not None and bucket.limit != limit:
+            return
+
+        if bucket.remaining is None or bucket.reset_time is None or reset_time > bucket.reset_time:
+            bucket.set_state(remaining, float(reset_time), limit)
+        else:
+            bucket.remaining = min(bucket.remaining, remaining)
+
+    def __client_index(self, client: Github) -> int:
+        for client_index, pooled_client in enumerate(self.__github_clients):
+            if pooled_client is client:
+                return client_index
+        return 0
+
+    def _owner_index(self, method: Callable) -> Optional[int]:
+        """
+        Find the client a method is bound to through the object it belongs to, e.g. a repository fetched by it.
+
+        @param method: The wrapped method.
+        @return: Position of the owning client, None for methods of the clients themselves and other callables.
+        """
+        owner = getattr(method, "__self__", None)
+        requester = getattr(owner, "requester", None)
+        if requester is None or any(owner is pooled for pooled in self.__github_clients):
+            return None
+
+        # objects may hold a copy of the requester of their client, sharing its authentication
+        auth = getattr(requester, "auth", None)
+        for client_index, client in enumerate(self.__github_clients):
+            client_requester = getattr(client, "requester", None)
+            if client_requester is requester or (auth is not None and getattr(client_requester, "auth", None) is auth):
+                return client_index
+
+        if len(self.__github_clients) > 1:
+            logger.warning(
+                "Method %s is bound to a GitHub client outside of the pool, its rate limit is not tracked.",
+                getattr(method, "__qualname__", method),
+            )
+        return None
+
+    def _route(self, method: Callable, client: Github) -> Callable:
+        """
+        Get the method to call on the selected client; a bound method of another pooled client is rebound to it.
+
+        @param method: The wrapped method.
+        @param client: The selected client.
+        @return: The method to call.
+        """
+        owner = getattr(method, "__self__", None)
+        if owner is None or owner is client or not any(owner is pooled for pooled in self.__github_clients):
+            return method
+        return getattr(client, method.__name__)
+
+    def _sleep_until_reset(self, bucket: RateLimitBucket) -> None:
+        """
+        Sleep until the reset time of the bucket, plus a 5 seconds buffer.
+
+        @param bucket: The bucket of the consumed resource.
+        @return: None
+        """
+        time.sleep(self._seconds_until_reset(bucket))
+
+    def _seconds_until_reset(self, bucket: RateLimitBucket) -> float:
+        """
+        Compute the time to wait for the reset of the bucket, plus a 5 seconds buffer, and log it.
+
+        @param bucket: The bucket of the consumed resource.
+        @return: The number of seconds to wait.
+        """
+        reset_time = bucket.reset_time if bucket.reset_time is not None else time.time()
+        sleep_time = reset_time - (now := time.time())
+        max_iterations = 48  # Limit to 48 iterations (48 hours) to prevent infinite loops
+        iteration = 0
+        while sleep_time <= 0:
+            # If sleep_time is negative, it means the reset_time is in the past.
+            # To ensure a positive sleep duration, increment reset_time by 1 hour until sleep_time is positive.
+            reset_time += 3600  # Add 1 hour in seconds
+            sleep_time = reset_time - now
+            iteration += 1
+            if iteration >= max_iterations:
+                logger.warning("Reset time adjustment exceeded maximum iterations. Using default delay.")
+                sleep_time = 60  # Use a default 60-second delay
+                break
+
+        logger.info("Rate limit almost reached. Sleeping until reset time.")
+        total_sleep_time = sleep_time + self.RESET_BUFFER  # Total sleep time including the additional buffer
+        hours, remainder = divmod(total_sleep_time, 3600)
+        minutes, seconds = divmod(remainder, 60)
+
+        logger.info(
+            "Sleeping for %s hours, %s minutes, and %s seconds until %s.",
+            int(hours),
+            int(minutes),
+            int(seconds),
+            datetime.fromtimestamp(reset_time).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        return total_sleep_time
+
+
+class ThreadSafeGithubRateLimiter(GithubRateLimiter):
+    """
+    A rate limiter for GitHub API calls shared by several worker threads.
+
+    The remaining calls of each resource form a token bucket shared by all threads. A token is taken atomically
+    under a lock, so parallel calls cannot overshoot the quota together. When a bucket is exhausted, the threads
+    consuming it wait on a condition until its reset time and then continue with the refreshed budget.
+    """
+
+    def __init__(
+        self,
+        github_client: Github | Sequence[Github],
+        refresh_interval: float = GithubRateLimiter.REFRESH_INTERVAL,
+        pacing: Optional[PacingStrategy] = None,
+    ):
+        super().__init__(github_client, refresh_interval, pacing)
+        self._condition: threading.Condition = threading.Condition()
+
+    def _bucket(self, client_index: int, resource: str) -> RateLimitBucket:
+        with self._condition:
+            return super()._bucket(client_index, resource)
+
+    def _refresh(self, client_index: int, resource: str, bucket: RateLimitBucket) -> None:
+        with self._condition:
+            super()._refresh(client_index, resource, bucket)
+            if bucket.remaining is not None and bucket.remaining >= self.THRESHOLD:
+                # wake up the threads waiting for a budget
+                self._condition.notify_all()
+
+    def _refund(self, client_index: int, resource: str) -> None:
+        with self._condition:
+            super()._refund(client_index, resource)
+            bucket = self._bucket(client_index, resource)
+            if bucket.remaining is not None and bucket.remaining >= self.THRESHOLD:
+                self._condition.notify_all()
+
+    def _acquire(self, resource: str = RateLimitResource.CORE, owner_index: Optional[int] = None) -> int:
+        with self._condition:
+            while True:
+                client_index = self._select_client(resource, owner_index)
+                bucket = self._bucket(client_index, resource)
+
+                if bucket.remaining is None or bucket.remaining >= self.THRESHOLD:
+                    delay = 0.0
+                    if bucket.remaining is not None:
+                        delay = self._pacing_delay(bucket)
+                        bucket.remaining -= 1
+                    break
+
+                # Releases the lock while waiting; a thread woken early re-checks the shared state.
+                self._condition.wait(self._seconds_until_reset(bucket))
+
+        # The time slot is already booked, so other threads may proceed while this one waits for it.
+        if delay > 0:
+            time.sleep(delay)
+        return client_index
+
+
+class AsyncGithubRateLimiter(GithubRateLimiter):
+    """
+    A rate limiter for GitHub API calls made from asyncio tasks, sharing the budget logic of GithubRateLimiter.
+
+    At most `max_concurrency` wrapped calls are in flight at once. Tokens are taken under an asyncio lock, waiting
+    for a reset or a paced time slot uses `asyncio.sleep`, and rate limit API refreshes run in a worker thread, so
+    the event loop is never blocked. Coroutine functions are awaited; other callables, e.g. the blocking methods
+    of a GitHub client, run in a worker thread.
+
+    The limiter may be reused by several event loops, e.g. successive `asyncio.run` calls; the concurrency cap and
+    the lock are created for every loop on its first call.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        github_client: Github | Sequence[Github],
+        refresh_interval: float = GithubRateLimiter.REFRESH_INTERVAL,
+        pacing: Optional[PacingStrategy] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("Maximum concurrency must be at least 1.")
+        super().__init__(github_client, refresh_interval, pacing)
+        self.max_concurrency: int = max_concurrency
+        # asyncio primitives are bound to the loop they are first used in
+        self.__loop_primitives: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+        # event loop of the running call, if its blocking method runs in a worker thread
+        self.__call_loop: ContextVar[Optional[asyncio.AbstractEventLoop]] = ContextVar("call_loop", default=None)
+
+    def __call__(self, method: Callable, resource: str = RateLimitResource.CORE) -> Callable:
+        """
+        Wraps the provided method into a coroutine function respecting the GitHub API rate limit.
+
+        @param method: The method to wrap, a coroutine function or a blocking callable.
+        @param resource: The GitHub API resource consumed by the method: 'core', 'search' or 'graphql'.
+        @return: The wrapped coroutine function.
+        @raises ValueError: If the resource is not supported.
+        """
+        resource = RateLimitResource(resource)
+        owner_index = self._owner_index(method)
+
+        async def wrapped_method(*args, **kwargs) -> Optional[Any]:
+            semaphore, _ = self.__primitives()
+            async with semaphore:
+                with (
+                    measure_rate_limit_wait(),
+                    tracer.span("rate_limit.acquire", "rate_limit", resource=resource) as span,
+                ):
+                    client_index = await self._acquire_async(resource, owner_index)
+                    span.set_attribute("client", client_index)
+                with (
+                    self._using_client(client_index, resource) as client,
+                    tracer.span(getattr(method, "__name__", "call"), "github"),
+                ):
+                    routed_method = self._route(method, client)
+                    if inspect.iscoroutinefunction(routed_method):
+                        return await routed_method(*args, **kwargs)
+                    loop_token = self.__call_loop.set(asyncio.get_running_loop())
+                    try:
+                        return await asyncio.to_thread(routed_method, *args, **kwargs)
+                    finally:
+                        self.__call_loop.reset(loop_token)
+
+        return wrapped_method
+
+    async def _acquire_async(self, resource: str = RateLimitResource.CORE, owner_index: Optional[int] = None) -> int:
+        """
+        Reserve one call from the budget of the resource without blocking the event loop.
+
+        @param resource: The GitHub API resource consumed by the call.
+        @param owner_index: Position of the client the call is bound to, if any.
+        @return: Position of the client selected for the call.
+        """
+        _, lock = self.__primitives()
+        async with lock:
+            # the selection may query the rate limit API
+            client_index = await asyncio.to_thread(self._select_client, resource, owner_index)
+            bucket = self._bucket(client_index, resource)
+
+            if bucket.remaining is not None and bucket.remaining < self.THRESHOLD:
+                # Other tasks queue on the lock meanwhile, the budget is exhausted for them too.
+                await asyncio.sleep(self._seconds_until_reset(bucket))
+                bucket.remaining = None
+                return client_index
+
+            delay = 0.0
+            if bucket.remaining is not None:
+                delay = self._pacing_delay(bucket)
+                bucket.remaining -= 1
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return client_index
+
+    def _refund(self, client_index: int, resource: str) -> None:
+        loop = self.__call_loop.get()
+        if loop is None or loop.is_closed():
+            super()._refund(client_index, resource)
+        else:
+            # Called from a worker thread; the buckets are changed on the event loop only.
+            loop.call_soon_threadsafe(super()._refund, client_index, resource)
+
+    def __primitives(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        primitives = self.__loop_primitives.get(loop)
+        if primitives is None:
+            primitives = self.__loop_primitives[loop] = (asyncio.Semaphore(self.max_concurrency), asyncio.Lock())
+        return primitives
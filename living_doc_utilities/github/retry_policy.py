@@ -0,0 +1,165 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the RetryPolicy class, which decides whether and when a failed GitHub API call is retried.
+"""
+
+import random
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from github import Github, GithubException
+from requests import ConnectionError as RequestsConnectionError, HTTPError, Timeout
+
+# Server errors which are usually transient.
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+# Statuses of the secondary rate limit responses.
+RATE_LIMIT_STATUSES = frozenset({403, 429})
+RETRY_AFTER = "retry-after"
+SECONDARY_RATE_LIMIT = "secondary rate limit"
+
+
+class RetryPolicy:
+    """
+    A policy of retrying failed GitHub API calls with exponential backoff and jitter.
+
+    Network errors, transient server errors and secondary rate limit responses are retried. The delay before
+    a retry is the `Retry-After` header of the response if present, otherwise the exponential backoff
+    `base * 2 ** (attempt - 1)` limited by the cap. With jitter, a random delay up to the backoff is used instead,
+    so clients failing together do not retry together.
+
+    PyGithub clients retry server errors and secondary rate limits themselves by default (`GithubRetry`), which
+    would multiply the attempts of the policy. The clients of a rate limiter used with a retry policy must be
+    created with `retry=None`, as `GithubRateLimiter.from_tokens` does.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        jitter: bool = True,
+        retryable_statuses: frozenset[int] = RETRYABLE_STATUSES,
+        max_retry_after: float = 600.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError("At least one attempt is required.")
+        if backoff_base < 0 or backoff_cap < 0 or max_retry_after < 0:
+            raise ValueError("Delays must not be negative.")
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_cap: float = backoff_cap
+        self.jitter: bool = jitter
+        self.retryable_statuses: frozenset[int] = retryable_statuses
+        self.max_retry_after: float = max_retry_after
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Check whether the call failed with a transient error, which may succeed when retried.
+
+        @param error: The error raised by the call.
+        @return: True if the call should be retried, False otherwise.
+        """
+        if isinstance(error, (ConnectionError, RequestsConnectionError, Timeout)):
+            return True
+        status = error_status(error)
+        if status in self.retryable_statuses:
+            return True
+        if status in RATE_LIMIT_STATUSES:
+            retry_after = self.retry_after(error)
+            if retry_after is not None:
+                return retry_after <= self.max_retry_after
+            return SECONDARY_RATE_LIMIT in _error_message(error).lower()
+        return False
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        @param attempt: The number of the failed attempt, starting with 1.
+        @param error: The error raised by the failed attempt, if any.
+        @return: The number of seconds to wait.
+        """
+        if error is not None:
+            retry_after = self.retry_after(error)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """
+        Read the `Retry-After` header of the failed response, in seconds or as an HTTP date.
+
+        @param error: The error raised by the call.
+        @return: The number of seconds to wait, None if the header is missing or invalid.
+        """
+        headers = getattr(error, "headers", None)
+        if isinstance(error, HTTPError) and error.response is not None:
+            headers = error.response.headers
+        if not isinstance(headers, Mapping):
+            return None
+        value = next((value for name, value in headers.items() if name.lower() == RETRY_AFTER), None)
+        if value is None:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """
+    Get the HTTP status of the failed response, raised by PyGithub or by `requests`, e.g. by a ConditionalRequestCache.
+
+    @param error: The error raised by the call.
+    @return: The HTTP status, None if the error is not an error response.
+    """
+    if isinstance(error, GithubException):
+        return error.status
+    if isinstance(error, HTTPError) and error.response is not None:
+        return error.response.status_code
+    return None
+
+
+def _error_message(error: BaseException) -> str:
+    if isinstance(error, GithubException):
+        return str(error.data)
+    if isinstance(error, HTTPError) and error.response is not None:
+        return error.response.text
+    return str(error)
+
+
+def has_builtin_retry(github_client: Github) -> bool:
+    """
+    Check whether the PyGithub client retries failed requests itself.
+
+    @param github_client: The GitHub client.
+    @return: True if the client was created with a retry strategy, the PyGithub default, False otherwise.
+    """
+    kwargs = getattr(getattr(github_client, "requester", None), "kwargs", None)
+    return isinstance(kwargs, dict) and kwargs.get("retry") not in (None, 0)
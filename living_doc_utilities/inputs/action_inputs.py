@@ -20,6 +20,7 @@ which are essential for running the GH action.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 
 from living_doc_utilities.constants import GITHUB_TOKEN
@@ -38,9 +39,19 @@ class BaseActionInputs(ABC):
     def get_github_token() -> str:
         """
         Getter of the GitHub authorization token.
-        @return: The GitHub authorization token.
+        @return: The GitHub authorization token, the first one if several tokens are defined.
         """
-        return get_action_input(GITHUB_TOKEN)
+        tokens = BaseActionInputs.get_github_tokens()
+        return tokens[0] if tokens else ""
+
+    @staticmethod
+    def get_github_tokens() -> list[str]:
+        """
+        Getter of the GitHub authorization tokens, separated by commas or new lines in the input.
+        @return: The GitHub authorization tokens.
+        """
+        tokens = re.split(r"[,\n]", get_action_input(GITHUB_TOKEN))
+        return [token.strip() for token in tokens if token.strip()]
 
     def validate_user_configuration(self) -> bool:
         """
@@ -0,0 +1,288 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the MetricsRegistry class, which records call counts, errors and latencies of methods.
+"""
+
+import inspect
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram buckets grow by 2 ** (1 / 4), so a percentile is off by at most 19 %.
+BUCKET_BASE = 0.001
+BUCKET_GROWTH = 2**0.25
+PERCENTILES = (50, 95, 99)
+
+
+# pylint: disable=too-many-instance-attributes
+class MethodMetrics:
+    """
+    Call counters and a latency histogram of one method.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.errors: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+        self.rate_limit_wait: float = 0.0
+        # histogram bucket index mapped to the number of calls
+        self.__buckets: dict[int, int] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def observe(self, duration: float, failed: bool = False, rate_limit_wait: float = 0.0) -> None:
+        """
+        Record a finished call.
+
+        @param duration: The duration of the call in seconds, without the rate limit wait.
+        @param failed: True if the call raised an error.
+        @param rate_limit_wait: The time the call spent waiting for the rate limit in seconds.
+        @return: None
+        """
+        bucket = max(0, math.ceil(math.log(max(duration, BUCKET_BASE) / BUCKET_BASE, BUCKET_GROWTH)))
+        with self.__lock:
+            self.calls += 1
+            self.rate_limit_wait += rate_limit_wait
+            self.errors += failed
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+            self.__buckets[bucket] = self.__buckets.get(bucket, 0) + 1
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimate the latency percentile from the histogram.
+
+        @param percent: The percentile, between 0 and 100.
+        @return: The upper bound of the histogram bucket holding the percentile in seconds, 0.0 with no calls.
+        """
+        if self.calls == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.calls * percent / 100))
+        seen = 0
+        for bucket in sorted(self.__buckets):
+            seen += self.__buckets[bucket]
+            if seen >= rank:
+                return min(BUCKET_BASE * BUCKET_GROWTH**bucket, self.max_time)
+        return self.max_time
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the metrics to a dictionary.
+
+        @return: Dictionary of the counters, total, max and percentile latencies in seconds.
+        """
+        with self.__lock:
+            return self.__to_dict()
+
+    def __to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            **{f"p{percent}": self.percentile(percent) for percent in PERCENTILES},
+            "rate_limit_wait": self.rate_limit_wait,
+        }
+
+
+# pylint: disable=too-few-public-methods
+class _InstrumentedCall:
+    """
+    An instrumented call running in the current thread or task, with the time it waited for the rate limit.
+    """
+
+    def __init__(self, metrics: MethodMetrics):
+        self.metrics: MethodMetrics = metrics
+        self.start: float = time.perf_counter()
+        self.rate_limit_wait: float = 0.0
+
+    def observe(self, failed: bool) -> None:
+        """
+        Record the finished call; its latency excludes the rate limit wait, which is recorded separately.
+
+        @param failed: True if the call raised an error.
+        @return: None
+        """
+        duration = time.perf_counter() - self.start
+        self.metrics.observe(max(duration - self.rate_limit_wait, 0.0), failed, self.rate_limit_wait)
+
+
+# Instrumented call running in the current thread or task.
+_current_call: ContextVar[Optional[_InstrumentedCall]] = ContextVar("current_call", default=None)
+
+
+def record_rate_limit_wait(seconds: float) -> None:
+    """
+    Attribute time spent waiting for the rate limit to the instrumented call running in the current context.
+
+    @param seconds: The waiting time in seconds.
+    @return: None
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.rate_limit_wait += seconds
+
+
+@contextmanager
+def measure_rate_limit_wait() -> Iterator[None]:
+    """
+    Measure the time spent in the block waiting for the rate limit and attribute it to the instrumented call
+    running in the current context.
+
+    @return: Context manager measuring the block.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_rate_limit_wait(time.perf_counter() - start)
+
+
+class MetricsRegistry:
+    """
+    A registry of per-method metrics: call and error counts, latency histograms with p50/p95/p99, and the time
+    spent waiting in the GitHub rate limiter. The latencies exclude that wait, so they measure the API calls only.
+
+    Instrument methods with the registry used as a decorator, or pass it to `safe_call_decorator`, and dump the
+    summary at the end of the job with `log_summary` and `save_json`.
+    """
+
+    def __init__(self) -> None:
+        self.__metrics: dict[str, MethodMetrics] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def __call__(self, method: Callable) -> Callable:
+        return self.instrument(method)
+
+    def instrument(self, method: Callable, name: Optional[str] = None) -> Callable:
+        """
+        Wrap the method to record its calls.
+
+        @param method: The method to wrap, a function or a coroutine function.
+        @param name: The name of the metrics, the qualified name of the method by default.
+        @return: The wrapped method.
+        """
+        metrics_name = name or str(getattr(method, "__qualname__", repr(method)))
+
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapped(*args, **kwargs) -> Optional[Any]:
+                call = _InstrumentedCall(self.get(metrics_name))
+                token = _current_call.set(call)
+                failed = True
+                try:
+                    result = await method(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    _current_call.reset(token)
+                    call.observe(failed)
+
+            return async_wrapped
+
+        @wraps(method)
+        def wrapped(*args, **kwargs) -> Optional[Any]:
+            call = _InstrumentedCall(self.get(metrics_name))
+            token = _current_call.set(call)
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                _current_call.reset(token)
+                call.observe(failed)
+
+        return wrapped
+
+    def get(self, name: str) -> MethodMetrics:
+        """
+        Get the metrics of the method, creating them on the first use.
+
+        @param name: The name of the metrics.
+        @return: The metrics.
+        """
+        with self.__lock:
+            metrics = self.__metrics.get(name)
+            if metrics is None:
+                metrics = self.__metrics[name] = MethodMetrics(name)
+            return metrics
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarize the metrics of all methods, the most time consuming first.
+
+        @return: Method names mapped to their metrics dictionaries.
+        """
+        with self.__lock:
+            ordered = sorted(self.__metrics.values(), key=lambda metrics: metrics.total_time, reverse=True)
+            return {metrics.name: metrics.to_dict() for metrics in ordered}
+
+    def log_summary(self, level: int = logging.INFO) -> None:
+        """
+        Log one line of the metrics per method, the most time consuming first.
+
+        @param level: The logging level.
+        @return: None
+        """
+        for name, metrics in self.summary().items():
+            logger.log(
+                level,
+                "%s: %d calls, %d errors, total %.3fs, p50 %.3fs, p95 %.3fs, p99 %.3fs, max %.3fs, "
+                "rate limit wait %.3fs.",
+                name,
+                metrics["calls"],
+                metrics["errors"],
+                metrics["total_time"],
+                metrics["p50"],
+                metrics["p95"],
+                metrics["p99"],
+                metrics["max_time"],
+                metrics["rate_limit_wait"],
+            )
+
+    def save_json(self, path: str | Path) -> None:
+        """
+        Save the summary of the metrics to a JSON file.
+
+        @param path: The path of the file.
+        @return: None
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        logger.info("Metrics summary saved to %s.", path)
+
+    def clear(self) -> None:
+        """
+        Drop the metrics of all methods.
+
+        @return: None
+        """
+        with self.__lock:
+            self.__metrics.clear()
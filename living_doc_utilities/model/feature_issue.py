@@ -26,3 +26,5 @@ class FeatureIssue(Issue):
     Represents a Feature Issue in the GitHub repository ecosystem.
     This specialized issue type allows for classification and type-specific handling of feature-related issues.
     """
+
+    __slots__ = ()
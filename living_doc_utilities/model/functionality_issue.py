@@ -18,8 +18,6 @@
 This module defines the FeatureIssue class, which is a specialized type of Issue
 """
 
-import re
-
 from living_doc_utilities.model.issue import Issue
 
 
@@ -29,6 +27,10 @@ class FunctionalityIssue(Issue):
     It extends the Issue class to include specific methods valid for functionality-type issues.
     """
 
+    __slots__ = ()
+
+    ASSOCIATED_FEATURE_SECTION = "Associated Feature"
+
     def get_related_feature_ids(self) -> list[int]:
         """
         Get the feature IDs from the issue body.
@@ -40,17 +42,4 @@ class FunctionalityIssue(Issue):
 
         @return: A list of feature IDs extracted from the issue body.
         """
-        if not self.body:
-            return []
-
-        pattern = r"### Associated Feature\s*(?:\s*[-*]\s*#\d+)+"
-        section_match = re.search(pattern, self.body)
-        if not section_match:
-            return []
-
-        # Extract just the matched section text
-        section_text = section_match.group(0)
-
-        # Find all occurrences of `#<number>` in that section
-        id_matches = re.findall(r"#(\d+)", section_text)
-        return [int(match) for match in id_matches]
+        return self.get_section_issue_references(self.ASSOCIATED_FEATURE_SECTION)
@@ -19,8 +19,10 @@ This module contains the Issue class, which represents the data of an issue.
 """
 
 import logging
+import sys
 from typing import Any, Optional
 
+from living_doc_utilities.model.issue_body_parser import extract_issue_references, parse_sections
 from living_doc_utilities.model.project_status import ProjectStatus
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,28 @@ class Issue:
     LINKED_TO_PROJECT = "linked_to_project"
     PROJECT_STATUS = "project_status"
 
+    # Slots avoid a per-instance __dict__, which matters with hundreds of thousands of issues in memory.
+    __slots__ = (
+        "repository_id",
+        "title",
+        "issue_number",
+        "state",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "html_url",
+        "__body",
+        "labels",
+        "linked_to_project",
+        "project_statuses",
+        "__errors",
+        "__body_sections",
+        "__section_references",
+    )
+
+    # Incremented whenever the body of an existing issue changes, so caches derived from bodies can detect it cheaply.
+    __body_revision: int = 0
+
     def __init__(self):
         # issue's properties - required for all issues
         self.repository_id: str = ""
@@ -58,15 +82,18 @@ class Issue:
         self.updated_at: Optional[str] = None
         self.closed_at: Optional[str] = None
         self.html_url: Optional[str] = None
-        self.body: Optional[str] = None
+        self.__body: Optional[str] = None
         self.labels: list[str] = []
 
         # GitHub Projects related properties
         self.linked_to_project: bool = False
         self.project_statuses: list[ProjectStatus] = []
 
-        # support properties
-        self.__errors: dict[str, str] = {}
+        # support properties, allocated on first use
+        self.__errors: Optional[dict[str, str]] = None
+        # parsed body, built on first access and dropped when the body changes
+        self.__body_sections: Optional[dict[str, str]] = None
+        self.__section_references: Optional[dict[str, list[int]]] = None
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -105,9 +132,69 @@ class Issue:
 
         return res
 
+    @property
+    def body(self) -> Optional[str]:
+        """Getter of the issue body."""
+        return self.__body
+
+    @body.setter
+    def body(self, value: Optional[str]) -> None:
+        self.__body = value
+        self.__body_sections = None
+        self.__section_references = None
+        Issue.__body_revision += 1
+
+    def get_body_sections(self) -> dict[str, str]:
+        """
+        Get the sections of the issue body, keyed by their heading titles.
+
+        The body is parsed once; later lookups are served from the cache until the body changes.
+
+        @return: Heading titles mapped to the section text. Must not be modified.
+        """
+        if self.__body_sections is None:
+            self.__body_sections = parse_sections(self.__body) if self.__body else {}
+        return self.__body_sections
+
+    def get_body_section(self, title: str) -> Optional[str]:
+        """
+        Get the text of a body section.
+
+        @param title: The heading title of the section, e.g. 'Associated Feature'.
+        @return: The section text, or None if the body has no such section.
+        """
+        return self.get_body_sections().get(title)
+
+    def get_section_issue_references(self, title: str) -> list[int]:
+        """
+        Get the issue numbers listed at the start of a body section.
+
+        @param title: The heading title of the section.
+        @return: The referenced issue numbers, empty if the section does not exist.
+        """
+        if self.__section_references is None:
+            self.__section_references = {}
+        references = self.__section_references.get(title)
+        if references is None:
+            section = self.get_body_section(title)
+            references = extract_issue_references(section) if section else []
+            self.__section_references[title] = references
+        return list(references)
+
+    @classmethod
+    def body_revision(cls) -> int:
+        """
+        Get the revision counter of issue bodies, which changes whenever the body of any issue is set.
+
+        @return: The current revision.
+        """
+        return Issue.__body_revision
+
     @property
     def errors(self) -> dict[str, str]:
         """Getter of the errors that occurred during the issue processing."""
+        if self.__errors is None:
+            self.__errors = {}
         return self.__errors
 
     def add_errors(self, errors: dict[str, str]) -> None:
@@ -119,7 +206,7 @@ class Issue:
         if not isinstance(errors, dict):
             raise TypeError("Errors must be a dictionary.")
 
-        self.__errors.update(errors)
+        self.errors.update(errors)
 
     @property
     def organization_name(self) -> str:
@@ -152,11 +239,14 @@ class Issue:
         return parts[1]
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Issue":
+    def from_dict(cls, data: dict[str, Any], compact: bool = False) -> "Issue":
         """
         Creates an Issue object from a dictionary representation.
 
+        Repository IDs, states and labels are interned, so repeated values share one string object.
+
         @param data: Dictionary representation of the issue.
+        @param compact: If True, identical project statuses share one immutable ProjectStatus instance.
         @return: Issue object.
         """
         issue: Issue = cls()
@@ -171,7 +261,7 @@ class Issue:
             raise ValueError("Repository ID is required to create an Issue object.")
         if not isinstance(repository_id, str):
             raise ValueError("Repository ID must be a string.")
-        issue.repository_id = repository_id
+        issue.repository_id = sys.intern(repository_id)
 
         title = data.get(cls.TITLE, None)
         if title is None:
@@ -200,18 +290,25 @@ class Issue:
             raise ValueError("Issue number must be a positive integer.")
         issue.issue_number = issue_number
 
-        issue.state = data.get(cls.STATE, None)
+        state = data.get(cls.STATE, None)
+        issue.state = sys.intern(state) if isinstance(state, str) else state
         issue.created_at = data.get(cls.CREATED_AT, None)
         issue.updated_at = data.get(cls.UPDATED_AT, None)
         issue.closed_at = data.get(cls.CLOSED_AT, None)
         issue.html_url = data.get(cls.HTML_URL, None)
-        issue.body = data.get(cls.BODY, None)
-        issue.labels = data.get(cls.LABELS, [])
+        # A new issue is not part of any cache yet, so the body revision does not need to change.
+        issue.__body = data.get(cls.BODY, None)  # pylint: disable=unused-private-member
+        labels = data.get(cls.LABELS, [])
+        if isinstance(labels, list):
+            labels = [sys.intern(label) if isinstance(label, str) else label for label in labels]
+        issue.labels = labels
         issue.linked_to_project = data.get(cls.LINKED_TO_PROJECT, False)
 
         project_statuses_data = data.get(cls.PROJECT_STATUS, None)
         if project_statuses_data and isinstance(project_statuses_data, list):
-            issue.project_statuses = [ProjectStatus.from_dict(status_data) for status_data in project_statuses_data]
+            issue.project_statuses = [
+                ProjectStatus.from_dict(status_data, shared=compact) for status_data in project_statuses_data
+            ]
         else:
             issue.project_statuses = []
 
@@ -0,0 +1,88 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains functions for parsing Markdown issue bodies into headed sections.
+"""
+
+import re
+
+# ATX heading, e.g. `### Associated Feature` or `## Title ##`
+HEADING_PATTERN = re.compile(r"^ {0,3}#{1,6}[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+FENCE_PATTERN = re.compile(r"^ {0,3}(```|~~~)")
+# List item referencing an issue, e.g. `- #13`
+ISSUE_REFERENCE_ITEM_PATTERN = re.compile(r"^\s*[-*]\s*#(\d+)")
+
+# Key of the text preceding the first heading.
+PREAMBLE = ""
+
+
+def parse_sections(body: str) -> dict[str, str]:
+    """
+    Split a Markdown body into sections by their headings, in a single pass over the lines.
+
+    Headings inside fenced code blocks are ignored. If a heading repeats, its first section is kept.
+
+    @param body: The Markdown body.
+    @return: Heading titles mapped to the text below them, up to the next heading. The text preceding
+        the first heading is stored under an empty title.
+    """
+    sections: dict[str, str] = {}
+    title = PREAMBLE
+    lines: list[str] = []
+    fence = None
+
+    for line in body.splitlines():
+        fence_match = FENCE_PATTERN.match(line)
+        if fence_match:
+            if fence is None:
+                fence = fence_match.group(1)
+            elif fence_match.group(1) == fence:
+                fence = None
+        elif fence is None:
+            heading_match = HEADING_PATTERN.match(line)
+            if heading_match:
+                sections.setdefault(title, "\n".join(lines))
+                title = heading_match.group(1)
+                lines = []
+                continue
+        lines.append(line)
+
+    sections.setdefault(title, "\n".join(lines))
+    return sections
+
+
+def extract_issue_references(section: str) -> list[int]:
+    """
+    Extract issue numbers from the list leading the section.
+
+    Expected format:
+        - #13
+        - #14
+
+    Blank lines are skipped; the list ends with the first other line which is not an issue reference.
+
+    @param section: The section text.
+    @return: The referenced issue numbers in order of appearance.
+    """
+    references: list[int] = []
+    for line in section.splitlines():
+        match = ISSUE_REFERENCE_ITEM_PATTERN.match(line)
+        if match:
+            references.append(int(match.group(1)))
+        elif line.strip():
+            break
+    return references
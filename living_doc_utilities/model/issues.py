@@ -20,66 +20,508 @@ This module contains the Issues class, which is used to manage issues in the Git
 
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from living_doc_utilities.constants import SnapshotFormat
 from living_doc_utilities.factory.issue_factory import IssueFactory
 from living_doc_utilities.model.feature_issue import FeatureIssue
 from living_doc_utilities.model.functionality_issue import FunctionalityIssue
 from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues_index import LABEL, REPOSITORY_ID, STATE, STATUS, TYPE, IssuesIndex
 from living_doc_utilities.model.user_story_issue import UserStoryIssue
+from living_doc_utilities.serde.binary_snapshot import BinarySnapshotReader, BinarySnapshotWriter
+from living_doc_utilities.serde.compression import is_compressed, open_snapshot
+from living_doc_utilities.serde.delta_log import IssuesDeltaLog
+from living_doc_utilities.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+# pylint: disable=too-many-public-methods
 class Issues:
     """
     This class represents a collection of issues in a GitHub repository ecosystem.
     """
 
-    def __init__(self, issues: Optional[dict[str, Issue]] = None, project_states_included: bool = False) -> None:
+    KEY = "key"
+
+    def __init__(
+        self,
+        issues: Optional[dict[str, Issue]] = None,
+        project_states_included: bool = False,
+        indexed: bool = False,
+        track_changes: bool = False,
+    ) -> None:
         self.issues: dict[str, Issue] = issues or {}
         self.project_states_included: bool = project_states_included
+        # keys added or removed since the last save of changes, in order of the last change; None if not tracked
+        self._pending_changes: Optional[dict[str, bool]] = None
+        self._index: Optional[IssuesIndex] = None
+        self._feature_functionalities: Optional[dict[str, list[str]]] = None
+        self._feature_functionalities_revision: int = -1
+        if indexed:
+            self.enable_indexes()
+        if track_changes:
+            self.track_changes()
 
-    def save_to_json(self, file_path: str | Path) -> None:
+    # pylint: disable=redefined-builtin
+    @traced(category="issues")
+    def save_to_json(
+        self, file_path: str | Path, format: str = SnapshotFormat.JSON, compression_level: Optional[int] = None
+    ) -> None:
         """
         Save the issues to a JSON file.
 
-        @param file_path: Path to the JSON file.
+        @param file_path: Path to the JSON file. A .gz, .xz or .bz2 extension compresses the output.
+        @param format: Snapshot format: 'json' (default), 'jsonl' or 'binary'.
+        @param compression_level: Compression level of a compressed output; the codec default if not set.
         @return: None
+        @raises ValueError: If the format is not supported.
         """
-        data = {key: ci.to_dict() for key, ci in self.issues.items()}
-        with open(file_path, "w", encoding="utf-8") as f:
+        match SnapshotFormat(format):
+            case SnapshotFormat.JSONL:
+                self.save_to_jsonl(file_path, compression_level)
+                return
+            case SnapshotFormat.BINARY:
+                self.save_to_binary(file_path, compression_level)
+                return
+
+        data = {key: ci.to_dict() for key, ci in self.iter_issues()}
+        with open_snapshot(file_path, "w", compression_level) as f:
             json.dump(data, f, indent=4, ensure_ascii=False)
 
-    # pylint: disable=broad-exception-caught
     @classmethod
-    def load_from_json(cls, file_path: str | Path) -> "Issues":
+    @traced(category="issues")
+    def load_from_json(
+        cls,
+        file_path: str | Path,
+        format: str = SnapshotFormat.JSON,
+        delta_log_path: Optional[str | Path] = None,
+        compact: bool = False,
+    ) -> "Issues":
         """
         Load issues from a JSON file.
 
-        @param file_path: Path to the JSON file.
+        @param file_path: Path to the JSON file. A .gz, .xz or .bz2 extension is decompressed transparently.
+        @param format: Snapshot format: 'json' (default), 'jsonl' or 'binary'.
+        @param delta_log_path: Path to a delta log replayed on top of the loaded snapshot, if any; the changes made
+            afterward are then tracked for `save_changes_to_log`.
+        @param compact: If True, identical project statuses share one immutable instance to save memory.
         @return: Issues object.
+        @raises ValueError: If the format is not supported or the delta log is malformed.
         """
+        match SnapshotFormat(format):
+            case SnapshotFormat.JSONL:
+                issues = cls.load_from_jsonl(file_path, compact)
+            case SnapshotFormat.BINARY:
+                issues = cls.load_from_binary(file_path, compact)
+            case _:
+                issues = cls.__load_from_json(file_path, compact)
+
+        if delta_log_path is not None:
+            issues.replay_log(delta_log_path)
+        return issues
+
+    # pylint: disable=broad-exception-caught
+    @classmethod
+    def __load_from_json(cls, file_path: str | Path, compact: bool) -> "Issues":
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open_snapshot(file_path, "r") as f:
                 data = json.load(f)
 
-            issues: dict[str, Issue] = {key: IssueFactory.get(value.get("type"), value) for key, value in data.items()}
+            issues: dict[str, Issue] = {
+                key: IssueFactory.get(value.get("type"), value, compact) for key, value in data.items()
+            }
 
-            return cls(issues)
+            return cls._from_issues(issues)
         except FileNotFoundError:
             logger.warning("Issues file not found at %s. Returning empty Issues object.", file_path)
-            return cls()
+            return cls._from_issues({})
         except json.JSONDecodeError:
             logger.error("Failed to parse JSON from %s. Returning empty Issues object.", file_path)
-            return cls()
+            return cls._from_issues({})
         except Exception as e:
             logger.error("Unexpected error loading issues from %s: %s", file_path, str(e))
-            return cls()
+            return cls._from_issues({})
+
+    @classmethod
+    def _from_issues(cls, issues: dict[str, Issue]) -> "Issues":
+        """
+        Create the collection returned by the load methods. Backends whose constructor does not take
+        the issues override it.
+
+        @param issues: The loaded issues.
+        @return: Issues object.
+        """
+        return cls(issues)
+
+    @traced(category="issues")
+    def save_to_jsonl(self, file_path: str | Path, compression_level: Optional[int] = None) -> None:
+        """
+        Save the issues to a JSON Lines file, one issue per line with its key embedded.
+
+        Records are serialized and written one by one, so no full in-memory copy of the data is built.
+
+        @param file_path: Path to the JSON Lines file. A .gz, .xz or .bz2 extension compresses the output.
+        @param compression_level: Compression level of a compressed output; the codec default if not set.
+        @return: None
+        """
+        with open_snapshot(file_path, "w", compression_level) as f:
+            for key, issue in self.iter_issues():
+                f.write(self.to_jsonl_record(key, issue))
+
+    @classmethod
+    def to_jsonl_record(cls, key: str, issue: Issue) -> str:
+        """
+        Serialize a single issue into one JSON Lines record.
+
+        @param key: The unique key of the issue.
+        @param issue: The issue to serialize.
+        @return: The JSON record terminated by a newline.
+        """
+        return json.dumps({cls.KEY: key, **issue.to_dict()}, ensure_ascii=False) + "\n"
+
+    @classmethod
+    def iter_from_jsonl(cls, file_path: str | Path, compact: bool = False) -> Iterator[tuple[str, Issue]]:
+        """
+        Lazily read issues from a JSON Lines file, one record at a time.
+
+        @param file_path: Path to the JSON Lines file. A .gz, .xz or .bz2 extension is decompressed on the fly.
+        @param compact: If True, identical project statuses share one immutable instance.
+        @return: Iterator of (key, issue) pairs in file order.
+        @raises FileNotFoundError: If the file does not exist.
+        @raises json.JSONDecodeError: If a record is not valid JSON.
+        @raises ValueError: If a record misses its key or the required issue fields.
+        """
+        with open_snapshot(file_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                yield cls.from_jsonl_record(line, compact)
+
+    @classmethod
+    def from_jsonl_record(cls, record: str | bytes, compact: bool = False) -> tuple[str, Issue]:
+        """
+        Deserialize a single JSON Lines record into its key and issue.
+
+        @param record: The JSON record of one issue.
+        @param compact: If True, identical project statuses share one immutable instance.
+        @return: Tuple of the issue key and the issue object.
+        @raises ValueError: If the record misses its key or the required issue fields.
+        """
+        data = json.loads(record)
+        key = data.pop(cls.KEY, None)
+        if not isinstance(key, str):
+            raise ValueError("Issue key is required in every JSON Lines record.")
+
+        return key, IssueFactory.get(data.get("type"), data, compact)
+
+    # pylint: disable=broad-exception-caught
+    @classmethod
+    @traced(category="issues")
+    def load_from_jsonl(cls, file_path: str | Path, compact: bool = False) -> "Issues":
+        """
+        Load issues from a JSON Lines file.
+
+        @param file_path: Path to the JSON Lines file.
+        @param compact: If True, identical project statuses share one immutable instance to save memory.
+        @return: Issues object.
+        """
+        try:
+            return cls._from_issues(dict(cls.iter_from_jsonl(file_path, compact)))
+        except FileNotFoundError:
+            logger.warning("Issues file not found at %s. Returning empty Issues object.", file_path)
+            return cls._from_issues({})
+        except json.JSONDecodeError:
+            logger.error("Failed to parse JSON from %s. Returning empty Issues object.", file_path)
+            return cls._from_issues({})
+        except Exception as e:
+            logger.error("Unexpected error loading issues from %s: %s", file_path, str(e))
+            return cls._from_issues({})
+
+    @traced(category="issues")
+    def save_to_binary(self, file_path: str | Path, compression_level: Optional[int] = None) -> None:
+        """
+        Save the issues to a compact binary snapshot file.
+
+        @param file_path: Path to the binary snapshot file. A .gz, .xz or .bz2 extension compresses the output.
+        @param compression_level: Compression level of a compressed output; the codec default if not set.
+        @return: None
+        """
+        with open_snapshot(file_path, "wb", compression_level) as f:
+            writer = BinarySnapshotWriter(f)
+            for key, issue in self.iter_issues():
+                writer.write(key, issue)
+            writer.finish()
+
+    @staticmethod
+    def iter_from_binary(file_path: str | Path, compact: bool = False) -> Iterator[tuple[str, Issue]]:
+        """
+        Lazily read issues from a memory-mapped binary snapshot file.
+
+        Compressed snapshots cannot be memory-mapped; they are decompressed into memory first.
+
+        @param file_path: Path to the binary snapshot file.
+        @param compact: If True, identical project statuses share one immutable instance.
+        @return: Iterator of (key, issue) pairs in file order.
+        @raises FileNotFoundError: If the file does not exist.
+        @raises ValueError: If the file is not a valid binary snapshot or a record misses required issue fields.
+        """
+        if is_compressed(file_path):
+            with open_snapshot(file_path, "rb") as f:
+                data = f.read()
+            for key, values in BinarySnapshotReader(memoryview(data)):
+                yield key, IssueFactory.get(values[Issue.TYPE], values, compact)
+            return
+
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                for key, values in BinarySnapshotReader(view):
+                    yield key, IssueFactory.get(values[Issue.TYPE], values, compact)
+
+    # pylint: disable=broad-exception-caught
+    @classmethod
+    @traced(category="issues")
+    def load_from_binary(cls, file_path: str | Path, compact: bool = False) -> "Issues":
+        """
+        Load issues from a binary snapshot file.
+
+        @param file_path: Path to the binary snapshot file.
+        @param compact: If True, identical project statuses share one immutable instance to save memory.
+        @return: Issues object.
+        """
+        try:
+            return cls._from_issues(dict(cls.iter_from_binary(file_path, compact)))
+        except FileNotFoundError:
+            logger.warning("Issues file not found at %s. Returning empty Issues object.", file_path)
+            return cls._from_issues({})
+        except Exception as e:
+            logger.error("Unexpected error loading issues from %s: %s", file_path, str(e))
+            return cls._from_issues({})
+
+    @traced(category="issues")
+    def save_changes_to_log(self, log_path: str | Path) -> int:
+        """
+        Append the issues added or removed since the last save of changes to a delta log.
+
+        @param log_path: Path to the delta log; compressed extensions are not supported.
+        @return: The number of appended change records.
+        @raises ValueError: If the changes are not tracked or the path has a compressed file extension.
+        """
+        if self._pending_changes is None:
+            raise ValueError("Changes are not tracked. Call track_changes() or replay the log before modifying issues.")
+        changes = [(key, self.get_issue(key) if upserted else None) for key, upserted in self._pending_changes.items()]
+        count = IssuesDeltaLog(log_path).append(changes)
+        self._pending_changes.clear()
+        return count
+
+    @traced(category="issues")
+    def replay_log(self, log_path: str | Path) -> int:
+        """
+        Apply the changes recorded in a delta log, in the order they were appended.
+
+        Replayed changes are not considered pending, since they are already persisted in the log. The changes made
+        afterward are tracked.
+
+        @param log_path: Path to the delta log. A missing log is treated as empty.
+        @return: The number of applied change records.
+        @raises ValueError: If the delta log is malformed.
+        """
+        pending_changes = dict(self._pending_changes or {})
+        count = 0
+        for key, issue in IssuesDeltaLog(log_path).iter_changes():
+            if issue is None:
+                self.remove_issue(key)
+            else:
+                self.add_issue(key, issue)
+            count += 1
+
+        self._pending_changes = pending_changes
+        logger.debug("Replayed %d change records from %s.", count, log_path)
+        return count
+
+    # pylint: disable=redefined-builtin
+    @traced(category="issues")
+    def compact(
+        self,
+        file_path: str | Path,
+        log_path: str | Path,
+        format: str = SnapshotFormat.JSON,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        Fold the current state, including replayed and pending changes, into a new base snapshot and clear the log.
+
+        The snapshot is written to a temporary file first and then atomically replaces the previous one.
+
+        @param file_path: Path to the base snapshot file.
+        @param log_path: Path to the delta log, which is removed once the snapshot is written.
+        @param format: Snapshot format: 'json' (default), 'jsonl' or 'binary'.
+        @param compression_level: Compression level of a compressed output; the codec default if not set.
+        @return: None
+        """
+        path = Path(file_path)
+        # The name keeps the original extension, which selects the compression.
+        temporary_path = path.with_name(f".tmp-{path.name}")
+        try:
+            self.save_to_json(temporary_path, format, compression_level)
+            os.replace(temporary_path, path)
+        finally:
+            if temporary_path.exists():
+                os.remove(temporary_path)
+
+        IssuesDeltaLog(log_path).clear()
+        if self._pending_changes is not None:
+            self._pending_changes.clear()
+
+    def track_changes(self) -> None:
+        """
+        Start recording the issues added or removed from now on, so `save_changes_to_log` can append them.
+
+        Tracking is off by default, since the recorded keys are kept until the changes are saved.
+
+        @return: None
+        """
+        if self._pending_changes is None:
+            self._pending_changes = {}
+
+    def enable_indexes(self) -> None:
+        """
+        Build the secondary indexes used by query() and keep them up to date on add_issue and remove_issue.
+
+        Issues changed in place must be added again to refresh their indexed values.
+
+        @return: None
+        """
+        self._index = IssuesIndex()
+        for key, issue in self.iter_issues():
+            self._index.add(key, issue)
+
+    # pylint: disable=redefined-builtin
+    def query(
+        self,
+        *,
+        repository_id: Optional[str] = None,
+        type: Optional[str | type[Issue]] = None,
+        state: Optional[str] = None,
+        label: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> dict[str, Issue]:
+        """
+        Find the issues matching all given conditions.
+
+        Uses the secondary indexes when enabled, otherwise scans all issues.
+
+        @param repository_id: Repository ID in the 'org/repo' format.
+        @param type: Issue class or its name, e.g. FeatureIssue; subclasses are not matched.
+        @param state: Issue state, e.g. 'open'.
+        @param label: Label the issue is tagged with.
+        @param status: Status of the issue in any of its projects.
+        @return: Dictionary of the matching issues.
+        """
+        conditions: dict[str, str] = {}
+        for field, value in (
+            (REPOSITORY_ID, repository_id),
+            (TYPE, type if isinstance(type, str) or type is None else type.__name__),
+            (STATE, state),
+            (LABEL, label),
+            (STATUS, status),
+        ):
+            if value is not None:
+                conditions[field] = value
+
+        if self._index is not None:
+            return {key: self.get_issue(key) for key in self._index.lookup(conditions)}
+
+        return {key: issue for key, issue in self.iter_issues() if self.__matches(issue, conditions)}
+
+    def feature_functionalities(self) -> dict[str, list[str]]:
+        """
+        Get the keys of functionalities related to each feature.
+
+        The relation is read from the 'Associated Feature' section of functionality bodies, resolving feature
+        numbers within the repository of the functionality. It is built in a single pass over all functionalities
+        and cached until an issue is added or removed, or the body of any issue changes.
+
+        @return: Feature keys mapped to the keys of their functionalities. Must not be modified.
+        """
+        if self._feature_functionalities is None or self._feature_functionalities_revision != Issue.body_revision():
+            self._feature_functionalities_revision = Issue.body_revision()
+            self._feature_functionalities = self.__build_feature_functionalities()
+        return self._feature_functionalities
+
+    def get_feature_functionalities(self, feature_key: str) -> list[str]:
+        """
+        Get the keys of functionalities related to the feature.
+
+        @param feature_key: The unique key of the feature issue.
+        @return: Keys of the related functionality issues, empty if there are none.
+        """
+        return list(self.feature_functionalities().get(feature_key, []))
 
     def add_issue(self, key: str, issue: Issue) -> None:
+        """
+        Add an issue, or replace the issue stored under the same key.
+
+        @param key: The unique key of the issue.
+        @param issue: The issue to add.
+        @return: None
+        """
         self.issues[key] = issue
+        self._on_issue_added(key, issue)
+
+    def remove_issue(self, key: str) -> None:
+        """
+        Remove an issue by its unique key. A missing key is ignored.
+
+        @param key: The unique key of the issue.
+        @return: None
+        """
+        self.issues.pop(key, None)
+        self._on_issue_removed(key)
+
+    def _on_issue_added(self, key: str, issue: Issue) -> None:
+        """
+        Record an added or replaced issue: mark it pending if tracked, update the indexes and drop derived caches.
+        Every backend calls it from its mutators once the issue is stored.
+
+        @param key: The unique key of the issue.
+        @param issue: The stored issue.
+        @return: None
+        """
+        self._on_issues_stored((key,))
+        if self._index is not None:
+            self._index.add(key, issue)
+
+    def _on_issues_stored(self, keys: Iterable[str]) -> None:
+        """
+        Record added or replaced issues without updating the indexes: mark them pending if tracked and drop
+        derived caches. Backends without in-memory indexes call it once per batch.
+
+        @param keys: The unique keys of the stored issues.
+        @return: None
+        """
+        if self._pending_changes is not None:
+            for key in keys:
+                self._pending_changes[key] = True
+        self._feature_functionalities = None
+
+    def _on_issue_removed(self, key: str) -> None:
+        """
+        Record a removed issue: mark it pending if tracked, update the indexes and drop derived caches.
+        Every backend calls it from its mutators once the issue is removed.
+
+        @param key: The unique key of the issue.
+        @return: None
+        """
+        if self._pending_changes is not None:
+            self._pending_changes[key] = False
+        self._feature_functionalities = None
+        if self._index is not None:
+            self._index.remove(key)
 
     def get_issue(self, key: str) -> Issue | UserStoryIssue | FeatureIssue | FunctionalityIssue:
         """
@@ -103,6 +545,14 @@ class Issues:
     def all_issues(self) -> dict[str, Issue]:
         return self.issues
 
+    def iter_issues(self) -> Iterator[tuple[str, Issue]]:
+        """
+        Iterate over the issues of the collection.
+
+        @return: Iterator of (key, issue) pairs.
+        """
+        yield from self.issues.items()
+
     def count(self) -> int:
         return len(self.issues)
 
@@ -117,3 +567,41 @@ class Issues:
         @return: The unique string key for the issue.
         """
         return f"{organization_name}/{repository_name}/{issue_number}"
+
+    def __build_feature_functionalities(self) -> dict[str, list[str]]:
+        relations: dict[str, dict[str, None]] = {}
+        for key, issue in self.iter_issues():
+            if not isinstance(issue, FunctionalityIssue):
+                continue
+
+            feature_ids = issue.get_related_feature_ids()
+            if not feature_ids:
+                continue
+            try:
+                organization_name, repository_name = issue.organization_name, issue.repository_name
+            except ValueError:
+                logger.warning("Skipping related features of issue '%s' with invalid repository ID.", key)
+                continue
+
+            for feature_id in feature_ids:
+                feature_key = self.make_issue_key(organization_name, repository_name, feature_id)
+                relations.setdefault(feature_key, {})[key] = None
+
+        return {feature_key: list(keys) for feature_key, keys in relations.items()}
+
+    @staticmethod
+    def __matches(issue: Issue, conditions: dict[str, str]) -> bool:
+        for field, value in conditions.items():
+            if field == REPOSITORY_ID:
+                matched = issue.repository_id == value
+            elif field == TYPE:
+                matched = issue.__class__.__name__ == value
+            elif field == STATE:
+                matched = issue.state == value
+            elif field == LABEL:
+                matched = value in (issue.labels or [])
+            else:
+                matched = any(project_status.status == value for project_status in issue.project_statuses)
+            if not matched:
+                return False
+        return True
@@ -0,0 +1,106 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssuesIndex class, which maintains secondary indexes over a collection of issues.
+"""
+
+from typing import Optional
+
+from living_doc_utilities.model.issue import Issue
+
+REPOSITORY_ID = "repository_id"
+TYPE = "type"
+STATE = "state"
+LABEL = "label"
+STATUS = "status"
+INDEXED_FIELDS = (REPOSITORY_ID, TYPE, STATE, LABEL, STATUS)
+
+
+class IssuesIndex:
+    """
+    Secondary indexes mapping repository ID, type, state, label and project status values to issue keys.
+
+    Postings keep the insertion order of the keys, so query results are deterministic.
+    """
+
+    def __init__(self) -> None:
+        self.__postings: dict[str, dict[Optional[str], dict[str, None]]] = {field: {} for field in INDEXED_FIELDS}
+        # indexed values of every key, so postings can be removed even if the issue was changed in place
+        self.__entries: dict[str, dict[str, set[Optional[str]]]] = {}
+
+    def add(self, key: str, issue: Issue) -> None:
+        """
+        Index the issue under the key, replacing the previously indexed values of the key.
+
+        @param key: The unique key of the issue.
+        @param issue: The issue to index.
+        @return: None
+        """
+        self.remove(key)
+
+        entry: dict[str, set[Optional[str]]] = {
+            REPOSITORY_ID: {issue.repository_id},
+            TYPE: {issue.__class__.__name__},
+            STATE: {issue.state},
+            LABEL: set(issue.labels or []),
+            STATUS: {project_status.status for project_status in issue.project_statuses},
+        }
+        for field, values in entry.items():
+            postings = self.__postings[field]
+            for value in values:
+                postings.setdefault(value, {})[key] = None
+        self.__entries[key] = entry
+
+    def remove(self, key: str) -> None:
+        """
+        Remove the key from all indexes. A key which is not indexed is ignored.
+
+        @param key: The unique key of the issue.
+        @return: None
+        """
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return
+
+        for field, values in entry.items():
+            postings = self.__postings[field]
+            for value in values:
+                keys = postings[value]
+                del keys[key]
+                if not keys:
+                    del postings[value]
+
+    def lookup(self, conditions: dict[str, str]) -> list[str]:
+        """
+        Find the keys of issues matching all conditions by intersecting the postings, starting with the smallest.
+
+        @param conditions: Indexed field names mapped to the required values.
+        @return: The matching keys.
+        @raises ValueError: If a condition refers to a field which is not indexed.
+        """
+        postings = []
+        for field, value in conditions.items():
+            if field not in self.__postings:
+                raise ValueError(f"Field '{field}' is not indexed.")
+            postings.append(self.__postings[field].get(value, {}))
+
+        if not postings:
+            return list(self.__entries)
+
+        postings.sort(key=len)
+        smallest, others = postings[0], postings[1:]
+        return [key for key in smallest if all(key in other for other in others)]
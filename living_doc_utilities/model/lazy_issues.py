@@ -0,0 +1,193 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the LazyIssues class, which deserializes issues from a snapshot file on demand.
+"""
+
+import json
+import logging
+import mmap
+import re
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Iterator, Optional
+
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.serde.compression import is_compressed
+
+logger = logging.getLogger(__name__)
+
+# Matches the key embedded at the start of every record written by Issues.to_jsonl_record.
+KEY_PATTERN = re.compile(rb'\{"key":\s*"((?:[^"\\]|\\.)*)"')
+
+
+class LazyIssues(Issues):
+    """
+    A collection of issues backed by a memory-mapped JSON Lines snapshot.
+
+    Only a key to byte-offset index is built when the snapshot is opened. Issues are deserialized
+    when first accessed and cached afterward. The inherited load methods read the whole snapshot and return
+    a plain Issues object; open the snapshot with the constructor to load it lazily.
+    """
+
+    def __init__(
+        self, file_path: str | Path, project_states_included: bool = False, track_changes: bool = False
+    ) -> None:
+        if is_compressed(file_path):
+            raise ValueError(f"Compressed snapshot {file_path} cannot be memory-mapped. Decompress it first.")
+
+        super().__init__(project_states_included=project_states_included, track_changes=track_changes)
+        self.file_path: Path = Path(file_path)
+        self.__file: BinaryIO = open(self.file_path, "rb")  # pylint: disable=consider-using-with
+        self.__mmap: Optional[mmap.mmap] = None
+        self.__offsets: dict[str, tuple[int, int]] = {}
+
+        try:
+            if self.file_path.stat().st_size > 0:
+                self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.__offsets = self.__build_index(self.__mmap)
+        except Exception:
+            self.close()
+            raise
+
+        logger.debug("Indexed %d issues in %s.", len(self.__offsets), self.file_path)
+
+    @classmethod
+    def _from_issues(cls, issues: dict[str, Issue]) -> Issues:
+        # A lazy collection needs its snapshot file, so the inherited load methods return a plain one.
+        return Issues(issues)
+
+    def __enter__(self) -> "LazyIssues":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the memory map and the file handle of the snapshot.
+
+        Issues materialized before closing stay available.
+
+        @return: None
+        """
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        self.__file.close()
+
+    def remove_issue(self, key: str) -> None:
+        self.__offsets.pop(key, None)
+        self.issues.pop(key, None)
+        self._on_issue_removed(key)
+
+    def get_issue(self, key: str) -> Issue:
+        """
+        Get an issue by its unique key, deserializing it from the snapshot when accessed for the first time.
+
+        @param key: The unique key of the issue.
+        @return: The issue object associated with the key.
+        @raises KeyError: If the issue with the specified key does not exist.
+        """
+        if key not in self.issues and key in self.__offsets:
+            return self.__materialize(key)
+
+        return super().get_issue(key)
+
+    def all_issues(self) -> dict[str, Issue]:
+        """
+        Materialize all issues of the snapshot.
+
+        @return: Dictionary of all issues.
+        """
+        for _ in self.iter_issues():
+            pass
+        return self.issues
+
+    def iter_issues(self) -> Iterator[tuple[str, Issue]]:
+        """
+        Iterate over the issues in snapshot order, deserializing each one when it is reached.
+
+        Issues added after opening the snapshot are yielded at the end.
+
+        @return: Iterator of (key, issue) pairs.
+        """
+        for key in self.__offsets:
+            yield key, self.issues[key] if key in self.issues else self.__materialize(key)
+
+        for key, issue in list(self.issues.items()):
+            if key not in self.__offsets:
+                yield key, issue
+
+    def count(self) -> int:
+        return len(self.__offsets) + sum(1 for key in self.issues if key not in self.__offsets)
+
+    def is_materialized(self, key: str) -> bool:
+        """
+        Check whether the issue has already been deserialized.
+
+        @param key: The unique key of the issue.
+        @return: True if the issue is held in memory, False otherwise.
+        """
+        return key in self.issues
+
+    def __materialize(self, key: str) -> Issue:
+        if self.__mmap is None:
+            raise ValueError(f"Snapshot {self.file_path} is closed.")
+
+        start, end = self.__offsets[key]
+        _, issue = self.from_jsonl_record(self.__mmap[start:end])
+        self.issues[key] = issue
+        return issue
+
+    def __build_index(self, data: mmap.mmap) -> dict[str, tuple[int, int]]:
+        offsets: dict[str, tuple[int, int]] = {}
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+
+            key = self.__read_key(data, start, end)
+            if key is not None:
+                offsets[key] = (start, end)
+
+            start = end + 1
+
+        return offsets
+
+    def __read_key(self, data: mmap.mmap, start: int, end: int) -> Optional[str]:
+        match = KEY_PATTERN.match(data, start, end)
+        if match:
+            raw_key = match.group(1)
+            return json.loads(b'"' + raw_key + b'"') if b"\\" in raw_key else raw_key.decode("utf-8")
+
+        # Records produced by other writers may order the fields differently.
+        record = data[start:end]
+        if not record.strip():
+            return None
+        key = json.loads(record).get(self.KEY)
+        if not isinstance(key, str):
+            raise ValueError(f"Issue key is missing in record at byte offset {start} of {self.file_path}.")
+        return key
@@ -18,6 +18,9 @@
 This module contains a data container for an issue's Project Status.
 """
 
+import sys
+from typing import Optional
+
 from living_doc_utilities.constants import NO_PROJECT_DATA
 
 
@@ -26,14 +29,27 @@ class ProjectStatus:
     """
     A class representing the project status of an issue is responsible for access
     and change project issue status specifics.
+
+    Shared instances, created by `from_dict(data, shared=True)`, are frozen and raise AttributeError on change.
     """
 
+    __slots__ = ("__project_title", "__status", "__priority", "__size", "__moscow", "__frozen")
+
+    # shared frozen instances keyed by their field values
+    __shared: dict[tuple[str, str, str, str, str], "ProjectStatus"] = {}
+
     def __init__(self):
         self.__project_title: str = NO_PROJECT_DATA
         self.__status: str = NO_PROJECT_DATA
         self.__priority: str = NO_PROJECT_DATA
         self.__size: str = NO_PROJECT_DATA
         self.__moscow: str = NO_PROJECT_DATA
+        self.__frozen: bool = False
+
+    @property
+    def frozen(self) -> bool:
+        """Getter of the flag telling whether the project status is shared and cannot be changed."""
+        return self.__frozen
 
     @property
     def project_title(self) -> str:
@@ -42,6 +58,7 @@ class ProjectStatus:
 
     @project_title.setter
     def project_title(self, value: str):
+        self.__check_mutable()
         self.__project_title = value
 
     @property
@@ -51,6 +68,7 @@ class ProjectStatus:
 
     @status.setter
     def status(self, value: str):
+        self.__check_mutable()
         self.__status = value
 
     @property
@@ -60,6 +78,7 @@ class ProjectStatus:
 
     @priority.setter
     def priority(self, value: str):
+        self.__check_mutable()
         self.__priority = value
 
     @property
@@ -69,6 +88,7 @@ class ProjectStatus:
 
     @size.setter
     def size(self, value: str):
+        self.__check_mutable()
         self.__size = value
 
     @property
@@ -78,6 +98,7 @@ class ProjectStatus:
 
     @moscow.setter
     def moscow(self, value: str):
+        self.__check_mutable()
         self.__moscow = value
 
     def to_dict(self) -> dict:
@@ -93,15 +114,46 @@ class ProjectStatus:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "ProjectStatus":
+    def from_dict(cls, data: dict, shared: bool = False) -> "ProjectStatus":
         """
         Populates the ProjectStatus object from a dictionary.
+
+        @param data: Dictionary representation of the project status.
+        @param shared: If True, return a frozen instance shared by all project statuses with the same values.
+        @return: ProjectStatus object.
         """
+        values = (
+            cls.__intern(data.get("project_title", NO_PROJECT_DATA)),
+            cls.__intern(data.get("status", NO_PROJECT_DATA)),
+            cls.__intern(data.get("priority", NO_PROJECT_DATA)),
+            cls.__intern(data.get("size", NO_PROJECT_DATA)),
+            cls.__intern(data.get("moscow", NO_PROJECT_DATA)),
+        )
+        res: Optional[ProjectStatus] = cls.__shared.get(values) if shared else None
+        if res is not None:
+            return res
+
         res = ProjectStatus()
-        res.project_title = data.get("project_title", NO_PROJECT_DATA)
-        res.status = data.get("status", NO_PROJECT_DATA)
-        res.priority = data.get("priority", NO_PROJECT_DATA)
-        res.size = data.get("size", NO_PROJECT_DATA)
-        res.moscow = data.get("moscow", NO_PROJECT_DATA)
+        res.project_title, res.status, res.priority, res.size, res.moscow = values
+        if shared:
+            res.__frozen = True  # pylint: disable=unused-private-member
+            cls.__shared[values] = res
 
         return res
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """
+        Drop the cache of shared project statuses. Already returned instances stay frozen.
+
+        @return: None
+        """
+        cls.__shared.clear()
+
+    def __check_mutable(self) -> None:
+        if self.__frozen:
+            raise AttributeError("Shared ProjectStatus is frozen and cannot be changed.")
+
+    @staticmethod
+    def __intern(value):
+        return sys.intern(value) if isinstance(value, str) else value
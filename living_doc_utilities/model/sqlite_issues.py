@@ -0,0 +1,322 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the SQLiteIssues class, which keeps issues in an SQLite database instead of memory.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Optional
+
+from living_doc_utilities.factory.issue_factory import IssueFactory
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.project_status import ProjectStatus
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    repository_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    state TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    closed_at TEXT,
+    html_url TEXT,
+    body TEXT,
+    labels TEXT NOT NULL,
+    linked_to_project INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS project_statuses (
+    issue_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    project_title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    size TEXT NOT NULL,
+    moscow TEXT NOT NULL,
+    PRIMARY KEY (issue_key, position)
+);
+CREATE INDEX IF NOT EXISTS issues_repository_id ON issues (repository_id);
+CREATE INDEX IF NOT EXISTS issues_state ON issues (state);
+CREATE INDEX IF NOT EXISTS issues_type ON issues (type);
+CREATE INDEX IF NOT EXISTS issues_updated_at ON issues (updated_at);
+CREATE INDEX IF NOT EXISTS project_statuses_status ON project_statuses (status);
+"""
+
+ISSUE_COLUMNS = (
+    "key, type, repository_id, title, issue_number, state, created_at, updated_at, closed_at, html_url, body, "
+    "labels, linked_to_project"
+)
+PROJECT_STATUS_COLUMNS = "issue_key, position, project_title, status, priority, size, moscow"
+
+
+class SQLiteIssues(Issues):
+    """
+    A collection of issues persisted in an SQLite database.
+
+    Issues are read from the database on every access, so memory use does not grow with the number of issues.
+    Iteration streams the issues ordered by their key. The in-memory `issues` dictionary is not used.
+    """
+
+    def __init__(
+        self,
+        database_path: str | Path = ":memory:",
+        project_states_included: bool = False,
+        track_changes: bool = False,
+    ) -> None:
+        super().__init__(project_states_included=project_states_included, track_changes=track_changes)
+        self.database_path: str = str(database_path)
+        self.__connection: sqlite3.Connection = sqlite3.connect(self.database_path)
+        self.__connection.executescript(SCHEMA)
+
+    @classmethod
+    def _from_issues(cls, issues: dict[str, Issue]) -> Issues:
+        # The inherited load methods keep the loaded issues in an in-memory database.
+        sqlite_issues = cls()
+        sqlite_issues.add_issues(issues.items())
+        return sqlite_issues
+
+    def __enter__(self) -> "SQLiteIssues":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+
+        @return: None
+        """
+        self.__connection.close()
+
+    def add_issue(self, key: str, issue: Issue) -> None:
+        self.add_issues([(key, issue)])
+
+    def add_issues(self, issues: Iterable[tuple[str, Issue]]) -> None:
+        """
+        Insert or replace several issues in a single transaction.
+
+        @param issues: Pairs of issue key and issue.
+        @return: None
+        """
+        # Only the keys of tracked changes are kept until the commit, so a bulk load is not held in memory.
+        tracked_keys: list[str] = []
+        with self.__connection:
+            for key, issue in issues:
+                self.__connection.execute("DELETE FROM project_statuses WHERE issue_key = ?", (key,))
+                self.__connection.execute(
+                    f"INSERT OR REPLACE INTO issues ({ISSUE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        issue.__class__.__name__,
+                        issue.repository_id,
+                        issue.title,
+                        issue.issue_number,
+                        issue.state,
+                        issue.created_at,
+                        issue.updated_at,
+                        issue.closed_at,
+                        issue.html_url,
+                        issue.body,
+                        json.dumps(issue.labels or [], ensure_ascii=False),
+                        int(bool(issue.linked_to_project)),
+                    ),
+                )
+                self.__connection.executemany(
+                    f"INSERT INTO project_statuses ({PROJECT_STATUS_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, position, ps.project_title, ps.status, ps.priority, ps.size, ps.moscow)
+                        for position, ps in enumerate(issue.project_statuses)
+                    ],
+                )
+                if self._pending_changes is not None:
+                    tracked_keys.append(key)
+
+        self._on_issues_stored(tracked_keys)
+
+    def enable_indexes(self) -> None:
+        """
+        Do nothing; query() uses the database indexes, so no in-memory indexes are built.
+
+        @return: None
+        """
+
+    def remove_issue(self, key: str) -> None:
+        with self.__connection:
+            self.__connection.execute("DELETE FROM project_statuses WHERE issue_key = ?", (key,))
+            self.__connection.execute("DELETE FROM issues WHERE key = ?", (key,))
+        self._on_issue_removed(key)
+
+    def get_issue(self, key: str) -> Issue:
+        """
+        Get an issue by its unique key.
+
+        @param key: The unique key of the issue.
+        @return: The issue object associated with the key.
+        @raises KeyError: If the issue with the specified key does not exist.
+        """
+        for _, issue in self.__select("WHERE key = ?", (key,)):
+            return issue
+
+        logger.error("Issue with key '%s' not found.", key)
+        raise KeyError(f"Issue with key '{key}' not found.")
+
+    def all_issues(self) -> dict[str, Issue]:
+        """
+        Read all issues into memory.
+
+        @return: Dictionary of all issues.
+        """
+        return dict(self.iter_issues())
+
+    def iter_issues(self) -> Iterator[tuple[str, Issue]]:
+        return self.__select()
+
+    def count(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    # pylint: disable=redefined-builtin
+    def query(
+        self,
+        *,
+        repository_id: Optional[str] = None,
+        type: Optional[str | type[Issue]] = None,
+        state: Optional[str] = None,
+        label: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> dict[str, Issue]:
+        """
+        Find the issues matching all given conditions, using the database indexes.
+
+        @param repository_id: Repository ID in the 'org/repo' format.
+        @param type: Issue class or its name, e.g. FeatureIssue; subclasses are not matched.
+        @param state: Issue state, e.g. 'open'.
+        @param label: Label the issue is tagged with.
+        @param status: Status of the issue in any of its projects.
+        @return: Dictionary of the matching issues.
+        """
+        issue_type = type if isinstance(type, str) or type is None else type.__name__
+        return dict(
+            self.filter_issues(
+                repository_id=repository_id, state=state, issue_type=issue_type, label=label, status=status
+            )
+        )
+
+    # pylint: disable=too-many-arguments
+    def filter_issues(
+        self,
+        repository_id: Optional[str] = None,
+        state: Optional[str] = None,
+        issue_type: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        *,
+        label: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Iterator[tuple[str, Issue]]:
+        """
+        Stream the issues matching all given conditions, using the database indexes.
+
+        @param repository_id: Repository ID in the 'org/repo' format.
+        @param state: Issue state, e.g. 'open'.
+        @param issue_type: Issue class name, e.g. 'FeatureIssue'.
+        @param updated_since: ISO 8601 timestamp; only issues updated at or after it are returned.
+        @param label: Label the issue is tagged with.
+        @param status: Status of the issue in any of its projects.
+        @return: Iterator of (key, issue) pairs ordered by key.
+        """
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        for column, operator, value in (
+            ("repository_id", "=", repository_id),
+            ("state", "=", state),
+            ("type", "=", issue_type),
+            ("updated_at", ">=", updated_since),
+        ):
+            if value is not None:
+                conditions.append(f"issues.{column} {operator} ?")
+                parameters.append(value)
+        if label is not None:
+            conditions.append("EXISTS (SELECT 1 FROM json_each(issues.labels) WHERE json_each.value = ?)")
+            parameters.append(label)
+        if status is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM project_statuses AS s WHERE s.issue_key = issues.key AND s.status = ?)"
+            )
+            parameters.append(status)
+
+        return self.__select(f"WHERE {' AND '.join(conditions)}" if conditions else "", tuple(parameters))
+
+    def __select(self, where: str = "", parameters: tuple = ()) -> Iterator[tuple[str, Issue]]:
+        # Both cursors are ordered by the issue key, so project statuses are merged in a single pass.
+        issue_rows = self.__connection.execute(f"SELECT {ISSUE_COLUMNS} FROM issues {where} ORDER BY key", parameters)
+        status_rows = self.__connection.execute(
+            f"SELECT {PROJECT_STATUS_COLUMNS} FROM project_statuses "
+            f"WHERE issue_key IN (SELECT key FROM issues {where}) ORDER BY issue_key, position",
+            parameters,
+        )
+
+        status_row = status_rows.fetchone()
+        for row in issue_rows:
+            key = row[0]
+            project_statuses: list[dict[str, str]] = []
+            while status_row is not None and status_row[0] <= key:
+                if status_row[0] == key:
+                    project_statuses.append(
+                        {
+                            "project_title": status_row[2],
+                            "status": status_row[3],
+                            "priority": status_row[4],
+                            "size": status_row[5],
+                            "moscow": status_row[6],
+                        }
+                    )
+                status_row = status_rows.fetchone()
+
+            yield key, self.__to_issue(row, project_statuses)
+
+    @staticmethod
+    def __to_issue(row: tuple, project_statuses: list[dict[str, str]]) -> Issue:
+        values: dict[str, Any] = {
+            Issue.REPOSITORY_ID: row[2],
+            Issue.TITLE: row[3],
+            Issue.ISSUE_NUMBER: row[4],
+            Issue.STATE: row[5],
+            Issue.CREATED_AT: row[6],
+            Issue.UPDATED_AT: row[7],
+            Issue.CLOSED_AT: row[8],
+            Issue.HTML_URL: row[9],
+            Issue.BODY: row[10],
+            Issue.LABELS: json.loads(row[11]),
+            Issue.LINKED_TO_PROJECT: bool(row[12]),
+        }
+        issue = IssueFactory.get(row[1], values)
+        issue.project_statuses = [ProjectStatus.from_dict(status) for status in project_statuses]
+        return issue
@@ -26,3 +26,5 @@ class UserStoryIssue(Issue):
     Represents a User Story Issue in the GitHub repository ecosystem.
     This specialized issue type allows for classification and type-specific handling of user story-related issues.
     """
+
+    __slots__ = ()
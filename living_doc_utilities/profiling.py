@@ -0,0 +1,131 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a method to profile an action run with cProfile and tracemalloc.
+"""
+
+import cProfile
+import logging
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from living_doc_utilities.constants import OUTPUT_PATH, PROFILE, ProfileMode
+from living_doc_utilities.github.utils import get_action_input
+
+logger = logging.getLogger(__name__)
+
+CPU_PROFILE_FILE = "profile.pstats"
+CPU_REPORT_FILE = "profile.txt"
+MEMORY_REPORT_FILE = "memory.txt"
+MEMORY_SNAPSHOT_FILE = "memory.snapshot"
+DEFAULT_TOP = 30
+# Frames stored per allocation; enough to tell the callers of the top allocations apart.
+TRACEMALLOC_FRAMES = 10
+
+
+@contextmanager
+def profiling(
+    mode: Optional[str] = None, output_path: str | Path = OUTPUT_PATH, top: int = DEFAULT_TOP
+) -> Iterator[None]:
+    """
+    Profile the block with cProfile and/or tracemalloc and write the reports into the output directory.
+
+    The mode is read from the `INPUT_PROFILE` environment variable if not given: 'cpu', 'memory' or 'all'.
+    Nothing is profiled if it is empty or not valid. The CPU profile is saved as `profile.pstats` with the top
+    functions by cumulative time in `profile.txt`; the memory profile as a tracemalloc `memory.snapshot` with
+    the top allocations by line in `memory.txt`. Can also be used as a decorator of the action's main function.
+
+    @param mode: The profilers to run: 'cpu', 'memory' or 'all'.
+    @param output_path: The directory of the reports.
+    @param top: The number of entries listed in the text reports.
+    @return: Context manager profiling the block.
+    """
+    value = (mode if mode is not None else get_action_input(PROFILE)).strip().lower()
+    if not value:
+        yield
+        return
+    try:
+        profile_mode = ProfileMode(value)
+    except ValueError:
+        logger.warning("Unknown profile mode '%s'. Expected one of: %s.", value, ", ".join(ProfileMode))
+        yield
+        return
+
+    output_dir = Path(output_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info("Profiling '%s' enabled. Reports are written to %s.", profile_mode, output_dir)
+
+    profiler: Optional[cProfile.Profile] = None
+    if profile_mode in (ProfileMode.CPU, ProfileMode.ALL):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            logger.warning("CPU profiling not available: %s.", e)
+            profiler = None
+
+    # Another tracer, e.g. of a test run, is left running.
+    started_tracemalloc = False
+    if profile_mode in (ProfileMode.MEMORY, ProfileMode.ALL) and not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        started_tracemalloc = True
+
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _save_cpu_profile(profiler, output_dir, top)
+        if profile_mode in (ProfileMode.MEMORY, ProfileMode.ALL) and tracemalloc.is_tracing():
+            _save_memory_profile(output_dir, top)
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+
+def _save_cpu_profile(profiler: cProfile.Profile, output_dir: Path, top: int) -> None:
+    profiler.dump_stats(output_dir / CPU_PROFILE_FILE)
+    with open(output_dir / CPU_REPORT_FILE, "w", encoding="utf-8") as f:
+        pstats.Stats(profiler, stream=f).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    logger.info("CPU profile saved to %s.", output_dir / CPU_PROFILE_FILE)
+
+
+def _save_memory_profile(output_dir: Path, top: int) -> None:
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    snapshot.dump(str(output_dir / MEMORY_SNAPSHOT_FILE))
+
+    with open(output_dir / MEMORY_REPORT_FILE, "w", encoding="utf-8") as f:
+        f.write(f"Current traced memory: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB\n\n")
+        f.write(f"Top {top} allocations by line:\n")
+        for index, statistic in enumerate(snapshot.statistics("lineno")[:top], start=1):
+            f.write(f"#{index}: {statistic}\n")
+
+        f.write(f"\nTop {min(top, 5)} allocations with their callers:\n")
+        for index, statistic in enumerate(snapshot.statistics("traceback")[: min(top, 5)], start=1):
+            f.write(f"#{index}: {statistic.size / 1024:.1f} KiB in {statistic.count} blocks\n")
+            for line in statistic.traceback.format(most_recent_first=True):
+                f.write(f"{line}\n")
+    logger.info("Memory profile saved to %s.", output_dir / MEMORY_REPORT_FILE)
@@ -0,0 +1,249 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the writer and reader of the compact binary issues snapshot format.
+
+Layout (little-endian):
+    prefix:   magic "LDIS", version u16, flags u16
+    bodies:   variable-length part of every record
+    records:  fixed-size record headers, one per issue
+    strings:  table of interned strings (repository ids, types, states, labels, project status values)
+    trailer:  string count u32, record count u32, records offset u64, strings offset u64, magic "LDIS"
+
+The trailer is written last, so the writer only needs a sequential (non-seekable) stream.
+"""
+
+import struct
+from typing import IO, Any, Iterator, Optional
+
+from living_doc_utilities.model.issue import Issue
+
+MAGIC = b"LDIS"
+VERSION = 1
+
+PREFIX = struct.Struct("<4sHH")
+TRAILER = struct.Struct("<IIQQ4s")
+# type, repository_id, state, issue_number, flags, labels count, project statuses count, body offset, body length
+# (all offsets are absolute positions in the snapshot)
+RECORD_HEADER = struct.Struct("<IIIIBxHHxxQI")
+LENGTH = struct.Struct("<I")
+
+NONE_MARKER = 0xFFFFFFFF
+LINKED_TO_PROJECT_FLAG = 0x01
+PROJECT_STATUS_FIELDS = ("project_title", "status", "priority", "size", "moscow")
+BODY_STRING_FIELDS = (
+    Issue.TITLE,
+    Issue.CREATED_AT,
+    Issue.UPDATED_AT,
+    Issue.CLOSED_AT,
+    Issue.HTML_URL,
+    Issue.BODY,
+)
+
+
+class BinarySnapshotWriter:
+    """
+    Sequentially writes issues into a binary snapshot stream.
+
+    Record bodies are written to the stream immediately; only the fixed-size headers
+    and the string table are kept in memory until finish() is called.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self.__stream: IO[bytes] = stream
+        self.__strings: dict[str, int] = {}
+        self.__headers = bytearray()
+        self.__record_count: int = 0
+        self.__position: int = 0
+
+        self.__write(PREFIX.pack(MAGIC, VERSION, 0))
+
+    def write(self, key: str, issue: Issue) -> None:
+        """
+        Append one issue to the snapshot.
+
+        @param key: The unique key of the issue.
+        @param issue: The issue to write.
+        @return: None
+        """
+        data = issue.to_dict()
+        labels = data.get(Issue.LABELS, [])
+        project_statuses = data.get(Issue.PROJECT_STATUS, [])
+
+        body = bytearray()
+        self.__pack_text(body, key)
+        for field in BODY_STRING_FIELDS:
+            self.__pack_text(body, data.get(field))
+        for label in labels:
+            body += LENGTH.pack(self.__intern(label))
+        for project_status in project_statuses:
+            for field in PROJECT_STATUS_FIELDS:
+                body += LENGTH.pack(self.__intern(project_status[field]))
+
+        flags = LINKED_TO_PROJECT_FLAG if data.get(Issue.LINKED_TO_PROJECT) else 0
+        self.__headers += RECORD_HEADER.pack(
+            self.__intern(data[Issue.TYPE]),
+            self.__intern(data.get(Issue.REPOSITORY_ID)),
+            self.__intern(data.get(Issue.STATE)),
+            data.get(Issue.ISSUE_NUMBER, 0),
+            flags,
+            len(labels),
+            len(project_statuses),
+            self.__position,
+            len(body),
+        )
+        self.__write(body)
+        self.__record_count += 1
+
+    def finish(self) -> None:
+        """
+        Write the record headers, the string table and the trailer.
+
+        @return: None
+        """
+        records_offset = self.__position
+        self.__write(self.__headers)
+
+        strings_offset = self.__position
+        encoded = [value.encode("utf-8") for value in self.__strings]
+        end = 0
+        for value in encoded:
+            end += len(value)
+            self.__write(LENGTH.pack(end))
+        for value in encoded:
+            self.__write(value)
+
+        self.__write(TRAILER.pack(len(encoded), self.__record_count, records_offset, strings_offset, MAGIC))
+
+    def __intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE_MARKER
+        return self.__strings.setdefault(value, len(self.__strings))
+
+    def __write(self, data: bytes | bytearray) -> None:
+        self.__stream.write(data)
+        self.__position += len(data)
+
+    @staticmethod
+    def __pack_text(buffer: bytearray, value: Optional[str]) -> None:
+        if value is None:
+            buffer += LENGTH.pack(NONE_MARKER)
+            return
+        encoded = value.encode("utf-8")
+        buffer += LENGTH.pack(len(encoded))
+        buffer += encoded
+
+
+class BinarySnapshotReader:
+    """
+    Reads issue records from a binary snapshot held in a buffer, e.g. a memory-mapped file.
+
+    Fields are decoded directly from the buffer; interned strings are decoded once and reused.
+    """
+
+    def __init__(self, buffer: memoryview):
+        self.__buffer: memoryview = buffer
+
+        if len(buffer) < PREFIX.size + TRAILER.size:
+            raise ValueError("Binary snapshot is truncated.")
+        magic, version, _ = PREFIX.unpack_from(buffer, 0)
+        string_count, record_count, records_offset, strings_offset, trailer_magic = TRAILER.unpack_from(
+            buffer, len(buffer) - TRAILER.size
+        )
+        if magic != MAGIC or trailer_magic != MAGIC:
+            raise ValueError("Not a binary issues snapshot.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary snapshot version: {version}.")
+
+        self.__record_count: int = record_count
+        self.__records_offset: int = records_offset
+        self.__string_ends_offset: int = strings_offset
+        self.__string_data_offset: int = strings_offset + string_count * LENGTH.size
+        self.__strings: list[Optional[str]] = [None] * string_count
+
+    def __len__(self) -> int:
+        return self.__record_count
+
+    # pylint: disable=too-many-locals
+    def read(self, index: int) -> tuple[str, dict[str, Any]]:
+        """
+        Decode one record into its key and the dictionary representation of the issue.
+
+        @param index: Position of the record in the snapshot.
+        @return: Tuple of the issue key and the issue data as produced by Issue.to_dict.
+        @raises IndexError: If the index is out of range.
+        """
+        if not 0 <= index < self.__record_count:
+            raise IndexError(f"Record index {index} out of range.")
+
+        header = RECORD_HEADER.unpack_from(self.__buffer, self.__records_offset + index * RECORD_HEADER.size)
+        type_index, repository_index, state_index, issue_number, flags, labels_count, statuses_count, position, _ = (
+            header
+        )
+
+        key, position = self.__read_text(position)
+        data: dict[str, Any] = {Issue.TYPE: self.__string(type_index)}
+        if repository_index != NONE_MARKER:
+            data[Issue.REPOSITORY_ID] = self.__string(repository_index)
+        if issue_number:
+            data[Issue.ISSUE_NUMBER] = issue_number
+        if state_index != NONE_MARKER:
+            data[Issue.STATE] = self.__string(state_index)
+
+        for field in BODY_STRING_FIELDS:
+            value, position = self.__read_text(position)
+            if value is not None:
+                data[field] = value
+
+        if labels_count:
+            indexes = struct.unpack_from(f"<{labels_count}I", self.__buffer, position)
+            data[Issue.LABELS] = [self.__string(i) for i in indexes]
+            position += labels_count * LENGTH.size
+        if statuses_count:
+            indexes = struct.unpack_from(f"<{statuses_count * len(PROJECT_STATUS_FIELDS)}I", self.__buffer, position)
+            data[Issue.PROJECT_STATUS] = [
+                {field: self.__string(indexes[i + j]) for j, field in enumerate(PROJECT_STATUS_FIELDS)}
+                for i in range(0, len(indexes), len(PROJECT_STATUS_FIELDS))
+            ]
+
+        data[Issue.LINKED_TO_PROJECT] = bool(flags & LINKED_TO_PROJECT_FLAG)
+        return key or "", data
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        for index in range(self.__record_count):
+            yield self.read(index)
+
+    def __read_text(self, position: int) -> tuple[Optional[str], int]:
+        (length,) = LENGTH.unpack_from(self.__buffer, position)
+        position += LENGTH.size
+        if length == NONE_MARKER:
+            return None, position
+        return str(self.__buffer[position : position + length], "utf-8"), position + length
+
+    def __string(self, index: int) -> Optional[str]:
+        if index == NONE_MARKER:
+            return None
+        value = self.__strings[index]
+        if value is None:
+            start = 0
+            if index > 0:
+                (start,) = LENGTH.unpack_from(self.__buffer, self.__string_ends_offset + (index - 1) * LENGTH.size)
+            (end,) = LENGTH.unpack_from(self.__buffer, self.__string_ends_offset + index * LENGTH.size)
+            offset = self.__string_data_offset
+            value = str(self.__buffer[offset + start : offset + end], "utf-8")
+            self.__strings[index] = value
+        return value
@@ -0,0 +1,71 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a helper for opening snapshot files with transparent compression.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Any, Optional, cast
+
+GZIP_SUFFIX = ".gz"
+XZ_SUFFIX = ".xz"
+BZ2_SUFFIX = ".bz2"
+COMPRESSED_SUFFIXES = (GZIP_SUFFIX, XZ_SUFFIX, BZ2_SUFFIX)
+
+
+def is_compressed(file_path: str | Path) -> bool:
+    """
+    Check whether the file is compressed, based on its extension.
+
+    @param file_path: Path to the file.
+    @return: True if the extension is one of .gz, .xz or .bz2, False otherwise.
+    """
+    return Path(file_path).suffix.lower() in COMPRESSED_SUFFIXES
+
+
+def open_snapshot(file_path: str | Path, mode: str, compression_level: Optional[int] = None) -> IO[Any]:
+    """
+    Open a snapshot file, compressing or decompressing it on the fly when the extension requires so.
+
+    Data is streamed through the codec, so the whole (de)compressed content is never held in memory.
+
+    @param file_path: Path to the file. The .gz, .xz and .bz2 extensions select the matching stdlib codec.
+    @param mode: One of 'r', 'w', 'a' optionally followed by 'b' for binary access; text access uses UTF-8.
+    @param compression_level: Codec specific compression level (xz preset); the codec default if not set.
+        Ignored for uncompressed files and when reading.
+    @return: The opened file object.
+    """
+    binary = "b" in mode
+    mode = mode.replace("b", "").replace("t", "") + ("b" if binary else "t")
+    encoding = None if binary else "utf-8"
+    writing = mode[0] in ("w", "a")
+
+    suffix = Path(file_path).suffix.lower()
+    if suffix == GZIP_SUFFIX:
+        level = compression_level if writing and compression_level is not None else 9
+        return cast(IO[Any], gzip.open(file_path, mode, compresslevel=level, encoding=encoding))
+    if suffix == XZ_SUFFIX:
+        return lzma.open(file_path, mode, preset=compression_level if writing else None, encoding=encoding)
+    if suffix == BZ2_SUFFIX:
+        level = compression_level if writing and compression_level is not None else 9
+        return bz2.open(file_path, mode, compresslevel=level, encoding=encoding)
+
+    # pylint: disable=consider-using-with
+    return open(file_path, mode, encoding=encoding)
@@ -0,0 +1,145 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssuesDeltaLog class, an append-only log of changes made to an issues snapshot.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from living_doc_utilities.factory.issue_factory import IssueFactory
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.serde.compression import is_compressed
+
+logger = logging.getLogger(__name__)
+
+
+class IssuesDeltaLog:
+    """
+    An append-only JSON Lines log of upserted and deleted issues, keyed by the issue key.
+
+    A deleted issue is represented by None. The log is kept uncompressed: an interrupted append would leave a
+    truncated compressed frame, which makes the whole stream unreadable, while a truncated line can be dropped.
+    """
+
+    OP = "op"
+    KEY = "key"
+    ISSUE = "issue"
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+    def __init__(self, file_path: str | Path):
+        if is_compressed(file_path):
+            raise ValueError(f"Delta log {file_path} must not be compressed.")
+        self.file_path: Path = Path(file_path)
+
+    def append(self, changes: Iterable[tuple[str, Optional[Issue]]]) -> int:
+        """
+        Append change records to the end of the log.
+
+        @param changes: Pairs of issue key and the new issue state, or None for a deleted issue.
+        @return: The number of appended records.
+        """
+        self.__discard_incomplete_record()
+
+        count = 0
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            for key, issue in changes:
+                record: dict[str, Any]
+                if issue is None:
+                    record = {self.OP: self.DELETE, self.KEY: key}
+                else:
+                    record = {self.OP: self.UPSERT, self.KEY: key, self.ISSUE: issue.to_dict()}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+
+        logger.debug("Appended %d change records to %s.", count, self.file_path)
+        return count
+
+    def iter_changes(self) -> Iterator[tuple[str, Optional[Issue]]]:
+        """
+        Read the change records in the order they were appended.
+
+        A missing log is treated as empty. An incomplete last record, left by an interrupted write, is skipped.
+
+        @return: Iterator of pairs of issue key and the new issue state, or None for a deleted issue.
+        @raises ValueError: If a record other than the last one is malformed.
+        """
+        if not self.file_path.exists():
+            return
+
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    if not line.endswith("\n"):
+                        logger.warning("Skipping incomplete last record of %s.", self.file_path)
+                        return
+                    raise ValueError(f"Malformed record at line {line_number} of {self.file_path}.") from e
+
+                yield self.__parse(record, line_number)
+
+    def clear(self) -> None:
+        """
+        Remove the log file.
+
+        @return: None
+        """
+        if self.file_path.exists():
+            os.remove(self.file_path)
+
+    def __discard_incomplete_record(self) -> None:
+        # A record left unterminated by an interrupted write would be merged with the next appended one.
+        if not self.file_path.exists():
+            return
+
+        with open(self.file_path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+
+            if position != end:
+                logger.warning("Discarding incomplete last record of %s.", self.file_path)
+                f.truncate(position)
+
+    def __parse(self, record: dict, line_number: int) -> tuple[str, Optional[Issue]]:
+        key = record.get(self.KEY)
+        op = record.get(self.OP)
+        if not isinstance(key, str):
+            raise ValueError(f"Missing issue key at line {line_number} of {self.file_path}.")
+
+        if op == self.DELETE:
+            return key, None
+        if op == self.UPSERT and isinstance(record.get(self.ISSUE), dict):
+            values = record[self.ISSUE]
+            return key, IssueFactory.get(values.get("type"), values)
+
+        raise ValueError(f"Unknown change record at line {line_number} of {self.file_path}.")
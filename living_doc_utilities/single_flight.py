@@ -0,0 +1,158 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the SingleFlight class, which coalesces concurrent identical calls into one.
+"""
+
+import inspect
+import logging
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods
+class InFlightCall:
+    """
+    A call running on behalf of all callers waiting for the same key.
+    """
+
+    def __init__(self) -> None:
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the call, the others wait for it and share
+    its result or error.
+
+    With a TTL, a result is also memoized for that many seconds after the call finishes. None results, returned by
+    safe-called methods on failure, are not memoized.
+
+    Used as a decorator, the key is the method together with its arguments, which must be hashable; calls with
+    unhashable arguments are not coalesced. Bound methods of different objects, e.g. `get_issues` of two
+    repositories, are told apart by the identity of their object, also through other decorators. Apply it on top
+    of `safe_call_decorator`, so one rate-limited call serves all callers.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        if ttl < 0:
+            raise ValueError("TTL must not be negative.")
+        self.ttl: float = ttl
+        self.shared: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        self.__calls: dict[Hashable, InFlightCall] = {}
+        # results memoized with their expiration time
+        self.__memo: dict[Hashable, tuple[float, Any]] = {}
+        self.__purged_at: float = time.monotonic()
+
+    def __call__(self, method: Callable) -> Callable:
+        """
+        Wraps the method so concurrent calls with the same arguments share one underlying call.
+
+        @param method: The method to wrap.
+        @return: The wrapped method.
+        """
+
+        # Decorators copy the name of the method, but not the object it is bound to.
+        owner = id(getattr(inspect.unwrap(method), "__self__", None))
+
+        @wraps(method)
+        def wrapped(*args, **kwargs) -> Optional[Any]:
+            key = (method.__module__, method.__qualname__, owner, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)
+            return self.do(key, method, *args, **kwargs)
+
+        return wrapped
+
+    def do(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        """
+        Call the function, unless a call with the same key is in flight or memoized; then share its outcome.
+
+        @param key: The key identifying identical calls.
+        @param function: The function to call.
+        @param args: Positional arguments of the function.
+        @param kwargs: Keyword arguments of the function.
+        @return: The result of the function.
+        @raises BaseException: The error raised by the shared call.
+        """
+        with self.__lock:
+            memoized = self.__memo.get(key)
+            if memoized is not None and memoized[0] > time.monotonic():
+                self.shared += 1
+                return memoized[1]
+
+            call = self.__calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self.__calls[key] = InFlightCall()
+            else:
+                self.shared += 1
+
+        if not leader:
+            logger.debug("Waiting for the in-flight call of %s.", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+                if self.ttl > 0 and call.error is None and call.result is not None:
+                    self.__memoize(key, call.result)
+            call.done.set()
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Drop the memoized result of the key, if any.
+
+        @param key: The key identifying identical calls.
+        @return: None
+        """
+        with self.__lock:
+            self.__memo.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all memoized results.
+
+        @return: None
+        """
+        with self.__lock:
+            self.__memo.clear()
+
+    def __memoize(self, key: Hashable, result: Any) -> None:
+        now = time.monotonic()
+        if now - self.__purged_at >= self.ttl:
+            self.__memo = {k: memoized for k, memoized in self.__memo.items() if memoized[0] > now}
+            self.__purged_at = now
+        self.__memo[key] = (now + self.ttl, result)
@@ -0,0 +1,257 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a lightweight tracer recording nested spans of work, exportable to the Chrome trace format.
+"""
+
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SPANS = 1_000_000
+
+# The span open in the current thread or task, the parent of the next span.
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+# pylint: disable=too-many-instance-attributes
+class Span:
+    """
+    A timed piece of work with attributes, used as a context manager. An error raising out of the span is recorded
+    as its `error` attribute.
+    """
+
+    __slots__ = ("name", "category", "attributes", "parent", "thread_id", "start", "end", "__tracer", "__token")
+
+    def __init__(self, owner: "Tracer", name: str, category: str, attributes: dict[str, Any]):
+        self.name: str = name
+        self.category: str = category
+        self.attributes: dict[str, Any] = attributes
+        self.parent: Optional[Span] = None
+        self.thread_id: int = 0
+        self.start: int = 0
+        self.end: int = 0
+        self.__tracer: Tracer = owner
+        self.__token: Optional[Token] = None
+
+    @property
+    def duration(self) -> float:
+        """Getter of the span duration in seconds."""
+        return (self.end - self.start) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute of the span.
+
+        @param key: The attribute name.
+        @param value: The attribute value, JSON serializable.
+        @return: None
+        """
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.parent = _current_span.get()
+        self.__token = _current_span.set(self)
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.end = time.perf_counter_ns()
+        if self.__token is not None:
+            _current_span.reset(self.__token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.__tracer.record(self)
+
+
+class NullSpan:
+    """
+    The span returned by a disabled tracer, doing nothing.
+    """
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Ignore the attribute.
+
+        @param key: The attribute name.
+        @param value: The attribute value.
+        @return: None
+        """
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    """
+    A tracer collecting finished spans in memory.
+
+    A disabled tracer, the default, returns a span which does nothing, so traced code costs almost nothing.
+    Spans of one thread nest by their times; spans of asyncio tasks sharing a thread may overlap. At most
+    `max_spans` spans are kept, later ones are dropped and counted.
+    """
+
+    def __init__(self, enabled: bool = False, max_spans: int = DEFAULT_MAX_SPANS):
+        self.enabled: bool = enabled
+        self.max_spans: int = max_spans
+        self.dropped: int = 0
+        self.__spans: list[Span] = []
+        self.__thread_names: dict[int, str] = {}
+        self.__origin: int = time.perf_counter_ns()
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        """Getter of a copy of the finished spans, in order of finishing."""
+        with self.__lock:
+            return list(self.__spans)
+
+    def span(self, name: str, category: str = "", **attributes: Any) -> Span | NullSpan:
+        """
+        Create a span to be used as a context manager.
+
+        @param name: The span name.
+        @param category: The span category, e.g. 'rate_limit'.
+        @param attributes: Attributes of the span, JSON serializable.
+        @return: The span, a span doing nothing if the tracer is disabled.
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, attributes)
+
+    def record(self, span: Span) -> None:
+        """
+        Keep a finished span.
+
+        @param span: The finished span.
+        @return: None
+        """
+        with self.__lock:
+            if len(self.__spans) >= self.max_spans:
+                if self.dropped == 0:
+                    logger.warning("Tracer keeps at most %d spans. Dropping the later ones.", self.max_spans)
+                self.dropped += 1
+                return
+            self.__spans.append(span)
+            if span.thread_id not in self.__thread_names:
+                self.__thread_names[span.thread_id] = threading.current_thread().name
+
+    def clear(self) -> None:
+        """
+        Drop the recorded spans and restart the timeline.
+
+        @return: None
+        """
+        with self.__lock:
+            self.__spans.clear()
+            self.__thread_names.clear()
+            self.dropped = 0
+            self.__origin = time.perf_counter_ns()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert the recorded spans to Chrome trace events, viewable in chrome://tracing or Perfetto.
+
+        @return: The trace as a dictionary with the 'traceEvents' list.
+        """
+        pid = os.getpid()
+        with self.__lock:
+            events: list[dict[str, Any]] = [
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+                for thread_id, thread_name in self.__thread_names.items()
+            ]
+            events.extend(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start - self.__origin) / 1000,
+                    "dur": (span.end - span.start) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": span.attributes,
+                }
+                for span in self.__spans
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str | Path) -> None:
+        """
+        Save the recorded spans to a Chrome trace JSON file.
+
+        @param path: The path of the file.
+        @return: None
+        """
+        trace = self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, default=str)
+        # counted from the events taken under the lock, more spans may have finished meanwhile
+        spans = sum(1 for event in trace["traceEvents"] if event["ph"] == "X")
+        logger.info("Trace of %d spans saved to %s.", spans, path)
+
+
+# The tracer used across the project; enable it with `tracer.enabled = True`.
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None, category: str = "") -> Callable[[Callable], Callable]:
+    """
+    Decorator factory to record every call of a method as a span of the project tracer.
+
+    @param name: The span name, the qualified name of the method by default.
+    @param category: The span category.
+    @return: The decorator of functions or coroutine functions.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        span_name = name or method.__qualname__
+
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapped(*args, **kwargs) -> Optional[Any]:
+                with tracer.span(span_name, category):
+                    return await method(*args, **kwargs)
+
+            return async_wrapped
+
+        @wraps(method)
+        def wrapped(*args, **kwargs) -> Optional[Any]:
+            with tracer.span(span_name, category):
+                return method(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
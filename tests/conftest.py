@@ -20,6 +20,8 @@ from github import Github
 from github.Rate import Rate
 
 from living_doc_utilities.github.rate_limiter import GithubRateLimiter
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.project_status import ProjectStatus
 
 
 @pytest.fixture
@@ -32,7 +34,7 @@ def rate_limiter(mocker, request):
 @pytest.fixture
 def mock_rate_limiter(mocker):
     mock_rate = mocker.Mock(spec=Rate)
-    mock_rate.timestamp = mocker.Mock(return_value=time.time() + 3600)
+    mock_rate.reset.timestamp = mocker.Mock(return_value=time.time() + 3600)
     mock_rate.remaining = 10
     # Provide .rate attribute directly
     mock_rate_limit = mocker.Mock(spec=GithubRateLimiter)
@@ -45,3 +47,40 @@ def mock_rate_limiter(mocker):
 def mock_logging_setup(mocker):
     mock_log_config = mocker.patch("logging.basicConfig")
     yield mock_log_config
+
+
+@pytest.fixture
+def make_issue():
+    # pylint: disable=too-many-arguments
+    def factory(
+        cls=Issue,
+        repository_id="org/repo",
+        number=1,
+        title=None,
+        state="open",
+        body=None,
+        labels=None,
+        statuses=(),
+        updated_at=None,
+    ):
+        issue = cls()
+        issue.repository_id = repository_id
+        issue.title = title if title is not None else f"Issue {number}"
+        issue.issue_number = number
+        issue.state = state
+        if body is not None:
+            issue.body = body
+        if labels is not None:
+            issue.labels = list(labels)
+        if updated_at is not None:
+            issue.updated_at = updated_at
+        # one project status per given status value
+        for position, status in enumerate(statuses):
+            project_status = ProjectStatus()
+            project_status.project_title = f"Project {position}"
+            project_status.status = status
+            issue.project_statuses.append(project_status)
+        issue.linked_to_project = bool(statuses)
+        return issue
+
+    return factory
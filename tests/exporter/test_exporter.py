@@ -23,3 +23,14 @@ def test_exporter_export_not_implemented():
     with pytest.raises(NotImplementedError) as exc_info:
         exporter.export()
     assert "Subclasses should implement this method" in str(exc_info.value)
+
+
+def test_exporter_subclass_export_is_traced(mocker):
+    tracer = mocker.patch("living_doc_utilities.tracing.tracer")
+
+    class SampleExporter(Exporter):
+        def export(self, **kwargs) -> bool:
+            return kwargs["ok"]
+
+    assert SampleExporter().export(ok=True)
+    tracer.span.assert_called_once_with("test_exporter_subclass_export_is_traced.<locals>.SampleExporter.export", "export")
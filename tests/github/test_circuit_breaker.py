@@ -0,0 +1,163 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+from github import GithubException
+from requests import HTTPError, Response, Timeout
+
+from living_doc_utilities.constants import CircuitState
+from living_doc_utilities.github.circuit_breaker import CircuitBreaker
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        assert breaker.allow()
+        breaker.record(Timeout("timed out"))
+
+
+def test_breaker_opens_at_failure_rate():
+    # Arrange
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=10, minimum_calls=4)
+
+    # Act
+    for _ in range(2):
+        breaker.allow()
+        breaker.record()
+    _fail(breaker, 1)
+    closed_state = breaker.state
+    _fail(breaker, 1)
+
+    # Assert
+    assert closed_state == CircuitState.CLOSED
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+
+
+def test_breaker_needs_minimum_calls():
+    # Arrange
+    breaker = CircuitBreaker(minimum_calls=5)
+
+    # Act
+    _fail(breaker, 4)
+
+    # Assert
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_breaker_window_forgets_old_failures():
+    # Arrange
+    breaker = CircuitBreaker(failure_rate=0.5, window_size=4, minimum_calls=4)
+    _fail(breaker, 1)
+
+    # Act
+    for _ in range(4):
+        breaker.allow()
+        breaker.record()
+    _fail(breaker, 1)
+
+    # Assert
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_permanent_errors_are_not_failures():
+    # Arrange
+    breaker = CircuitBreaker(minimum_calls=1)
+
+    # Act
+    breaker.allow()
+    breaker.record(GithubException(404, {"message": "Not Found"}, None))
+
+    # Assert
+    assert breaker.state == CircuitState.CLOSED
+    assert CircuitBreaker.is_failure(GithubException(502, {}, None))
+    assert CircuitBreaker.is_failure(ConnectionError())
+    assert not CircuitBreaker.is_failure(ValueError())
+
+
+def test_requests_errors_classified_by_status():
+    # Arrange
+    server_error, not_found = Response(), Response()
+    server_error.status_code, not_found.status_code = 502, 404
+
+    # Act & Assert
+    assert CircuitBreaker.is_failure(HTTPError(response=server_error))
+    assert not CircuitBreaker.is_failure(HTTPError(response=not_found))
+    assert not CircuitBreaker.is_failure(HTTPError("no response"))
+
+
+def test_breaker_half_open_probe_closes(mocker):
+    # Arrange
+    mock_monotonic = mocker.patch("living_doc_utilities.github.circuit_breaker.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=30)
+    _fail(breaker, 1)
+
+    # Act
+    mock_monotonic.return_value = 129.0
+    still_open = breaker.allow()
+    mock_monotonic.return_value = 130.0
+    probe = breaker.allow()
+    second_probe = breaker.allow()
+    breaker.record()
+
+    # Assert
+    assert (still_open, probe, second_probe) == (False, True, False)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_failed_probe_opens_again(mocker):
+    # Arrange
+    mock_monotonic = mocker.patch("living_doc_utilities.github.circuit_breaker.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=30)
+    _fail(breaker, 1)
+    mock_monotonic.return_value = 130.0
+
+    # Act
+    _fail(breaker, 1)
+
+    # Assert
+    assert breaker.state == CircuitState.OPEN
+    mock_monotonic.return_value = 159.0
+    assert not breaker.allow()
+    mock_monotonic.return_value = 160.0
+    assert breaker.allow()
+
+
+def test_released_probe_can_be_retried(mocker):
+    # Arrange
+    mock_monotonic = mocker.patch("living_doc_utilities.github.circuit_breaker.time.monotonic", return_value=100.0)
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=30)
+    _fail(breaker, 1)
+    mock_monotonic.return_value = 130.0
+    breaker.allow()
+
+    # Act
+    breaker.release()
+
+    # Assert
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"failure_rate": 0}, {"failure_rate": 1.5}, {"window_size": 0}, {"half_open_calls": 0}, {"open_duration": -1}],
+)
+def test_invalid_breaker(kwargs):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
@@ -0,0 +1,271 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from living_doc_utilities.decorators import safe_call_decorator
+from living_doc_utilities.github.conditional_cache import ConditionalRequestCache
+
+
+class GithubStandIn(BaseHTTPRequestHandler):
+    """Local stand-in of the GitHub API answering conditional requests with 304 Not Modified."""
+
+    resources: dict = {}
+    requests_log: list = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        # Logged before responding, the client may read the log as soon as it has the response.
+        payload = self.resources.get(self.path)
+        if payload is None:
+            self.requests_log.append((self.path, 404))
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.requests_log.append((self.path, 304))
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.requests_log.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture
+def github_stand_in():
+    GithubStandIn.resources = {"/repos/org/repo/issues/1": {"number": 1, "title": "First"}}
+    GithubStandIn.requests_log = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GithubStandIn)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_revalidates_unchanged_resource(tmp_path, github_stand_in):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path)
+    url = f"{github_stand_in}/repos/org/repo/issues/1"
+
+    # Act
+    first = cache.get_json(url)
+    second = cache.get_json(url)
+
+    # Assert
+    assert first == second == {"number": 1, "title": "First"}
+    assert [status for _, status in GithubStandIn.requests_log] == [200, 304]
+    assert cache.fetched == 1
+    assert cache.revalidated == 1
+
+
+def test_get_fetches_changed_resource(tmp_path, github_stand_in):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path)
+    url = f"{github_stand_in}/repos/org/repo/issues/1"
+    cache.get_json(url)
+
+    # Act
+    GithubStandIn.resources["/repos/org/repo/issues/1"] = {"number": 1, "title": "Renamed"}
+    actual = cache.get_json(url)
+
+    # Assert
+    assert actual == {"number": 1, "title": "Renamed"}
+    assert [status for _, status in GithubStandIn.requests_log] == [200, 200]
+
+
+def test_cache_persists_on_disk(tmp_path, github_stand_in):
+    # Arrange
+    url = f"{github_stand_in}/repos/org/repo/issues/1"
+    with ConditionalRequestCache(tmp_path) as cache:
+        cache.get_json(url)
+
+    # Act
+    reopened = ConditionalRequestCache(tmp_path)
+    actual = reopened.get_json(url)
+
+    # Assert
+    assert actual["title"] == "First"
+    assert len(reopened) == 1
+    assert GithubStandIn.requests_log[-1][1] == 304
+
+
+def test_cache_evicts_least_recently_used(tmp_path, github_stand_in):
+    # Arrange
+    for number in (2, 3):
+        GithubStandIn.resources[f"/repos/org/repo/issues/{number}"] = {"number": number, "title": "Other"}
+    entry_size = len(json.dumps({"number": 1, "title": "First"}))
+    cache = ConditionalRequestCache(tmp_path, max_bytes=2 * entry_size)
+    urls = [f"{github_stand_in}/repos/org/repo/issues/{number}" for number in (1, 2, 3)]
+
+    # Act
+    cache.get(urls[0])
+    cache.get(urls[1])
+    cache.get(urls[0])  # the first entry is used again, the second one is least recently used
+    cache.get(urls[2])
+    GithubStandIn.requests_log.clear()
+    cache.get(urls[0])
+    cache.get(urls[1])
+
+    # Assert
+    assert len(cache) == 2
+    assert cache.size <= cache.max_bytes
+    assert [status for _, status in GithubStandIn.requests_log] == [304, 200]
+
+
+def test_index_written_in_batches(tmp_path, github_stand_in):
+    # Arrange
+    for number in (2, 3):
+        GithubStandIn.resources[f"/repos/org/repo/issues/{number}"] = {"number": number, "title": "Other"}
+    cache = ConditionalRequestCache(tmp_path)
+    cache.INDEX_FLUSH_CHANGES = 2
+    index_path = tmp_path / "index.json"
+
+    # Act
+    for number in (1, 2, 3):
+        cache.get(f"{github_stand_in}/repos/org/repo/issues/{number}")
+    indexed_before_close = len(json.loads(index_path.read_text(encoding="utf-8")))
+    cache.close()
+
+    # Assert
+    assert indexed_before_close == 2
+    assert len(json.loads(index_path.read_text(encoding="utf-8"))) == 3
+
+
+def test_unindexed_payloads_removed_on_open(tmp_path, github_stand_in):
+    # Arrange
+    ConditionalRequestCache(tmp_path).get(f"{github_stand_in}/repos/org/repo/issues/1")
+
+    # Act
+    reopened = ConditionalRequestCache(tmp_path)
+
+    # Assert
+    assert len(reopened) == 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_missing_payload_is_cache_miss(tmp_path, github_stand_in):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path)
+    url = f"{github_stand_in}/repos/org/repo/issues/1"
+    cache.get_json(url)
+    for path in tmp_path.iterdir():
+        path.unlink()
+
+    # Act
+    actual = cache.get_json(url)
+
+    # Assert
+    assert actual["title"] == "First"
+    assert [status for _, status in GithubStandIn.requests_log] == [200, 304, 200]
+    assert len(cache) == 1
+
+
+def test_get_error_with_safe_call_decorator(tmp_path, github_stand_in, rate_limiter, mocker):
+    # Arrange
+    mock_log_error = mocker.patch("living_doc_utilities.decorators.logger.error")
+    cache = ConditionalRequestCache(tmp_path)
+
+    @safe_call_decorator(rate_limiter)
+    def get_issue(number):
+        return cache.get_json(f"{github_stand_in}/repos/org/repo/issues/{number}")
+
+    # Act
+    found = get_issue(1)
+    missing = get_issue(404)
+
+    # Assert
+    assert found["number"] == 1
+    assert missing is None
+    assert isinstance(mock_log_error.call_args[0][2], requests.HTTPError)
+
+
+def test_revalidation_gives_rate_limit_token_back(tmp_path, github_stand_in, rate_limiter):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path, rate_limiter=rate_limiter)
+
+    @safe_call_decorator(rate_limiter)
+    def get_issue(number):
+        return cache.get_json(f"{github_stand_in}/repos/org/repo/issues/{number}")
+
+    # Act
+    for _ in range(3):
+        get_issue(1)
+
+    # Assert
+    assert [status for _, status in GithubStandIn.requests_log] == [200, 304, 304]
+    assert rate_limiter.remaining == 9
+
+
+def test_responses_not_shared_between_tokens(tmp_path, github_stand_in):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path)
+    url = f"{github_stand_in}/repos/org/repo/issues/1"
+
+    # Act
+    cache.get(url, {"Authorization": "token first"})
+    cache.get(url, {"Authorization": "token second"})
+    cache.get(url, {"Authorization": "token first"})
+    cache.flush()
+
+    # Assert
+    assert [status for _, status in GithubStandIn.requests_log] == [200, 200, 304]
+    assert len(cache) == 2
+    assert "token" not in (tmp_path / "index.json").read_text(encoding="utf-8")
+
+
+def test_invalid_index_starts_empty(tmp_path, mocker):
+    # Arrange
+    mock_log_warning = mocker.patch("living_doc_utilities.github.conditional_cache.logger.warning")
+    (tmp_path / "index.json").write_text("not json", encoding="utf-8")
+
+    # Act
+    cache = ConditionalRequestCache(tmp_path)
+
+    # Assert
+    assert len(cache) == 0
+    mock_log_warning.assert_called_once()
+
+
+def test_clear(tmp_path, github_stand_in):
+    # Arrange
+    cache = ConditionalRequestCache(tmp_path)
+    cache.get(f"{github_stand_in}/repos/org/repo/issues/1")
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert [path.name for path in tmp_path.iterdir()] == ["index.json"]
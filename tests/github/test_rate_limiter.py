@@ -14,7 +14,23 @@
 # limitations under the License.
 #
 
+import asyncio
+import threading
 import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from github import Github
+
+from living_doc_utilities.constants import RateLimitResource
+from living_doc_utilities.decorators import safe_call_decorator
+from living_doc_utilities.github.rate_limiter import (
+    AsyncGithubRateLimiter,
+    GithubRateLimiter,
+    PacingStrategy,
+    ThreadSafeGithubRateLimiter,
+)
 
 
 def test_exceeds_max_iterations(rate_limiter, mock_rate_limiter, mocker):
@@ -90,3 +106,685 @@ def test_rate_limiter_extended_sleep_remaining_1_negative_reset_time(mocker, rat
 
     method_mock.assert_called_once()
     mock_sleep.assert_called_once()
+
+
+# Local rate limit state
+
+
+class FakeClock:
+    """Fake replacement of the time module; sleeping advances the clock instantly."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeGithub:
+    """
+    Fake GitHub client counting rate limit API calls.
+
+    The cached rate limit headers follow the core quota once any request was made; a fresh client, created with
+    `headers=False`, calls the rate limit API when they are read, as PyGithub does. With a window, the core quota
+    is restored whenever the clock passes its reset time. A search quota, if given, is reported by the rate
+    limit API only. Every API call takes the latency on the clock.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        remaining=5000,
+        reset_time=None,
+        *,
+        headers=True,
+        limit=5000,
+        window=None,
+        search=None,
+        clock=time,
+        latency=0.0,
+        name=None,
+    ):
+        self.clock = clock
+        self.remaining = remaining
+        self.limit = limit
+        self.window = window
+        reset_time = reset_time if reset_time is not None else clock.time() + (window or 3600.0)
+        # whole milliseconds survive the round trip through datetime
+        self.reset_time = int(reset_time * 1000) / 1000
+        self.headers = headers
+        self.search = None
+        if search is not None:
+            self.search = SimpleNamespace(remaining=search, limit=30, reset=datetime.fromtimestamp(self.reset_time))
+        self.latency = latency
+        self.name = name
+        self.get_rate_limit_calls = 0
+        self.lock = threading.Lock()
+        self.requester = SimpleNamespace(auth=object())
+
+    @property
+    def rate_limiting(self):
+        if not self.headers:
+            self.get_rate_limit()
+        return self.remaining, self.limit
+
+    @property
+    def rate_limiting_resettime(self):
+        if not self.headers:
+            self.get_rate_limit()
+        return self.reset_time
+
+    def __roll_window(self):
+        if self.window is not None and self.clock.time() >= self.reset_time:
+            self.remaining = self.limit
+            self.reset_time = int((self.clock.time() + self.window) * 1000) / 1000
+
+    def get_rate_limit(self):
+        with self.lock:
+            self.get_rate_limit_calls += 1
+            self.headers = True
+            self.__roll_window()
+            reset = datetime.fromtimestamp(self.reset_time)
+            core = SimpleNamespace(remaining=self.remaining, limit=self.limit, reset=reset)
+            return SimpleNamespace(rate=core, resources=SimpleNamespace(core=core, search=self.search))
+
+    def call(self):
+        with self.lock:
+            self.__roll_window()
+            assert self.remaining > 0, "rate limit exceeded"
+            self.remaining -= 1
+            self.headers = True
+            if self.latency:
+                self.clock.sleep(self.latency)
+            return self.clock.time()
+
+    def get_user(self):
+        self.call()
+        return self.name
+
+
+def test_rate_limiter_uses_cached_headers(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600)
+    limiter = GithubRateLimiter(client)
+    method_mock = mocker.Mock(return_value="ok")
+    wrapped_method = limiter(method_mock)
+
+    # Act
+    results = [wrapped_method() for _ in range(100)]
+
+    # Assert
+    assert results == ["ok"] * 100
+    assert client.get_rate_limit_calls == 1
+    assert limiter.remaining == 900
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_without_headers_refreshes_only_when_stale(mocker):
+    # Arrange
+    mock_time = mocker.patch("living_doc_utilities.github.rate_limiter.time")
+    mock_time.time.return_value = 1000.0
+    client = FakeGithub(remaining=1000, reset_time=5000, headers=False)
+    limiter = GithubRateLimiter(client, refresh_interval=60)
+    wrapped_method = limiter(mocker.Mock())
+
+    # Act
+    for _ in range(10):
+        wrapped_method()
+    calls_within_interval = client.get_rate_limit_calls
+    mock_time.time.return_value = 1061.0
+    wrapped_method()
+
+    # Assert
+    assert calls_within_interval == 1
+    assert client.get_rate_limit_calls == 2
+    assert limiter.remaining == 999
+    mock_time.sleep.assert_not_called()
+
+
+def test_rate_limiter_fresh_client_reads_rate_limit_api_once(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, headers=False)
+    limiter = GithubRateLimiter(client)
+    wrapped_get_user = limiter(client.get_user)
+
+    # Act
+    for _ in range(3):
+        wrapped_get_user()
+
+    # Assert
+    assert client.get_rate_limit_calls == 1
+    assert limiter.remaining == 997
+    assert client.remaining == 997
+
+
+def test_rate_limiter_counts_calls_not_yet_reflected_in_headers(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=100, reset_time=time.time() + 3600)
+    limiter = GithubRateLimiter(client)
+    wrapped_method = limiter(mocker.Mock())
+
+    # Act
+    for _ in range(3):
+        wrapped_method()
+
+    # Assert
+    assert limiter.remaining == 97
+    assert client.get_rate_limit_calls == 1
+
+
+def test_rate_limiter_confirms_exhaustion_with_api(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=3, reset_time=time.time() + 3600)
+    limiter = GithubRateLimiter(client)
+    method_mock = mocker.Mock()
+    wrapped_method = limiter(method_mock)
+
+    # Act
+    wrapped_method()
+
+    # Assert
+    assert client.get_rate_limit_calls == 1
+    mock_sleep.assert_called_once()
+    method_mock.assert_called_once()
+    assert limiter.remaining is None
+
+
+def test_rate_limiter_new_window_in_headers_replaces_state(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=10, reset_time=time.time() + 60)
+    limiter = GithubRateLimiter(client)
+    wrapped_method = limiter(mocker.Mock())
+    wrapped_method()
+
+    # Act
+    client.remaining = 5000
+    client.reset_time += 3600
+    wrapped_method()
+
+    # Assert
+    assert limiter.remaining == 4999
+    assert limiter.reset_time == client.reset_time
+
+
+# ThreadSafeGithubRateLimiter
+
+
+def test_thread_safe_rate_limiter_does_not_overshoot():
+    # Arrange
+    client = FakeGithub(remaining=20, headers=False, limit=20, window=0.3)
+    first_reset_time = client.reset_time
+    limiter = ThreadSafeGithubRateLimiter(client)
+    limiter.RESET_BUFFER = 0
+    call_times = []
+    wrapped_method = limiter(lambda: call_times.append(client.call()))
+
+    # Act
+    threads = [threading.Thread(target=wrapped_method) for _ in range(30)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # Assert
+    assert len(call_times) == 30
+    # calls are allowed while at least THRESHOLD calls remain
+    assert sum(1 for call_time in call_times if call_time < first_reset_time) == 20 - GithubRateLimiter.THRESHOLD + 1
+
+
+def test_thread_safe_rate_limiter_with_safe_call_decorator(rate_limiter):
+    # Arrange
+    limiter = ThreadSafeGithubRateLimiter(rate_limiter.github_client)
+
+    @safe_call_decorator(limiter)
+    def sample_method(x, y):
+        return x + y
+
+    # Act
+    actual = sample_method(2, 3)
+
+    # Assert
+    assert 5 == actual
+    assert limiter.remaining == 9
+
+
+# Pacing
+
+
+def simulate(mocker, calls, pacing):
+    clock = FakeClock()
+    mocker.patch("living_doc_utilities.github.rate_limiter.time", clock)
+    client = FakeGithub(window=3600.0, clock=clock, latency=0.05)
+    call_times = []
+
+    def method():
+        client.call()
+        call_times.append(clock.time())
+
+    wrapped_method = GithubRateLimiter(client, pacing=pacing)(method)
+    start = clock.time()
+    for _ in range(calls):
+        wrapped_method()
+
+    gaps = [later - earlier for earlier, later in zip(call_times, call_times[1:])]
+    return clock.time() - start, max(gaps)
+
+
+def test_pacing_simulation_compared_to_cliff_sleep(mocker):
+    # Act
+    cliff_total, cliff_max_gap = simulate(mocker, 12000, pacing=None)
+    paced_total, paced_max_gap = simulate(mocker, 12000, pacing=PacingStrategy(reserve=5, burst=10))
+
+    # Assert
+    # Both finish within the third window; pacing never stalls, while the cliff sleep stops for most of a window.
+    assert 2 * 3600 < cliff_total < 3 * 3600
+    assert 2 * 3600 < paced_total < 3 * 3600
+    assert cliff_max_gap > 3000
+    assert paced_max_gap < 1
+
+
+def test_pacing_strategy_spreads_budget():
+    # Arrange
+    pacing = PacingStrategy(reserve=10, burst=0)
+
+    # Act
+    delays = [pacing.delay(110, 1100.0, 1000.0) for _ in range(3)]
+
+    # Assert
+    assert delays == [0.0, 1.0, 2.0]
+
+
+def test_pacing_strategy_allows_burst():
+    # Arrange
+    pacing = PacingStrategy(reserve=0, burst=2)
+
+    # Act
+    delays = [pacing.delay(100, 1100.0, 1000.0) for _ in range(4)]
+
+    # Assert
+    assert delays == [0.0, 0.0, 1.0, 2.0]
+
+
+@pytest.mark.parametrize("burst", [0, 1, 2, 10])
+def test_pacing_strategy_burst_boundary(burst):
+    # Arrange
+    pacing = PacingStrategy(reserve=0, burst=burst)
+
+    # Act
+    delays = [pacing.delay(1000, 2000.0, 1000.0) for _ in range(burst + 2)]
+
+    # Assert
+    # the first call always runs at once, so no burst and a burst of one are the same
+    assert delays.count(0.0) == max(burst, 1)
+    assert delays[max(burst, 1)] == 1.0
+
+
+def test_pacing_strategy_waits_for_reset_within_reserve():
+    # Arrange
+    pacing = PacingStrategy(reserve=10)
+
+    # Act
+    delay = pacing.delay(10, 1100.0, 1000.0)
+
+    # Assert
+    assert delay == 100.0
+
+
+def test_pacing_strategy_invalid_arguments():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        PacingStrategy(reserve=-1)
+
+
+# Per-resource buckets
+
+
+def test_rate_limiter_depleted_search_does_not_block_core(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 60, headers=False, search=2)
+    limiter = GithubRateLimiter(client)
+    core_method = limiter(mocker.Mock())
+    search_method = limiter(mocker.Mock(), resource="search")
+
+    # Act
+    core_method()
+    sleeps_after_core = mock_sleep.call_count
+    search_method()
+
+    # Assert
+    assert sleeps_after_core == 0
+    assert mock_sleep.call_count == 1
+    assert client.get_rate_limit_calls == 2
+    assert limiter.bucket("core").remaining == 999
+    assert limiter.bucket("search").limit == 30
+
+
+def test_rate_limiter_headers_applied_to_last_resource_only(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600, search=30)
+    limiter = GithubRateLimiter(client)
+    core_method = limiter(mocker.Mock())
+    search_method = limiter.for_resource(RateLimitResource.SEARCH)(mocker.Mock())
+
+    # Act
+    core_method()
+    search_method()
+    client.remaining = 29  # headers of the search response
+    core_method()
+
+    # Assert
+    assert limiter.bucket("search").remaining == 29
+    assert limiter.bucket("core").remaining == 998
+
+
+def test_rate_limiter_unknown_resource(rate_limiter):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        rate_limiter(lambda: None, resource="unknown")
+
+
+def test_safe_call_decorator_with_resource(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 60, headers=False, search=30)
+    limiter = ThreadSafeGithubRateLimiter(client)
+
+    @safe_call_decorator(limiter, resource="search")
+    def search(query):
+        return [query]
+
+    # Act
+    actual = search("is:issue")
+
+    # Assert
+    assert ["is:issue"] == actual
+    assert client.get_rate_limit_calls == 1
+    assert limiter.bucket("search").remaining == 29
+    assert limiter.bucket("core").remaining is None
+
+
+# Multi-token pool
+
+
+def test_pool_routes_to_client_with_most_budget(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    reset_time = time.time() + 3600
+    first = FakeGithub(remaining=10, reset_time=reset_time, name="first")
+    second = FakeGithub(remaining=12, reset_time=reset_time, name="second")
+    limiter = GithubRateLimiter([first, second])
+    get_user = limiter(first.get_user)
+
+    # Act
+    served_by = [get_user() for _ in range(12)]
+
+    # Assert
+    assert served_by[:2] == ["second", "second"]
+    assert first.remaining == second.remaining == GithubRateLimiter.THRESHOLD
+    mock_sleep.assert_not_called()
+
+
+class FakeRepository:
+    """Fake repository fetched through a client, holding a copy of its requester."""
+
+    def __init__(self, client):
+        self.client = client
+        self.requester = SimpleNamespace(auth=client.requester.auth)
+
+    def get_issues(self):
+        return self.client.get_user()
+
+
+def test_pool_charges_client_owning_repository(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    reset_time = time.time() + 3600
+    first = FakeGithub(remaining=10, reset_time=reset_time, name="first")
+    second = FakeGithub(remaining=1000, reset_time=reset_time, name="second")
+    limiter = GithubRateLimiter([first, second])
+    get_issues = limiter(FakeRepository(first).get_issues)
+
+    # Act
+    served_by = [get_issues() for _ in range(3)]
+
+    # Assert
+    assert served_by == ["first"] * 3
+    assert limiter.bucket(client_index=0).remaining == 7
+    assert limiter.bucket(client_index=1).remaining is None
+    assert second.remaining == 1000
+    mock_sleep.assert_not_called()
+
+
+def test_pool_warns_about_repository_of_foreign_client(mocker):
+    # Arrange
+    mock_warning = mocker.patch("living_doc_utilities.github.rate_limiter.logger.warning")
+    reset_time = time.time() + 3600
+    clients = [FakeGithub(remaining=100, reset_time=reset_time) for _ in range(2)]
+    limiter = GithubRateLimiter(clients)
+
+    # Act
+    limiter(FakeRepository(FakeGithub(remaining=100, reset_time=reset_time)).get_issues)
+
+    # Assert
+    mock_warning.assert_called_once()
+
+
+def test_pool_sleeps_only_when_all_clients_are_exhausted(mocker):
+    # Arrange
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    first = FakeGithub(remaining=3, reset_time=time.time() + 600, name="first")
+    second = FakeGithub(remaining=3, reset_time=time.time() + 60, name="second")
+    limiter = GithubRateLimiter([first, second])
+    get_user = limiter(second.get_user)
+
+    # Act
+    served_by = get_user()
+
+    # Assert
+    mock_sleep.assert_called_once()
+    assert mock_sleep.call_args[0][0] <= 60 + GithubRateLimiter.RESET_BUFFER
+    assert served_by == "second"
+
+
+def test_pool_exposes_selected_client(mocker):
+    # Arrange
+    reset_time = time.time() + 3600
+    first = FakeGithub(remaining=100, reset_time=reset_time, name="first")
+    second = FakeGithub(remaining=1000, reset_time=reset_time, name="second")
+    limiter = GithubRateLimiter([first, second])
+    wrapped_method = limiter(lambda: limiter.github_client.name)
+
+    # Act
+    served_by = wrapped_method()
+
+    # Assert
+    assert served_by == "second"
+    assert limiter.github_client is first
+    assert limiter.github_clients == (first, second)
+
+
+def test_pool_throughput_scales_with_clients(mocker):
+    # Arrange
+    clock = FakeClock()
+    mocker.patch("living_doc_utilities.github.rate_limiter.time", clock)
+    clients = [FakeGithub(window=3600.0, clock=clock, latency=0.05) for _ in range(3)]
+    limiter = GithubRateLimiter(clients)
+    wrapped_method = limiter(lambda: limiter.github_client.call())
+
+    # Act
+    for _ in range(12000):
+        wrapped_method()
+
+    # Assert
+    # a single client needs three windows for the same number of calls
+    assert clock.time() - 1_700_000_000.0 < 3600
+
+
+def test_from_tokens():
+    # Act
+    limiter = GithubRateLimiter.from_tokens(["token_1", "token_2"])
+
+    # Assert
+    assert len(limiter.github_clients) == 2
+    assert all(isinstance(client, Github) for client in limiter.github_clients)
+
+
+def test_rate_limiter_requires_client():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        GithubRateLimiter([])
+
+
+# AsyncGithubRateLimiter
+
+
+def test_async_rate_limiter_caps_concurrency(mocker):
+    # Arrange
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600)
+    limiter = AsyncGithubRateLimiter(client, max_concurrency=4)
+    in_flight = []
+    max_in_flight = []
+
+    async def fetch(number):
+        in_flight.append(number)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(number)
+        return number
+
+    wrapped_fetch = limiter(fetch)
+
+    async def run():
+        return await asyncio.gather(*(wrapped_fetch(number) for number in range(20)))
+
+    # Act
+    results = asyncio.run(run())
+
+    # Assert
+    assert results == list(range(20))
+    assert max(max_in_flight) == 4
+    assert limiter.remaining == 980
+    assert client.get_rate_limit_calls == 1
+
+
+def test_async_rate_limiter_sleeps_without_blocking(mocker):
+    # Arrange
+    mock_time_sleep = mocker.patch("time.sleep")
+    mock_async_sleep = mocker.patch("living_doc_utilities.github.rate_limiter.asyncio.sleep", new=mocker.AsyncMock())
+    client = FakeGithub(remaining=3, reset_time=time.time() + 60)
+    limiter = AsyncGithubRateLimiter(client)
+
+    async def fetch():
+        return "ok"
+
+    # Act
+    result = asyncio.run(limiter(fetch)())
+
+    # Assert
+    assert result == "ok"
+    mock_async_sleep.assert_awaited_once()
+    mock_time_sleep.assert_not_called()
+
+
+def test_async_rate_limiter_runs_blocking_callable_in_thread():
+    # Arrange
+    client = FakeGithub(remaining=100, reset_time=time.time() + 3600, name="client")
+    limiter = AsyncGithubRateLimiter(client)
+    wrapped_method = limiter(lambda: (threading.current_thread() is threading.main_thread(), limiter.github_client))
+
+    # Act
+    on_main_thread, selected_client = asyncio.run(wrapped_method())
+
+    # Assert
+    assert not on_main_thread
+    assert selected_client is client
+
+
+def test_async_rate_limiter_invalid_concurrency():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        AsyncGithubRateLimiter(FakeGithub(remaining=100, reset_time=time.time()), max_concurrency=0)
+
+
+def test_async_rate_limiter_reused_across_event_loops():
+    # Arrange
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600)
+    limiter = AsyncGithubRateLimiter(client, max_concurrency=2)
+
+    async def fetch(number):
+        await asyncio.sleep(0.001)
+        return number
+
+    wrapped_fetch = limiter(fetch)
+
+    async def run():
+        return await asyncio.gather(*(wrapped_fetch(number) for number in range(5)))
+
+    # Act
+    results = [asyncio.run(run()) for _ in range(2)]
+
+    # Assert
+    assert results == [list(range(5))] * 2
+    assert limiter.remaining == 990
+
+
+def test_rate_limiter_first_search_call_reads_rate_limit_api(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=4000, reset_time=time.time() + 60, search=30)
+    limiter = GithubRateLimiter(client)
+    search_method = limiter.for_resource(RateLimitResource.SEARCH)(mocker.Mock())
+
+    # Act
+    search_method()
+
+    # Assert
+    # the cached headers belong to core calls
+    assert client.get_rate_limit_calls == 1
+    assert limiter.bucket("search").limit == 30
+    assert limiter.bucket("search").remaining == 29
+
+
+def test_rate_limiter_refund_gives_token_back(mocker):
+    # Arrange
+    mocker.patch("time.sleep", return_value=None)
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600)
+    limiter = ThreadSafeGithubRateLimiter(client)
+    wrapped_method = limiter(limiter.refund)
+
+    # Act
+    limiter.refund()
+    for _ in range(3):
+        wrapped_method()
+
+    # Assert
+    assert limiter.remaining == 1000
+
+
+def test_async_rate_limiter_refund_from_worker_thread():
+    # Arrange
+    client = FakeGithub(remaining=1000, reset_time=time.time() + 3600)
+    limiter = AsyncGithubRateLimiter(client)
+    wrapped_method = limiter(limiter.refund)
+
+    async def run():
+        for _ in range(3):
+            await wrapped_method()
+        # the refund is scheduled on the event loop
+        await asyncio.sleep(0)
+
+    # Act
+    asyncio.run(run())
+
+    # Assert
+    assert limiter.remaining == 1000
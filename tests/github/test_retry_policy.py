@@ -0,0 +1,152 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+from email.utils import formatdate
+
+import pytest
+from github import Auth, Github, GithubException
+from requests import ConnectionError as RequestsConnectionError, HTTPError, Response, Timeout
+
+from living_doc_utilities.github.rate_limiter import GithubRateLimiter
+from living_doc_utilities.github.retry_policy import RetryPolicy, error_status, has_builtin_retry
+
+
+def _http_error(status, text="", headers=None):
+    # as raised by `Response.raise_for_status`, e.g. in a ConditionalRequestCache
+    response = Response()
+    response.status_code = status
+    response._content = text.encode("utf-8")  # pylint: disable=protected-access
+    response.headers.update(headers or {})
+    return HTTPError(f"{status} Error", response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ConnectionError("reset"), True),
+        (RequestsConnectionError("reset"), True),
+        (Timeout("timeout"), True),
+        (GithubException(502, {"message": "Bad Gateway"}), True),
+        (GithubException(404, {"message": "Not Found"}), False),
+        (GithubException(403, {"message": "You have exceeded a secondary rate limit."}), True),
+        (GithubException(403, {"message": "Forbidden"}), False),
+        (GithubException(429, {"message": "Too Many Requests"}, {"Retry-After": "30"}), True),
+        (GithubException(429, {"message": "Too Many Requests"}, {"Retry-After": "3600"}), False),
+        (_http_error(503), True),
+        (_http_error(404), False),
+        (_http_error(403, '{"message": "You have exceeded a secondary rate limit."}'), True),
+        (_http_error(403, '{"message": "Forbidden"}'), False),
+        (_http_error(429, headers={"Retry-After": "30"}), True),
+        (HTTPError("no response"), False),
+        (ValueError("bug"), False),
+    ],
+)
+def test_is_retryable(error, expected):
+    # Arrange
+    policy = RetryPolicy()
+
+    # Act & Assert
+    assert policy.is_retryable(error) is expected
+
+
+def test_delay_exponential_backoff_with_cap():
+    # Arrange
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0, jitter=False)
+
+    # Act
+    delays = [policy.delay(attempt) for attempt in range(1, 6)]
+
+    # Assert
+    assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_delay_with_jitter(mocker):
+    # Arrange
+    mock_uniform = mocker.patch("living_doc_utilities.github.retry_policy.random.uniform", return_value=0.5)
+    policy = RetryPolicy(backoff_base=2.0)
+
+    # Act
+    delay = policy.delay(3)
+
+    # Assert
+    assert delay == 0.5
+    mock_uniform.assert_called_once_with(0, 8.0)
+
+
+def test_delay_honours_retry_after():
+    # Arrange
+    policy = RetryPolicy(jitter=False)
+    error = GithubException(403, {"message": "secondary rate limit"}, {"retry-after": "42"})
+
+    # Act & Assert
+    assert policy.delay(1, error) == 42.0
+
+
+def test_retry_after_http_date():
+    # Arrange
+    error = GithubException(503, None, {"Retry-After": formatdate(time.time() + 120, usegmt=True)})
+
+    # Act
+    retry_after = RetryPolicy.retry_after(error)
+
+    # Assert
+    assert 110 <= retry_after <= 120
+
+
+def test_retry_after_of_requests_error():
+    # Arrange
+    policy = RetryPolicy(jitter=False)
+    error = _http_error(429, headers={"Retry-After": "42"})
+
+    # Act & Assert
+    assert policy.delay(1, error) == 42.0
+
+
+def test_error_status():
+    # Act & Assert
+    assert error_status(GithubException(502, None, None)) == 502
+    assert error_status(_http_error(404)) == 404
+    assert error_status(HTTPError("no response")) is None
+    assert error_status(Timeout()) is None
+
+
+def test_retry_after_invalid():
+    # Arrange
+    error = GithubException(503, None, {"Retry-After": "soon"})
+
+    # Act & Assert
+    assert RetryPolicy.retry_after(error) is None
+    assert RetryPolicy.retry_after(ValueError()) is None
+
+
+def test_invalid_arguments():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(backoff_base=-1)
+
+
+def test_has_builtin_retry():
+    # Arrange
+    default_client = Github(auth=Auth.Token("token"))
+    client_without_retry = Github(auth=Auth.Token("token"), retry=None)
+
+    # Act & Assert
+    assert has_builtin_retry(default_client)
+    assert not has_builtin_retry(client_without_retry)
+    assert not any(has_builtin_retry(client) for client in GithubRateLimiter.from_tokens(["token"]).github_clients)
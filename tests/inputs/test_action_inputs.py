@@ -61,3 +61,27 @@ def test_print_effective_configuration(mocker, action_inputs):
     action_inputs.print_effective_configuration()
     mock_get_action_input.assert_called_once_with("GITHUB_TOKEN")
     mock_print_config.assert_called_once()
+
+
+def test_get_github_tokens(mocker, action_inputs):
+    mock_get_action_input = mocker.patch(
+        "living_doc_utilities.inputs.action_inputs.get_action_input",
+        return_value="token_1, token_2\ntoken_3\n\n",
+    )
+    tokens = action_inputs.get_github_tokens()
+    assert tokens == ["token_1", "token_2", "token_3"]
+    mock_get_action_input.assert_called_once_with("GITHUB_TOKEN")
+
+
+def test_get_github_token_first_of_several(mocker, action_inputs):
+    mocker.patch(
+        "living_doc_utilities.inputs.action_inputs.get_action_input",
+        return_value="token_1,token_2",
+    )
+    assert action_inputs.get_github_token() == "token_1"
+
+
+def test_get_github_token_not_defined(mocker, action_inputs):
+    mocker.patch("living_doc_utilities.inputs.action_inputs.get_action_input", return_value="")
+    assert action_inputs.get_github_token() == ""
+    assert action_inputs.get_github_tokens() == []
@@ -47,3 +47,15 @@ def test_get_related_feature_ids_mixed_content():
         "- #303"
     )
     assert issue.get_related_feature_ids() == [101, 202]
+
+def test_get_related_feature_ids_ignores_code_blocks():
+    issue = FunctionalityIssue()
+    issue.body = (
+        "```\n"
+        "### Associated Feature\n"
+        "- #1\n"
+        "```\n"
+        "### Associated Feature\n"
+        "- #2\n"
+    )
+    assert issue.get_related_feature_ids() == [2]
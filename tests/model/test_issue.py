@@ -13,8 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import sys
+
 import pytest
 
+import living_doc_utilities.model.issue as issue_module
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
 from living_doc_utilities.model.issue import Issue
 from living_doc_utilities.model.project_status import ProjectStatus
 
@@ -217,3 +222,94 @@ def test_issue_is_valid_issue_missing_issue_number():
     issue = Issue()
     issue.repository_id = "org/repo"
     issue.title = "Test"
+
+
+def test_issue_body_sections_cached_until_body_changes(mocker):
+    # Arrange
+    issue = Issue()
+    issue.body = "### Associated Feature\n- #1\n### Notes\nText"
+    spy = mocker.spy(issue_module, "parse_sections")
+
+    # Act
+    first = issue.get_body_section("Notes")
+    references = issue.get_section_issue_references("Associated Feature")
+    second = issue.get_body_section("Associated Feature")
+    missing = issue.get_section_issue_references("Missing")
+    issue.body = "### Notes\nChanged"
+    changed = issue.get_body_section("Notes")
+
+    # Assert
+    assert first == "Text"
+    assert references == [1]
+    assert second == "- #1"
+    assert missing == []
+    assert changed == "Changed"
+    assert spy.call_count == 2
+
+
+def test_issue_body_sections_no_body():
+    assert Issue().get_body_sections() == {}
+
+
+def test_issue_has_no_instance_dict():
+    # Arrange & Act
+    issue = FeatureIssue()
+
+    # Assert
+    assert not hasattr(issue, "__dict__")
+    with pytest.raises(AttributeError):
+        issue.unknown = "value"
+
+
+def test_issue_errors_allocated_lazily():
+    # Arrange
+    issue = Issue()
+
+    # Act
+    issue.add_errors({"title": "missing"})
+
+    # Assert
+    assert issue.errors == {"title": "missing"}
+    assert Issue().errors == {}
+
+
+def test_from_dict_interns_repeated_values():
+    # Arrange
+    data = {
+        Issue.REPOSITORY_ID: "".join(["org/", "repo"]),
+        Issue.TITLE: "Title",
+        Issue.ISSUE_NUMBER: 1,
+        Issue.STATE: "".join(["op", "en"]),
+        Issue.LABELS: ["".join(["bu", "g"])],
+    }
+    other = {**data, Issue.REPOSITORY_ID: "".join(["org/", "repo"]), Issue.STATE: "".join(["op", "en"])}
+
+    # Act
+    first = Issue.from_dict(data)
+    second = Issue.from_dict(other)
+
+    # Assert
+    assert first.repository_id is second.repository_id
+    assert first.state is second.state
+    assert first.labels[0] is sys.intern("bug")
+
+
+def test_from_dict_compact_shares_project_statuses():
+    # Arrange
+    data = {
+        Issue.REPOSITORY_ID: "org/repo",
+        Issue.TITLE: "Title",
+        Issue.ISSUE_NUMBER: 1,
+        Issue.PROJECT_STATUS: [{"project_title": "Project", "status": "Done"}],
+    }
+
+    # Act
+    first = Issue.from_dict(data, compact=True)
+    second = Issue.from_dict(data, compact=True)
+    default = Issue.from_dict(data)
+
+    # Assert
+    assert first.project_statuses[0] is second.project_statuses[0]
+    assert first.project_statuses[0].frozen
+    assert default.project_statuses[0] is not first.project_statuses[0]
+    assert not default.project_statuses[0].frozen
@@ -0,0 +1,61 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_utilities.model.issue_body_parser import extract_issue_references, parse_sections
+
+
+def test_parse_sections():
+    # Arrange
+    body = (
+        "Intro line\n"
+        "## Description ##\n"
+        "Text\n"
+        "```bash\n"
+        "# not a heading\n"
+        "```\n"
+        "### Associated Feature\n"
+        "- #1\n"
+        "### Description\n"
+        "Duplicate"
+    )
+
+    # Act
+    sections = parse_sections(body)
+
+    # Assert
+    assert sections == {
+        "": "Intro line",
+        "Description": "Text\n```bash\n# not a heading\n```",
+        "Associated Feature": "- #1",
+    }
+
+
+def test_parse_sections_without_headings():
+    assert parse_sections("Just text") == {"": "Just text"}
+
+
+@pytest.mark.parametrize(
+    "section,expected",
+    [
+        ("- #13\n- #14\nOther text\n- #15", [13, 14]),
+        ("\n* #1\n\n-#2 with note", [1, 2]),
+        ("Text first\n- #1", []),
+        ("", []),
+    ],
+)
+def test_extract_issue_references(section, expected):
+    assert extract_issue_references(section) == expected
@@ -14,12 +14,17 @@
 # limitations under the License.
 #
 import json
+import tracemalloc
+
 import pytest
 
 from living_doc_utilities.model.feature_issue import FeatureIssue
 from living_doc_utilities.model.functionality_issue import FunctionalityIssue
 from living_doc_utilities.model.issue import Issue
 from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.lazy_issues import LazyIssues
+from living_doc_utilities.model.project_status import ProjectStatus
+from living_doc_utilities.model.sqlite_issues import SQLiteIssues
 from living_doc_utilities.model.user_story_issue import UserStoryIssue
 
 
@@ -189,12 +194,15 @@ def test_load_from_json_no_type(tmp_path):
     assert issue.project_statuses[0].project_title == "Test Project"
 
 
-@pytest.mark.parametrize("issue_type,expected_class", [
-    ("Issue", Issue),
-    ("UserStoryIssue", UserStoryIssue),
-    ("FeatureIssue", FeatureIssue),
-    ("FunctionalityIssue", FunctionalityIssue),
-    ])
+@pytest.mark.parametrize(
+    "issue_type,expected_class",
+    [
+        ("Issue", Issue),
+        ("UserStoryIssue", UserStoryIssue),
+        ("FeatureIssue", FeatureIssue),
+        ("FunctionalityIssue", FunctionalityIssue),
+    ],
+)
 def test_load_from_json_specialized_issue_types(tmp_path, issue_type, expected_class):
     # Arrange
     file_path = tmp_path / "issues.json"
@@ -261,3 +269,393 @@ def test_load_from_json_unexpected_exception(mocker):
     assert result.count() == 0
     mock_logger.assert_called_once()
     assert "Unexpected error loading issues" in mock_logger.call_args[0][0]
+
+
+def test_save_to_jsonl_writes_one_record_per_line(tmp_path):
+    # Arrange
+    issues = Issues()
+    for number in (1, 2):
+        issue = FeatureIssue()
+        issue.repository_id = "org/repo"
+        issue.title = f"Issue {number}"
+        issue.issue_number = number
+        issues.add_issue(f"org/repo/{number}", issue)
+    file_path = tmp_path / "issues.jsonl"
+
+    # Act
+    issues.save_to_jsonl(file_path)
+
+    # Assert
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["key"] == "org/repo/1"
+    assert record["type"] == "FeatureIssue"
+    assert record["title"] == "Issue 1"
+
+
+def test_jsonl_round_trip(tmp_path):
+    # Arrange
+    issues = Issues()
+    issue = FunctionalityIssue()
+    issue.repository_id = "org/repo"
+    issue.title = "Multi\nline ✓"
+    issue.issue_number = 7
+    issue.body = "### Associated Feature\n- #1"
+    issue.labels = ["bug"]
+    issues.add_issue("org/repo/7", issue)
+    file_path = tmp_path / "issues.jsonl"
+    issues.save_to_jsonl(file_path)
+
+    # Act
+    loaded = Issues.load_from_jsonl(file_path)
+
+    # Assert
+    assert loaded.count() == 1
+    loaded_issue = loaded.get_issue("org/repo/7")
+    assert isinstance(loaded_issue, FunctionalityIssue)
+    assert loaded_issue.to_dict() == issue.to_dict()
+
+
+def test_iter_from_jsonl_is_lazy(tmp_path):
+    # Arrange
+    file_path = tmp_path / "issues.jsonl"
+    file_path.write_text(
+        '{"key": "org/repo/1", "repository_id": "org/repo", "title": "A", "issue_number": 1}\n' "\n" "{invalid json\n",
+        encoding="utf-8",
+    )
+
+    # Act
+    iterator = Issues.iter_from_jsonl(file_path)
+    key, issue = next(iterator)
+
+    # Assert
+    assert key == "org/repo/1"
+    assert issue.title == "A"
+    with pytest.raises(json.JSONDecodeError):
+        next(iterator)
+
+
+def test_load_from_jsonl_missing_key(tmp_path, mocker):
+    file_path = tmp_path / "issues.jsonl"
+    file_path.write_text('{"repository_id": "org/repo", "title": "A", "issue_number": 1}\n', encoding="utf-8")
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.error")
+    result = Issues.load_from_jsonl(file_path)
+    assert result.count() == 0
+    mock_logger.assert_called_once()
+    assert "Unexpected error loading issues" in mock_logger.call_args[0][0]
+
+
+def test_load_from_jsonl_file_not_found(mocker):
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.warning")
+    result = Issues.load_from_jsonl("nonexistent.jsonl")
+    assert result.count() == 0
+    mock_logger.assert_called_once()
+    assert "Issues file not found" in mock_logger.call_args[0][0]
+
+
+def test_load_from_jsonl_json_decode_error(tmp_path, mocker):
+    file_path = tmp_path / "bad.jsonl"
+    file_path.write_text("{invalid json\n")
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.error")
+    result = Issues.load_from_jsonl(file_path)
+    assert result.count() == 0
+    mock_logger.assert_called_once()
+    assert "Failed to parse JSON" in mock_logger.call_args[0][0]
+
+
+@pytest.mark.parametrize("snapshot_format", ["json", "jsonl", "binary"])
+@pytest.mark.parametrize("suffix", ["", ".gz", ".xz", ".bz2"])
+def test_save_and_load_with_format(tmp_path, snapshot_format, suffix):
+    # Arrange
+    issues = Issues()
+    issue = UserStoryIssue()
+    issue.repository_id = "org/repo"
+    issue.title = "Story"
+    issue.issue_number = 5
+    issue.labels = ["user-story"]
+    issues.add_issue("org/repo/5", issue)
+    file_path = tmp_path / f"issues.{snapshot_format}{suffix}"
+
+    # Act
+    issues.save_to_json(file_path, format=snapshot_format, compression_level=1)
+    loaded = Issues.load_from_json(file_path, format=snapshot_format)
+
+    # Assert
+    assert loaded.count() == 1
+    loaded_issue = loaded.get_issue("org/repo/5")
+    assert isinstance(loaded_issue, UserStoryIssue)
+    assert loaded_issue.to_dict() == issue.to_dict()
+
+
+def test_load_compact_uses_less_memory(tmp_path):
+    # Arrange
+    issues = Issues()
+    for number in range(1, 2001):
+        issue = FeatureIssue()
+        issue.repository_id = f"org/repo{number % 10}"
+        issue.title = f"Feature {number}"
+        issue.issue_number = number
+        issue.state = "open"
+        issue.labels = ["feature", "documented"]
+        project_status = ProjectStatus()
+        project_status.project_title = "Project"
+        project_status.status = "Done"
+        issue.project_statuses = [project_status]
+        issues.add_issue(f"org/repo{number % 10}/{number}", issue)
+    file_path = tmp_path / "issues.jsonl"
+    issues.save_to_json(file_path, format="jsonl")
+
+    def retained(compact):
+        tracemalloc.start()
+        try:
+            loaded = Issues.load_from_json(file_path, format="jsonl", compact=compact)
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return loaded, size
+
+    # Act
+    default, default_size = retained(False)
+    compact, compact_size = retained(True)
+
+    # Assert
+    assert compact_size < default_size
+    assert compact.all_issues().keys() == default.all_issues().keys()
+    issue = compact.get_issue("org/repo1/1")
+    assert issue.to_dict() == default.get_issue("org/repo1/1").to_dict()
+    assert not hasattr(issue, "__dict__")
+    assert issue.project_statuses[0] is compact.get_issue("org/repo2/2").project_statuses[0]
+
+
+def test_save_to_json_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        Issues().save_to_json(tmp_path / "issues.xml", format="xml")
+
+
+def test_load_from_binary_invalid_file(tmp_path, mocker):
+    file_path = tmp_path / "issues.bin"
+    file_path.write_bytes(b"not a snapshot at all, just some bytes to map")
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.error")
+    result = Issues.load_from_json(file_path, format="binary")
+    assert result.count() == 0
+    mock_logger.assert_called_once()
+    assert "Unexpected error loading issues" in mock_logger.call_args[0][0]
+
+
+def test_load_from_binary_file_not_found(mocker):
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.warning")
+    result = Issues.load_from_binary("nonexistent.bin")
+    assert result.count() == 0
+    mock_logger.assert_called_once()
+
+
+def test_save_changes_to_log_writes_only_pending_changes(tmp_path, make_issue):
+    # Arrange
+    snapshot = tmp_path / "issues.json"
+    log_path = tmp_path / "issues.log.jsonl"
+    Issues(
+        {"org/repo/1": make_issue(FeatureIssue, number=1), "org/repo/2": make_issue(FeatureIssue, number=2)}
+    ).save_to_json(snapshot)
+    issues = Issues.load_from_json(snapshot)
+    issues.track_changes()
+    issues.add_issue("org/repo/1", make_issue(FeatureIssue, number=1, title="Changed"))
+    issues.add_issue("org/repo/3", make_issue(FeatureIssue, number=3))
+    issues.remove_issue("org/repo/2")
+
+    # Act
+    written = issues.save_changes_to_log(log_path)
+    written_again = issues.save_changes_to_log(log_path)
+
+    # Assert
+    assert written == 3
+    assert written_again == 0
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_changes_not_tracked_by_default(tmp_path, make_issue):
+    # Arrange
+    issues = Issues()
+
+    # Act
+    for number in range(100):
+        issues.add_issue(f"org/repo/{number}", make_issue(number=number))
+        issues.remove_issue(f"org/repo/{number}")
+
+    # Assert
+    assert issues._pending_changes is None  # pylint: disable=protected-access
+    with pytest.raises(ValueError):
+        issues.save_changes_to_log(tmp_path / "issues.log.jsonl")
+
+
+def test_load_from_json_replays_delta_log(tmp_path, make_issue):
+    # Arrange
+    snapshot = tmp_path / "issues.jsonl"
+    log_path = tmp_path / "issues.log.jsonl"
+    Issues(
+        {"org/repo/1": make_issue(FeatureIssue, number=1), "org/repo/2": make_issue(FeatureIssue, number=2)}
+    ).save_to_jsonl(snapshot)
+    issues = Issues.load_from_json(snapshot, format="jsonl", delta_log_path=log_path)
+    issues.add_issue("org/repo/1", make_issue(FeatureIssue, number=1, title="Changed"))
+    issues.remove_issue("org/repo/2")
+    issues.save_changes_to_log(log_path)
+
+    # Act
+    loaded = Issues.load_from_json(snapshot, format="jsonl", delta_log_path=log_path)
+
+    # Assert
+    assert list(loaded.all_issues()) == ["org/repo/1"]
+    assert loaded.get_issue("org/repo/1").title == "Changed"
+    assert loaded.save_changes_to_log(log_path) == 0
+
+
+def test_compact_folds_log_into_snapshot(tmp_path, make_issue):
+    # Arrange
+    snapshot = tmp_path / "issues.bin.gz"
+    log_path = tmp_path / "issues.log.jsonl"
+    Issues({"org/repo/1": make_issue(FeatureIssue, number=1)}).save_to_json(snapshot, format="binary")
+    issues = Issues(track_changes=True)
+    issues.add_issue("org/repo/2", make_issue(FeatureIssue, number=2))
+    issues.save_changes_to_log(log_path)
+    issues = Issues.load_from_json(snapshot, format="binary", delta_log_path=log_path)
+
+    # Act
+    issues.compact(snapshot, log_path, format="binary")
+
+    # Assert
+    assert not log_path.exists()
+    assert [path.name for path in tmp_path.iterdir()] == ["issues.bin.gz"]
+    assert sorted(Issues.load_from_json(snapshot, format="binary").all_issues()) == ["org/repo/1", "org/repo/2"]
+
+
+def _indexed_sample(indexed, make_issue):
+    issues = Issues(indexed=indexed)
+    issues.add_issue("org/repo/1", make_issue(FeatureIssue, number=1, labels=["docs"]))
+    issues.add_issue("org/repo/2", make_issue(UserStoryIssue, number=2, title="Story"))
+    issues.add_issue("org/other/3", make_issue(FeatureIssue, repository_id="org/other", number=3, state="closed"))
+    return issues
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+@pytest.mark.parametrize(
+    "conditions,expected",
+    [
+        ({"type": FeatureIssue}, ["org/repo/1", "org/other/3"]),
+        ({"type": "FeatureIssue", "state": "open"}, ["org/repo/1"]),
+        ({"repository_id": "org/repo"}, ["org/repo/1", "org/repo/2"]),
+        ({"label": "docs"}, ["org/repo/1"]),
+        ({"status": "Done"}, []),
+    ],
+)
+def test_query(indexed, conditions, expected, make_issue):
+    assert list(_indexed_sample(indexed, make_issue).query(**conditions)) == expected
+
+
+def test_query_index_follows_changes(make_issue):
+    # Arrange
+    issues = _indexed_sample(False, make_issue)
+    issues.enable_indexes()
+
+    # Act
+    issues.remove_issue("org/repo/1")
+
+    # Assert
+    assert list(issues.query(state="open")) == ["org/repo/2"]
+
+
+def test_feature_functionalities_built_once(mocker, make_issue):
+    # Arrange
+    issues = Issues()
+    issues.add_issue("org/repo/1", make_issue(FeatureIssue, number=1))
+    issues.add_issue(
+        "org/repo/10",
+        make_issue(FunctionalityIssue, repository_id="org/repo", number=10, body="### Associated Feature\n- #1\n- #1"),
+    )
+    issues.add_issue(
+        "org/repo/11",
+        make_issue(FunctionalityIssue, repository_id="org/repo", number=11, body="### Associated Feature\n- #1\n- #2"),
+    )
+    issues.add_issue(
+        "org/other/12",
+        make_issue(FunctionalityIssue, repository_id="org/other", number=12, body="### Associated Feature\n- #1"),
+    )
+    spy = mocker.spy(FunctionalityIssue, "get_related_feature_ids")
+
+    # Act
+    first = issues.get_feature_functionalities("org/repo/1")
+    second = issues.get_feature_functionalities("org/repo/2")
+    third = issues.get_feature_functionalities("org/other/1")
+    missing = issues.get_feature_functionalities("org/repo/99")
+
+    # Assert
+    assert first == ["org/repo/10", "org/repo/11"]
+    assert second == ["org/repo/11"]
+    assert third == ["org/other/12"]
+    assert missing == []
+    assert spy.call_count == 3
+
+
+def test_feature_functionalities_invalidated_on_changes(make_issue):
+    # Arrange
+    issues = Issues()
+    functionality = make_issue(
+        FunctionalityIssue, repository_id="org/repo", number=10, body="### Associated Feature\n- #1"
+    )
+    issues.add_issue("org/repo/10", functionality)
+    assert issues.get_feature_functionalities("org/repo/1") == ["org/repo/10"]
+
+    # Act & Assert
+    functionality.body = "### Associated Feature\n- #2"
+    assert issues.get_feature_functionalities("org/repo/1") == []
+    assert issues.get_feature_functionalities("org/repo/2") == ["org/repo/10"]
+
+    issues.add_issue(
+        "org/repo/11",
+        make_issue(FunctionalityIssue, repository_id="org/repo", number=11, body="### Associated Feature\n- #2"),
+    )
+    assert issues.get_feature_functionalities("org/repo/2") == ["org/repo/10", "org/repo/11"]
+
+    issues.remove_issue("org/repo/10")
+    assert issues.get_feature_functionalities("org/repo/2") == ["org/repo/11"]
+
+
+def test_feature_functionalities_invalid_repository_id(mocker, make_issue):
+    issues = Issues()
+    issues.add_issue(
+        "x", make_issue(FunctionalityIssue, repository_id="invalid", number=10, body="### Associated Feature\n- #1")
+    )
+    mock_logger = mocker.patch("living_doc_utilities.model.issues.logger.warning")
+    assert issues.feature_functionalities() == {}
+    mock_logger.assert_called_once()
+
+
+@pytest.mark.parametrize("backend", ["memory", "indexed", "lazy", "sqlite"])
+def test_mutations_invalidate_caches_and_indexes_of_each_backend(tmp_path, make_issue, backend):
+    # Arrange
+    seed = Issues()
+    seed.add_issue("org/repo/1", make_issue(FeatureIssue, number=1))
+    seed.add_issue("org/repo/2", make_issue(FunctionalityIssue, number=2, body="### Associated Feature\n- #1"))
+    snapshot = tmp_path / "issues.jsonl"
+    seed.save_to_jsonl(snapshot)
+    # created upfront, since setting a body alone invalidates the relations
+    added = make_issue(FunctionalityIssue, number=3, body="### Associated Feature\n- #1")
+    issues: Issues
+    if backend == "lazy":
+        issues = LazyIssues(snapshot)
+        issues.enable_indexes()
+    elif backend == "sqlite":
+        issues = SQLiteIssues()
+        issues.add_issues(seed.iter_issues())
+    else:
+        issues = Issues(dict(seed.issues), indexed=backend == "indexed")
+    assert issues.get_feature_functionalities("org/repo/1") == ["org/repo/2"]
+    assert list(issues.query(type=FunctionalityIssue)) == ["org/repo/2"]
+
+    # Act
+    issues.add_issue("org/repo/3", added)
+    issues.remove_issue("org/repo/2")
+
+    # Assert
+    assert issues.get_feature_functionalities("org/repo/1") == ["org/repo/3"]
+    assert list(issues.query(type=FunctionalityIssue)) == ["org/repo/3"]
+    assert list(issues.query(type=FeatureIssue)) == ["org/repo/1"]
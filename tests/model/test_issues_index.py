@@ -0,0 +1,62 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.issues_index import IssuesIndex
+
+
+def test_lookup_intersects_postings(make_issue):
+    # Arrange
+    index = IssuesIndex()
+    index.add("a", make_issue(FeatureIssue, labels=["bug", "docs"], statuses=["Done"]))
+    index.add("b", make_issue(FeatureIssue, state="closed", labels=["bug"]))
+    index.add("c", make_issue(labels=["bug"], statuses=["Todo", "Done"]))
+
+    # Act & Assert
+    assert index.lookup({"label": "bug"}) == ["a", "b", "c"]
+    assert index.lookup({"label": "bug", "type": "FeatureIssue", "state": "open"}) == ["a"]
+    assert index.lookup({"status": "Done"}) == ["a", "c"]
+    assert index.lookup({"repository_id": "org/other"}) == []
+    assert index.lookup({}) == ["a", "b", "c"]
+
+
+def test_add_replaces_previous_values_of_key(make_issue):
+    # Arrange
+    index = IssuesIndex()
+    issue = make_issue(labels=["bug"])
+    index.add("a", issue)
+
+    # Act
+    issue.labels = ["docs"]
+    index.add("a", issue)
+
+    # Assert
+    assert index.lookup({"label": "bug"}) == []
+    assert index.lookup({"label": "docs"}) == ["a"]
+
+
+def test_remove(make_issue):
+    index = IssuesIndex()
+    index.add("a", make_issue())
+    index.remove("a")
+    index.remove("missing")
+    assert index.lookup({"state": "open"}) == []
+
+
+def test_lookup_unknown_field():
+    with pytest.raises(ValueError):
+        IssuesIndex().lookup({"title": "x"})
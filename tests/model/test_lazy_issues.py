@@ -0,0 +1,161 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.lazy_issues import LazyIssues
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    issues = Issues()
+    for number in range(1, 4):
+        issue = FeatureIssue()
+        issue.repository_id = "org/repo"
+        issue.title = f"Issue {number}"
+        issue.issue_number = number
+        issue.body = f"Body \"{number}\""
+        issues.add_issue(f"org/repo/{number}", issue)
+    file_path = tmp_path / "issues.jsonl"
+    issues.save_to_jsonl(file_path)
+    return file_path
+
+
+def test_lazy_issues_builds_index_without_materializing(snapshot):
+    # Act
+    with LazyIssues(snapshot) as issues:
+        # Assert
+        assert issues.count() == 3
+        assert issues.issues == {}
+        assert not issues.is_materialized("org/repo/1")
+
+
+def test_lazy_issues_get_issue_materializes_and_caches(snapshot, mocker):
+    # Arrange
+    spy = mocker.spy(Issues, "from_jsonl_record")
+
+    with LazyIssues(snapshot) as issues:
+        # Act
+        first = issues.get_issue("org/repo/2")
+        second = issues.get_issue("org/repo/2")
+
+        # Assert
+        assert first is second
+        assert isinstance(first, FeatureIssue)
+        assert first.body == 'Body "2"'
+        assert spy.call_count == 1
+        assert list(issues.issues) == ["org/repo/2"]
+
+
+def test_lazy_issues_get_issue_key_error(snapshot):
+    with LazyIssues(snapshot) as issues:
+        with pytest.raises(KeyError) as e:
+            issues.get_issue("org/repo/999")
+    assert e.value.args[0] == "Issue with key 'org/repo/999' not found."
+
+
+def test_lazy_issues_iteration_includes_added_issues(snapshot):
+    # Arrange
+    added = Issue()
+    added.repository_id = "org/other"
+    added.title = "Added"
+    added.issue_number = 1
+
+    with LazyIssues(snapshot) as issues:
+        issues.add_issue("org/other/1", added)
+
+        # Act
+        keys = [key for key, _ in issues.iter_issues()]
+
+        # Assert
+        assert keys == ["org/repo/1", "org/repo/2", "org/repo/3", "org/other/1"]
+        assert issues.count() == 4
+        assert len(issues.all_issues()) == 4
+
+
+def test_lazy_issues_key_not_first_in_record(tmp_path):
+    # Arrange
+    file_path = tmp_path / "issues.jsonl"
+    file_path.write_text(
+        '{"repository_id": "org/repo", "title": "A", "issue_number": 1, "key": "org/repo/\\u00e91"}\n\n',
+        encoding="utf-8",
+    )
+
+    # Act
+    with LazyIssues(file_path) as issues:
+        issue = issues.get_issue("org/repo/é1")
+
+    # Assert
+    assert issue.title == "A"
+
+
+def test_lazy_issues_empty_snapshot(tmp_path):
+    file_path = tmp_path / "issues.jsonl"
+    file_path.write_text("", encoding="utf-8")
+    with LazyIssues(file_path) as issues:
+        assert issues.count() == 0
+        assert issues.all_issues() == {}
+
+
+def test_lazy_issues_save_materializes_all(snapshot, tmp_path):
+    # Arrange
+    target = tmp_path / "copy.jsonl"
+
+    # Act
+    with LazyIssues(snapshot) as issues:
+        issues.save_to_jsonl(target)
+
+    # Assert
+    assert target.read_bytes() == snapshot.read_bytes()
+
+
+def test_lazy_issues_closed_snapshot(snapshot):
+    issues = LazyIssues(snapshot)
+    issues.close()
+    with pytest.raises(ValueError):
+        issues.get_issue("org/repo/1")
+
+
+def test_lazy_issues_rejects_compressed_snapshot(tmp_path):
+    with pytest.raises(ValueError):
+        LazyIssues(tmp_path / "issues.jsonl.gz")
+
+
+def test_lazy_issues_remove_issue(snapshot):
+    with LazyIssues(snapshot) as issues:
+        issues.remove_issue("org/repo/1")
+        assert issues.count() == 2
+        with pytest.raises(KeyError):
+            issues.get_issue("org/repo/1")
+
+
+@pytest.mark.parametrize("format", ["json", "jsonl", "binary"])
+def test_lazy_issues_inherited_load_methods_return_plain_issues(tmp_path, snapshot, format):
+    # Arrange
+    file_path = tmp_path / f"issues.{format}"
+    Issues.load_from_jsonl(snapshot).save_to_json(file_path, format=format)
+
+    # Act
+    loaded = LazyIssues.load_from_json(file_path, format=format)
+    missing = LazyIssues.load_from_json(tmp_path / "missing", format=format)
+
+    # Assert
+    assert type(loaded) is Issues
+    assert loaded.count() == 3
+    assert type(missing) is Issues
+    assert missing.count() == 0
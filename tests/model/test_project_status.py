@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import pytest
+
 from living_doc_utilities.constants import NO_PROJECT_DATA
 from living_doc_utilities.model.project_status import ProjectStatus
 
@@ -104,3 +106,40 @@ def test_project_status_from_dict_with_missing_fields():
     assert project_status.priority == NO_PROJECT_DATA
     assert project_status.size == NO_PROJECT_DATA
     assert project_status.moscow == NO_PROJECT_DATA
+
+
+def test_project_status_from_dict_shared():
+    # Arrange
+    data = {"project_title": "Test Project", "status": "Done"}
+
+    # Act
+    first = ProjectStatus.from_dict(data, shared=True)
+    second = ProjectStatus.from_dict(dict(data), shared=True)
+    own = ProjectStatus.from_dict(data)
+
+    # Assert
+    assert first is second
+    assert first.frozen
+    assert own is not first
+    assert not own.frozen
+    assert own.to_dict() == first.to_dict()
+
+
+def test_project_status_shared_is_frozen():
+    # Arrange
+    project_status = ProjectStatus.from_dict({"status": "Done"}, shared=True)
+
+    # Act & Assert
+    with pytest.raises(AttributeError, match="frozen"):
+        project_status.status = "Todo"
+    assert project_status.status == "Done"
+
+
+def test_project_status_has_no_instance_dict():
+    # Arrange & Act
+    project_status = ProjectStatus()
+
+    # Assert
+    assert not hasattr(project_status, "__dict__")
+    with pytest.raises(AttributeError):
+        project_status.unknown = "value"
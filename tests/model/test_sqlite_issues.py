@@ -0,0 +1,219 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import functools
+import tracemalloc
+
+import pytest
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.functionality_issue import FunctionalityIssue
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.model.sqlite_issues import SQLiteIssues
+
+
+@pytest.fixture
+def make_sqlite_issue(make_issue):
+    return functools.partial(make_issue, updated_at="2025-01-01T00:00:00Z", labels=["feature"])
+
+
+@pytest.fixture
+def issues(make_sqlite_issue):
+    with SQLiteIssues() as sqlite_issues:
+        sqlite_issues.add_issues(
+            [
+                (
+                    "org/a/1",
+                    make_sqlite_issue(FeatureIssue, repository_id="org/a", number=1, statuses=["Done", "Done"]),
+                ),
+                (
+                    "org/a/2",
+                    make_sqlite_issue(FunctionalityIssue, repository_id="org/a", number=2, state="closed"),
+                ),
+                (
+                    "org/b/1",
+                    make_sqlite_issue(
+                        FeatureIssue,
+                        repository_id="org/b",
+                        number=1,
+                        updated_at="2025-06-01T00:00:00Z",
+                        statuses=["Done"],
+                    ),
+                ),
+            ]
+        )
+        yield sqlite_issues
+
+
+def test_get_issue_round_trip(issues, make_sqlite_issue):
+    # Act
+    issue = issues.get_issue("org/a/1")
+
+    # Assert
+    assert isinstance(issue, FeatureIssue)
+    assert (
+        issue.to_dict()
+        == make_sqlite_issue(FeatureIssue, repository_id="org/a", number=1, statuses=["Done", "Done"]).to_dict()
+    )
+
+
+def test_get_issue_key_error(issues):
+    with pytest.raises(KeyError) as e:
+        issues.get_issue("org/a/999")
+    assert e.value.args[0] == "Issue with key 'org/a/999' not found."
+
+
+def test_add_issue_replaces_existing(issues, make_sqlite_issue):
+    # Act
+    issues.add_issue(
+        "org/a/1",
+        make_sqlite_issue(Issue, repository_id="org/a", number=1, state="closed"),
+    )
+
+    # Assert
+    issue = issues.get_issue("org/a/1")
+    assert type(issue) is Issue
+    assert issue.state == "closed"
+    assert issue.project_statuses == []
+    assert issues.count() == 3
+
+
+def test_iter_issues_streams_with_project_statuses(issues):
+    # Act
+    result = list(issues.iter_issues())
+
+    # Assert
+    assert [key for key, _ in result] == ["org/a/1", "org/a/2", "org/b/1"]
+    assert [len(issue.project_statuses) for _, issue in result] == [2, 0, 1]
+    assert result[0][1].project_statuses[1].project_title == "Project 1"
+    assert len(issues.all_issues()) == 3
+
+
+def test_remove_issue(issues):
+    issues.remove_issue("org/a/1")
+    assert issues.count() == 2
+    assert [len(issue.project_statuses) for _, issue in issues.iter_issues()] == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ({"repository_id": "org/a"}, ["org/a/1", "org/a/2"]),
+        ({"state": "open"}, ["org/a/1", "org/b/1"]),
+        ({"issue_type": "FeatureIssue", "repository_id": "org/b"}, ["org/b/1"]),
+        ({"updated_since": "2025-03-01T00:00:00Z"}, ["org/b/1"]),
+        ({}, ["org/a/1", "org/a/2", "org/b/1"]),
+    ],
+)
+def test_filter_issues(issues, filters, expected):
+    result = list(issues.filter_issues(**filters))
+    assert [key for key, _ in result] == expected
+    assert all(issue.repository_id for _, issue in result)
+
+
+def test_persists_to_file_and_exports(tmp_path, make_sqlite_issue):
+    # Arrange
+    database_path = tmp_path / "issues.db"
+    with SQLiteIssues(database_path) as sqlite_issues:
+        sqlite_issues.add_issue(
+            "org/a/1",
+            make_sqlite_issue(FeatureIssue, repository_id="org/a", number=1, statuses=["Done"]),
+        )
+
+    # Act
+    with SQLiteIssues(database_path) as reopened:
+        reopened.save_to_json(tmp_path / "issues.json")
+        count = reopened.count()
+
+    # Assert
+    assert count == 1
+    assert Issues.load_from_json(tmp_path / "issues.json").get_issue("org/a/1").project_statuses[0].status == "Done"
+
+
+def test_save_changes_to_log(issues, tmp_path):
+    log_path = tmp_path / "issues.log.jsonl"
+    issues.track_changes()
+    issues.remove_issue("org/a/2")
+    assert issues.save_changes_to_log(log_path) == 1
+
+
+@pytest.mark.parametrize(
+    "conditions,expected",
+    [
+        ({"type": FeatureIssue, "state": "open"}, ["org/a/1", "org/b/1"]),
+        ({"label": "feature", "repository_id": "org/a"}, ["org/a/1", "org/a/2"]),
+        ({"label": "bug"}, []),
+        ({"status": "Done", "repository_id": "org/b"}, ["org/b/1"]),
+    ],
+)
+def test_query(issues, conditions, expected):
+    result = issues.query(**conditions)
+    assert list(result) == expected
+    if "status" in conditions:
+        assert result["org/b/1"].project_statuses[0].status == "Done"
+
+
+def test_inherited_load_methods_return_sqlite_issues(issues, tmp_path):
+    # Arrange
+    file_path = tmp_path / "issues.jsonl"
+    issues.save_to_json(file_path, format="jsonl")
+
+    # Act
+    loaded = SQLiteIssues.load_from_json(file_path, format="jsonl")
+    missing = SQLiteIssues.load_from_jsonl(tmp_path / "missing.jsonl")
+
+    # Assert
+    assert isinstance(loaded, SQLiteIssues)
+    assert loaded.all_issues().keys() == issues.all_issues().keys()
+    loaded.track_changes()
+    assert loaded.save_changes_to_log(tmp_path / "changes.log") == 0
+    assert isinstance(missing, SQLiteIssues)
+    assert missing.count() == 0
+
+
+def test_add_issues_does_not_hold_bulk_load_in_memory(make_sqlite_issue):
+    # Arrange
+    def generate(count):
+        for number in range(count):
+            issue = make_sqlite_issue(FeatureIssue, repository_id="org/a", number=number, body="x" * 1000)
+            yield f"org/a/{number}", issue
+
+    # Act
+    with SQLiteIssues() as sqlite_issues:
+        tracemalloc.start()
+        try:
+            sqlite_issues.add_issues(generate(5000))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        assert sqlite_issues.count() == 5000
+        # holding the issues until the commit took about 2.5 MB
+        assert peak < 500_000
+
+
+def test_add_issues_tracks_changes_and_drops_feature_relations(issues, tmp_path):
+    # Arrange
+    issues.track_changes()
+    issues.feature_functionalities()
+
+    # Act
+    issues.add_issues([("org/c/1", issues.get_issue("org/a/2"))])
+
+    # Assert
+    assert issues._feature_functionalities is None  # pylint: disable=protected-access
+    assert issues.save_changes_to_log(tmp_path / "issues.log.jsonl") == 1
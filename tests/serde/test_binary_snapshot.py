@@ -0,0 +1,87 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+
+import pytest
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.model.issue import Issue
+from living_doc_utilities.serde.binary_snapshot import BinarySnapshotReader, BinarySnapshotWriter
+
+FEATURE_FIELDS = {
+    "body": "### Description\nSome text",
+    "labels": ["feature", "documented"],
+    "statuses": ["Done"],
+}
+
+
+def write_snapshot(issues: dict[str, Issue]) -> bytes:
+    stream = io.BytesIO()
+    writer = BinarySnapshotWriter(stream)
+    for key, issue in issues.items():
+        writer.write(key, issue)
+    writer.finish()
+    return stream.getvalue()
+
+
+def test_round_trip_matches_to_dict(make_issue):
+    # Arrange
+    issues = {
+        f"org/repo/{number}": make_issue(FeatureIssue, number=number, title=f"Issue ✓ {number}", **FEATURE_FIELDS)
+        for number in (1, 2)
+    }
+    minimal = Issue()
+    minimal.repository_id = "org/repo"
+    minimal.title = "Minimal"
+    minimal.issue_number = 3
+    issues["org/repo/3"] = minimal
+
+    # Act
+    reader = BinarySnapshotReader(memoryview(write_snapshot(issues)))
+
+    # Assert
+    assert len(reader) == 3
+    assert [(key, data) for key, data in reader] == [(key, issue.to_dict()) for key, issue in issues.items()]
+
+
+def test_repeated_values_are_interned_once(make_issue):
+    # Arrange
+    one = write_snapshot({"org/repo/1": make_issue(FeatureIssue, number=1, title="Issue ✓ 1", **FEATURE_FIELDS)})
+
+    # Act
+    many = write_snapshot(
+        {
+            f"org/repo/{n}": make_issue(FeatureIssue, number=n, title=f"Issue ✓ {n}", **FEATURE_FIELDS)
+            for n in range(1, 101)
+        }
+    )
+
+    # Assert
+    assert many.count(b"documented") == 1
+    assert one.count(b"Project") == 1
+
+
+def test_read_index_out_of_range():
+    reader = BinarySnapshotReader(memoryview(write_snapshot({})))
+    assert len(reader) == 0
+    with pytest.raises(IndexError):
+        reader.read(0)
+
+
+@pytest.mark.parametrize("data", [b"", b"{}" * 40, b"LDIS" + b"\x00" * 60])
+def test_reader_rejects_invalid_data(data):
+    with pytest.raises(ValueError):
+        BinarySnapshotReader(memoryview(data))
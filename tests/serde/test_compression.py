@@ -0,0 +1,66 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from living_doc_utilities.serde.compression import is_compressed, open_snapshot
+
+
+@pytest.mark.parametrize(
+    "file_name,expected",
+    [("issues.json", False), ("issues.json.gz", True), ("issues.jsonl.XZ", True), ("issues.bin.bz2", True)],
+)
+def test_is_compressed(file_name, expected):
+    assert is_compressed(file_name) is expected
+
+
+@pytest.mark.parametrize("suffix,decompress", [(".gz", gzip.decompress), (".xz", lzma.decompress), (".bz2", bz2.decompress)])
+def test_open_snapshot_compresses_by_extension(tmp_path, suffix, decompress):
+    # Arrange
+    file_path = tmp_path / f"issues.json{suffix}"
+
+    # Act
+    with open_snapshot(file_path, "w", compression_level=1) as f:
+        f.write("ünïcode\n" * 100)
+    with open_snapshot(file_path, "r") as f:
+        content = f.read()
+
+    # Assert
+    assert content == "ünïcode\n" * 100
+    assert decompress(file_path.read_bytes()).decode("utf-8") == content
+    assert file_path.stat().st_size < len(content)
+
+
+def test_open_snapshot_append_text_plain(tmp_path):
+    file_path = tmp_path / "log.jsonl"
+    with open_snapshot(file_path, "a") as f:
+        f.write("one\n")
+    with open_snapshot(file_path, "a") as f:
+        f.write("two\n")
+    assert file_path.read_text(encoding="utf-8") == "one\ntwo\n"
+
+
+def test_open_snapshot_binary_gzip_append(tmp_path):
+    file_path = tmp_path / "log.bin.gz"
+    with open_snapshot(file_path, "ab") as f:
+        f.write(b"one")
+    with open_snapshot(file_path, "ab") as f:
+        f.write(b"two")
+    with open_snapshot(file_path, "rb") as f:
+        assert f.read() == b"onetwo"
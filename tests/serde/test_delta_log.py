@@ -0,0 +1,103 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from living_doc_utilities.model.feature_issue import FeatureIssue
+from living_doc_utilities.serde.delta_log import IssuesDeltaLog
+
+
+def test_append_and_iter_changes(tmp_path, make_issue):
+    # Arrange
+    log = IssuesDeltaLog(tmp_path / "issues.log.jsonl")
+    log.append([("org/repo/1", make_issue(FeatureIssue, number=1))])
+
+    # Act
+    appended = log.append([("org/repo/1", None), ("org/repo/2", make_issue(FeatureIssue, number=2))])
+    changes = list(log.iter_changes())
+
+    # Assert
+    assert appended == 2
+    assert [key for key, _ in changes] == ["org/repo/1", "org/repo/1", "org/repo/2"]
+    assert isinstance(changes[0][1], FeatureIssue)
+    assert changes[1][1] is None
+    assert changes[2][1].issue_number == 2
+
+
+def test_iter_changes_missing_log(tmp_path):
+    assert not list(IssuesDeltaLog(tmp_path / "missing.jsonl").iter_changes())
+
+
+def test_iter_changes_skips_incomplete_last_record(tmp_path, mocker, make_issue):
+    # Arrange
+    file_path = tmp_path / "issues.log.jsonl"
+    log = IssuesDeltaLog(file_path)
+    log.append([("org/repo/1", make_issue(FeatureIssue, number=1))])
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "upsert", "key": "org/repo/2", "iss')
+    mock_logger = mocker.patch("living_doc_utilities.serde.delta_log.logger.warning")
+
+    # Act
+    changes = list(log.iter_changes())
+
+    # Assert
+    assert [key for key, _ in changes] == ["org/repo/1"]
+    mock_logger.assert_called_once()
+
+
+def test_append_discards_incomplete_last_record(tmp_path, make_issue):
+    # Arrange
+    file_path = tmp_path / "issues.log.jsonl"
+    log = IssuesDeltaLog(file_path)
+    log.append([("org/repo/1", make_issue(FeatureIssue, number=1))])
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "upsert", "key": "org/repo/2", "iss')
+
+    # Act
+    log.append([("org/repo/3", make_issue(FeatureIssue, number=3))])
+
+    # Assert
+    assert [key for key, _ in log.iter_changes()] == ["org/repo/1", "org/repo/3"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{invalid json\n{"op": "delete", "key": "a"}\n', '{"op": "delete"}\n', '{"op": "rename", "key": "a"}\n'],
+)
+def test_iter_changes_malformed_record(tmp_path, content):
+    file_path = tmp_path / "issues.log.jsonl"
+    file_path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(IssuesDeltaLog(file_path).iter_changes())
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".xz", ".bz2"])
+def test_compressed_log_rejected(tmp_path, suffix):
+    # Act
+    with pytest.raises(ValueError) as e:
+        IssuesDeltaLog(tmp_path / f"issues.log.jsonl{suffix}")
+
+    # Assert
+    assert "must not be compressed" in str(e.value)
+    assert not list(tmp_path.iterdir())
+
+
+def test_clear(tmp_path):
+    file_path = tmp_path / "issues.log.jsonl"
+    log = IssuesDeltaLog(file_path)
+    log.append([("org/repo/1", None)])
+    log.clear()
+    log.clear()
+    assert not file_path.exists()
@@ -14,10 +14,22 @@
 # limitations under the License.
 #
 
-from github import GithubException
-from requests import RequestException
+import asyncio
 
-from living_doc_utilities.decorators import debug_log_decorator, safe_call_decorator
+import pytest
+from github import Auth, Github, GithubException
+from requests import RequestException, Timeout
+
+from living_doc_utilities.decorators import (
+    async_debug_log_decorator,
+    async_safe_call_decorator,
+    debug_log_decorator,
+    safe_call_decorator,
+)
+from living_doc_utilities.constants import CircuitState
+from living_doc_utilities.github.circuit_breaker import CircuitBreaker
+from living_doc_utilities.github.rate_limiter import AsyncGithubRateLimiter, GithubRateLimiter
+from living_doc_utilities.github.retry_policy import RetryPolicy
 
 
 # sample function to be decorated
@@ -28,20 +40,47 @@ def sample_function(x, y):
 # debug_log_decorator
 
 
+def _logged(mock_log_debug):
+    # the logged values are rendered lazily
+    return [tuple(str(arg) for arg in call.args) for call in mock_log_debug.call_args_list]
+
+
 def test_debug_log_decorator(mocker):
     # Mock logging
+    mocker.patch("living_doc_utilities.decorators.logger.isEnabledFor", return_value=True)
     mock_log_debug = mocker.patch("living_doc_utilities.decorators.logger.debug")
 
     decorated_function = debug_log_decorator(sample_function)
     expected_call = [
-        mocker.call("Calling method %s with args: %s and kwargs: %s.", "sample_function", (3, 4), {}),
-        mocker.call("Method %s returned %s.", "sample_function", 7),
+        ("Calling method %s with args: %s and kwargs: %s.", "sample_function", "(3, 4)", "{}"),
+        ("Method %s returned %s.", "sample_function", "7"),
     ]
 
     actual = decorated_function(3, 4)
 
     assert 7 == actual
-    assert mock_log_debug.call_args_list == expected_call
+    assert _logged(mock_log_debug) == expected_call
+
+
+def test_debug_log_decorator_passes_through_without_debug(mocker):
+    mocker.patch("living_doc_utilities.decorators.logger.isEnabledFor", return_value=False)
+
+    decorated_function = debug_log_decorator(sample_function)
+
+    assert decorated_function is sample_function
+
+
+def test_debug_log_decorator_truncates_values(mocker):
+    mocker.patch("living_doc_utilities.decorators.logger.isEnabledFor", return_value=True)
+    mock_log_debug = mocker.patch("living_doc_utilities.decorators.logger.debug")
+
+    decorated_function = debug_log_decorator(lambda body, labels: body)
+    decorated_function("x" * 10_000, labels=list(range(1000)))
+
+    logged_call, logged_return = _logged(mock_log_debug)
+    assert len(logged_call[2]) < 250
+    assert logged_call[3].endswith("...]}")
+    assert len(logged_return[2]) < 250
 
 
 # safe_call_decorator
@@ -138,3 +177,211 @@ def test_safe_call_decorator_exception(rate_limiter, mocker):
     assert "Unexpected error of type %s occurred in %s: %s." in exception_message
     assert "ZeroDivisionError" in exception_type
     assert "sample_method" in method_name
+
+
+def test_safe_call_decorator_retries_transient_errors(rate_limiter, mocker):
+    mock_sleep = mocker.patch("living_doc_utilities.decorators.time.sleep")
+    mock_log_warning = mocker.patch("living_doc_utilities.decorators.logger.warning")
+    method = mocker.Mock(side_effect=[GithubException(502, {"message": "Bad Gateway"}), Timeout("timeout"), 7])
+    method.__name__ = "sample_method"
+
+    actual = safe_call_decorator(rate_limiter, retry_policy=RetryPolicy(backoff_base=1.0, jitter=False))(method)()
+
+    assert 7 == actual
+    assert 3 == method.call_count
+    assert [mocker.call(1.0), mocker.call(2.0)] == mock_sleep.call_args_list
+    assert 2 == mock_log_warning.call_count
+    # every attempt goes through the rate limiter
+    assert 7 == rate_limiter.remaining
+
+
+def test_safe_call_decorator_gives_up_after_max_attempts(rate_limiter, mocker):
+    mocker.patch("living_doc_utilities.decorators.time.sleep")
+    mock_log_error = mocker.patch("living_doc_utilities.decorators.logger.error")
+    method = mocker.Mock(side_effect=ConnectionError("Test connection error"))
+    method.__name__ = "sample_method"
+
+    actual = safe_call_decorator(rate_limiter, retry_policy=RetryPolicy(max_attempts=2, jitter=False))(method)()
+
+    assert actual is None
+    assert 2 == method.call_count
+    assert "Network error calling %s: %s." == mock_log_error.call_args[0][0]
+
+
+@pytest.mark.parametrize(
+    "decorator, limiter_class",
+    [(safe_call_decorator, GithubRateLimiter), (async_safe_call_decorator, AsyncGithubRateLimiter)],
+)
+def test_safe_call_decorator_rejects_retry_policy_with_pygithub_retries(decorator, limiter_class):
+    limiter = limiter_class(Github(auth=Auth.Token("token")))
+
+    with pytest.raises(ValueError):
+        decorator(limiter, retry_policy=RetryPolicy())
+
+    # PyGithub retries alone are kept
+    assert callable(decorator(limiter))
+
+
+def test_safe_call_decorator_does_not_retry_permanent_errors(rate_limiter, mocker):
+    mock_sleep = mocker.patch("living_doc_utilities.decorators.time.sleep")
+    mocker.patch("living_doc_utilities.decorators.logger.error")
+    method = mocker.Mock(side_effect=GithubException(404, {"message": "Not Found"}))
+    method.__name__ = "sample_method"
+
+    actual = safe_call_decorator(rate_limiter, retry_policy=RetryPolicy())(method)()
+
+    assert actual is None
+    assert 1 == method.call_count
+    mock_sleep.assert_not_called()
+
+
+def test_safe_call_decorator_fails_fast_while_circuit_open(rate_limiter, mocker):
+    mock_log_error = mocker.patch("living_doc_utilities.decorators.logger.error")
+    breaker = CircuitBreaker(minimum_calls=2)
+    method = mocker.Mock(side_effect=Timeout("timeout"))
+    method.__name__ = "sample_method"
+    decorated = safe_call_decorator(rate_limiter, circuit_breaker=breaker)(method)
+
+    actual = [decorated() for _ in range(5)]
+
+    assert [None] * 5 == actual
+    assert 2 == method.call_count
+    assert 2 == mock_log_error.call_count
+    assert 3 == breaker.rejected
+    # rejected calls do not consume the rate limit
+    assert 8 == rate_limiter.remaining
+
+
+def test_safe_call_decorator_stops_retrying_when_circuit_opens(rate_limiter, mocker):
+    mock_sleep = mocker.patch("living_doc_utilities.decorators.time.sleep")
+    mocker.patch("living_doc_utilities.decorators.logger.error")
+    breaker = CircuitBreaker(minimum_calls=2)
+    method = mocker.Mock(side_effect=ConnectionError("Test connection error"))
+    method.__name__ = "sample_method"
+
+    actual = safe_call_decorator(rate_limiter, retry_policy=RetryPolicy(max_attempts=5), circuit_breaker=breaker)(
+        method
+    )()
+
+    assert actual is None
+    assert 2 == method.call_count
+    assert 1 == mock_sleep.call_count
+    assert CircuitState.OPEN == breaker.state
+
+
+def test_safe_call_decorator_records_success(rate_limiter, mocker):
+    breaker = CircuitBreaker(minimum_calls=2)
+    mock_record = mocker.spy(breaker, "record")
+
+    actual = safe_call_decorator(rate_limiter, circuit_breaker=breaker)(sample_function)(1, 2)
+
+    assert 3 == actual
+    mock_record.assert_called_once_with()
+
+
+# async decorators
+
+
+def test_async_debug_log_decorator(mocker):
+    mocker.patch("living_doc_utilities.decorators.logger.isEnabledFor", return_value=True)
+    mock_log_debug = mocker.patch("living_doc_utilities.decorators.logger.debug")
+
+    async def sample_coroutine(x, y):
+        return x + y
+
+    decorated_function = async_debug_log_decorator(sample_coroutine)
+    expected_call = [
+        ("Calling method %s with args: %s and kwargs: %s.", "sample_coroutine", "(3, 4)", "{}"),
+        ("Method %s returned %s.", "sample_coroutine", "7"),
+    ]
+
+    actual = asyncio.run(decorated_function(3, 4))
+
+    assert 7 == actual
+    assert _logged(mock_log_debug) == expected_call
+
+
+def test_async_debug_log_decorator_passes_through_without_debug(mocker):
+    mocker.patch("living_doc_utilities.decorators.logger.isEnabledFor", return_value=False)
+
+    async def sample_coroutine():
+        return 1
+
+    assert async_debug_log_decorator(sample_coroutine) is sample_coroutine
+
+
+def test_async_safe_call_decorator_success(rate_limiter):
+    limiter = AsyncGithubRateLimiter(rate_limiter.github_client)
+
+    @async_safe_call_decorator(limiter)
+    async def sample_method(x, y):
+        return x + y
+
+    actual = asyncio.run(sample_method(2, 3))
+
+    assert 5 == actual
+    assert 9 == limiter.remaining
+
+
+def test_async_safe_call_decorator_retries_and_logs(rate_limiter, mocker):
+    mock_sleep = mocker.patch("living_doc_utilities.decorators.asyncio.sleep", new=mocker.AsyncMock())
+    mock_log_error = mocker.patch("living_doc_utilities.decorators.logger.error")
+    limiter = AsyncGithubRateLimiter(rate_limiter.github_client)
+    attempts = []
+
+    @async_safe_call_decorator(limiter, retry_policy=RetryPolicy(max_attempts=3, jitter=False))
+    async def sample_method():
+        attempts.append(1)
+        raise ConnectionError("Test connection error")
+
+    actual = asyncio.run(sample_method())
+
+    assert actual is None
+    assert 3 == len(attempts)
+    assert [mocker.call(1.0), mocker.call(2.0)] == mock_sleep.await_args_list
+    assert "Network error calling %s: %s." == mock_log_error.call_args[0][0]
+    assert "sample_method" == mock_log_error.call_args[0][1]
+
+
+def test_async_safe_call_decorator_fails_fast_while_circuit_open(rate_limiter, mocker):
+    mocker.patch("living_doc_utilities.decorators.logger.error")
+    limiter = AsyncGithubRateLimiter(rate_limiter.github_client)
+    breaker = CircuitBreaker(minimum_calls=1)
+    attempts = []
+
+    @async_safe_call_decorator(limiter, circuit_breaker=breaker)
+    async def sample_method():
+        attempts.append(1)
+        raise GithubException(503, {"message": "Service Unavailable"})
+
+    async def run():
+        return [await sample_method() for _ in range(3)]
+
+    actual = asyncio.run(run())
+
+    assert [None] * 3 == actual
+    assert 1 == len(attempts)
+    assert 2 == breaker.rejected
+
+
+def test_async_safe_call_decorator_releases_cancelled_probe(rate_limiter, mocker):
+    mocker.patch("living_doc_utilities.github.circuit_breaker.time.monotonic", return_value=100.0)
+    limiter = AsyncGithubRateLimiter(rate_limiter.github_client)
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=0)
+    breaker.allow()
+    breaker.record(Timeout("timeout"))
+
+    @async_safe_call_decorator(limiter, circuit_breaker=breaker)
+    async def sample_method():
+        raise asyncio.CancelledError()
+
+    async def run():
+        try:
+            await sample_method()
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+
+    assert CircuitState.HALF_OPEN == breaker.state
+    assert breaker.allow()
@@ -0,0 +1,163 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+
+import pytest
+
+from living_doc_utilities.decorators import safe_call_decorator
+from living_doc_utilities.fan_out import FanOutResult, fan_out
+from living_doc_utilities.github.rate_limiter import GithubRateLimiter, ThreadSafeGithubRateLimiter
+
+
+def test_fan_out_ordered_results():
+    # Arrange
+    def slow_square(x):
+        time.sleep(0.02 if x % 2 else 0)
+        return x * x
+
+    # Act
+    results = list(fan_out(slow_square, range(10), max_workers=4))
+
+    # Assert
+    assert [result.index for result in results] == list(range(10))
+    assert [result.value for result in results] == [x * x for x in range(10)]
+    assert all(result.ok for result in results)
+
+
+def test_fan_out_unordered_results():
+    # Arrange
+    def slow_identity(x):
+        time.sleep(0.05 if x == 0 else 0)
+        return x
+
+    # Act
+    results = list(fan_out(slow_identity, range(4), max_workers=4, ordered=False))
+
+    # Assert
+    assert sorted(result.value for result in results) == [0, 1, 2, 3]
+    assert results[-1].value == 0
+
+
+def test_fan_out_bounds_concurrency():
+    # Arrange
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def work(x, y):
+        with lock:
+            in_flight.append(x)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(x)
+        return x + y
+
+    # Act
+    results = list(fan_out(work, ((x, 1) for x in range(20)), max_workers=3))
+
+    # Assert
+    assert [result.value for result in results] == [x + 1 for x in range(20)]
+    assert max(max_in_flight) <= 3
+
+
+def test_fan_out_captures_errors():
+    # Arrange
+    def invert(x):
+        return 1 / x
+
+    # Act
+    results = list(fan_out(invert, [1, 0, 2]))
+
+    # Assert
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ZeroDivisionError)
+    assert results[1].args == (0,)
+    assert results[2].value == 0.5
+
+
+def test_fan_out_with_safe_call_decorator(rate_limiter):
+    # Arrange
+    limiter = ThreadSafeGithubRateLimiter(rate_limiter.github_client)
+
+    @safe_call_decorator(limiter)
+    def fetch(x):
+        return x * 10
+
+    # Act
+    results = list(fan_out(fetch, range(5), rate_limiter=limiter))
+
+    # Assert
+    assert [result.value for result in results] == [0, 10, 20, 30, 40]
+    assert limiter.remaining == 5
+
+
+def test_fan_out_limits_in_flight_calls_by_budget(rate_limiter, mocker):
+    # Arrange
+    limiter = ThreadSafeGithubRateLimiter(rate_limiter.github_client)
+    limiter.bucket().set_state(GithubRateLimiter.THRESHOLD + 2, time.time() + 3600)
+    mocker.patch.object(limiter, "_select_client", return_value=0)
+    submitted = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def work(x):
+        with lock:
+            submitted.append(x)
+            max_in_flight.append(len(submitted))
+        time.sleep(0.01)
+        with lock:
+            submitted.remove(x)
+        return x
+
+    # Act
+    list(fan_out(work, range(10), max_workers=8, rate_limiter=limiter))
+
+    # Assert
+    assert max(max_in_flight) <= 2
+
+
+def test_fan_out_stops_early():
+    # Arrange
+    calls = []
+
+    def work(x):
+        calls.append(x)
+        return x
+
+    # Act
+    results = fan_out(work, range(1000), max_workers=2)
+    first = next(results)
+    results.close()
+
+    # Assert
+    assert first.value == 0
+    assert len(calls) < 1000
+
+
+def test_fan_out_invalid_arguments(rate_limiter):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        list(fan_out(print, [], max_workers=0))
+    with pytest.raises(TypeError):
+        list(fan_out(print, [], rate_limiter=rate_limiter))
+
+
+def test_fan_out_result_repr():
+    # Act & Assert
+    assert repr(FanOutResult(0, (1,), value=2)) == "FanOutResult(index=0, args=(1,), value=2, error=None)"
@@ -0,0 +1,204 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import json
+import logging
+import time
+
+import pytest
+
+from living_doc_utilities.decorators import async_safe_call_decorator, safe_call_decorator
+from living_doc_utilities.github.rate_limiter import AsyncGithubRateLimiter
+from living_doc_utilities.metrics import MethodMetrics, MetricsRegistry, record_rate_limit_wait
+
+
+def test_method_metrics_percentiles():
+    # Arrange
+    metrics = MethodMetrics("get_repo")
+
+    # Act
+    for _ in range(90):
+        metrics.observe(0.1)
+    for _ in range(9):
+        metrics.observe(1.0)
+    metrics.observe(5.0, failed=True)
+
+    # Assert
+    assert 100 == metrics.calls
+    assert 1 == metrics.errors
+    assert 0.1 <= metrics.percentile(50) < 0.1 * 1.19
+    assert 1.0 <= metrics.percentile(95) < 1.0 * 1.19
+    assert 1.0 <= metrics.percentile(99) < 1.0 * 1.19
+    assert 5.0 == metrics.percentile(100)
+    assert pytest.approx(9 + 9 + 5) == metrics.total_time
+
+
+def test_method_metrics_without_calls():
+    # Assert
+    assert 0.0 == MethodMetrics("get_repo").percentile(99)
+
+
+def test_instrument_counts_calls_and_errors():
+    # Arrange
+    registry = MetricsRegistry()
+
+    @registry
+    def get_repo(name):
+        if name is None:
+            raise ValueError("name")
+        return name
+
+    # Act
+    get_repo("a")
+    get_repo("b")
+    with pytest.raises(ValueError):
+        get_repo(None)
+
+    # Assert
+    metrics = registry.summary()["test_instrument_counts_calls_and_errors.<locals>.get_repo"]
+    assert (3, 1) == (metrics["calls"], metrics["errors"])
+
+
+def test_instrument_coroutine_function():
+    # Arrange
+    registry = MetricsRegistry()
+
+    async def get_repo():
+        await asyncio.sleep(0)
+        return "repo"
+
+    instrumented = registry.instrument(get_repo, "get_repo")
+
+    # Act
+    actual = asyncio.run(instrumented())
+
+    # Assert
+    assert "repo" == actual
+    assert 1 == registry.get("get_repo").calls
+
+
+def test_rate_limit_wait_is_attributed_to_the_current_call():
+    # Arrange
+    registry = MetricsRegistry()
+
+    @registry
+    def get_repo():
+        record_rate_limit_wait(2.5)
+
+    # Act
+    get_repo()
+    record_rate_limit_wait(10.0)
+
+    # Assert
+    assert 2.5 == registry.summary()["test_rate_limit_wait_is_attributed_to_the_current_call.<locals>.get_repo"][
+        "rate_limit_wait"
+    ]
+
+
+def test_safe_call_decorator_records_attempts(rate_limiter, mocker):
+    # Arrange
+    mocker.patch("living_doc_utilities.decorators.logger.error")
+    mocker.patch("living_doc_utilities.github.rate_limiter.time.sleep")
+    rate_limiter.github_client.get_rate_limit.return_value.rate.remaining = 3
+    registry = MetricsRegistry()
+
+    @safe_call_decorator(rate_limiter, metrics=registry)
+    def get_repo(fail):
+        if fail:
+            raise ConnectionError("down")
+        return "repo"
+
+    # Act
+    get_repo(False)
+    get_repo(True)
+
+    # Assert
+    metrics = registry.get("test_safe_call_decorator_records_attempts.<locals>.get_repo")
+    assert (2, 1) == (metrics.calls, metrics.errors)
+    # the first call found the budget exhausted and waited for the reset
+    assert metrics.rate_limit_wait > 0
+
+
+def test_latency_excludes_rate_limit_wait(rate_limiter, mocker):
+    # Arrange
+    sleep = time.sleep
+    mocker.patch("living_doc_utilities.github.rate_limiter.time.sleep", side_effect=lambda _: sleep(0.2))
+    # the budget is exhausted, the limiter waits for the reset
+    rate_limiter.github_client.get_rate_limit.return_value.rate.remaining = 3
+    registry = MetricsRegistry()
+
+    @safe_call_decorator(rate_limiter, metrics=registry)
+    def get_repo():
+        sleep(0.01)
+        return "repo"
+
+    # Act
+    get_repo()
+
+    # Assert
+    metrics = registry.get("test_latency_excludes_rate_limit_wait.<locals>.get_repo").to_dict()
+    assert metrics["rate_limit_wait"] >= 0.2
+    assert 0.01 <= metrics["total_time"] < 0.15
+    assert metrics["p99"] < 0.15
+
+
+def test_async_safe_call_decorator_records_attempts(rate_limiter):
+    # Arrange
+    registry = MetricsRegistry()
+    limiter = AsyncGithubRateLimiter(rate_limiter.github_client)
+
+    @async_safe_call_decorator(limiter, metrics=registry)
+    async def get_repo():
+        return "repo"
+
+    # Act
+    asyncio.run(get_repo())
+
+    # Assert
+    assert 1 == registry.get("test_async_safe_call_decorator_records_attempts.<locals>.get_repo").calls
+
+
+def test_summary_dumps(tmp_path, caplog):
+    # Arrange
+    registry = MetricsRegistry()
+    registry.get("fast").observe(0.01)
+    registry.get("slow").observe(2.0)
+    path = tmp_path / "metrics.json"
+
+    # Act
+    with caplog.at_level(logging.INFO, logger="living_doc_utilities.metrics"):
+        registry.log_summary()
+    registry.save_json(path)
+
+    # Assert
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert ["slow", "fast"] == list(saved)
+    assert {"calls", "errors", "total_time", "max_time", "p50", "p95", "p99", "rate_limit_wait"} == set(saved["slow"])
+    assert caplog.records[0].getMessage().startswith("slow: 1 calls, 0 errors")
+
+
+def test_clear():
+    # Arrange
+    registry = MetricsRegistry()
+    registry.get("get_repo")
+
+    # Act
+    registry.clear()
+
+    # Assert
+    assert {} == registry.summary()
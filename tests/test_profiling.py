@@ -0,0 +1,99 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pstats
+import tracemalloc
+
+import pytest
+
+from living_doc_utilities.profiling import profiling
+
+
+def _work():
+    return [str(number) * 10 for number in range(10_000)]
+
+
+def test_profiling_cpu(tmp_path):
+    # Act
+    with profiling("cpu", tmp_path):
+        _work()
+
+    # Assert
+    stats = pstats.Stats(str(tmp_path / "profile.pstats"))
+    assert any(function_name == "_work" for _, _, function_name in stats.stats)
+    assert "_work" in (tmp_path / "profile.txt").read_text(encoding="utf-8")
+    assert not (tmp_path / "memory.txt").exists()
+
+
+def test_profiling_memory(tmp_path):
+    # Arrange
+    was_tracing = tracemalloc.is_tracing()
+
+    # Act
+    with profiling("memory", tmp_path, top=5):
+        data = _work()
+
+    # Assert
+    report = (tmp_path / "memory.txt").read_text(encoding="utf-8")
+    assert "Top 5 allocations by line:" in report
+    assert "test_profiling.py" in report
+    assert tracemalloc.Snapshot.load(str(tmp_path / "memory.snapshot")).traces
+    assert not (tmp_path / "profile.pstats").exists()
+    assert was_tracing == tracemalloc.is_tracing()
+    assert data
+
+
+def test_profiling_all_from_input(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("INPUT_PROFILE", "ALL")
+
+    # Act
+    with profiling(output_path=tmp_path / "reports"):
+        _work()
+
+    # Assert
+    assert {"profile.pstats", "profile.txt", "memory.txt", "memory.snapshot"} == {
+        path.name for path in (tmp_path / "reports").iterdir()
+    }
+
+
+@pytest.mark.parametrize("mode", ["", "unknown"])
+def test_profiling_disabled(tmp_path, mode, mocker):
+    # Arrange
+    mock_log_warning = mocker.patch("living_doc_utilities.profiling.logger.warning")
+
+    # Act
+    with profiling(mode, tmp_path / "reports"):
+        _work()
+
+    # Assert
+    assert not (tmp_path / "reports").exists()
+    assert bool(mode) == mock_log_warning.called
+
+
+def test_profiling_as_decorator_saves_on_error(tmp_path):
+    # Arrange
+    @profiling("cpu", tmp_path)
+    def main():
+        _work()
+        raise RuntimeError("failed run")
+
+    # Act
+    with pytest.raises(RuntimeError):
+        main()
+
+    # Assert
+    assert (tmp_path / "profile.pstats").exists()
@@ -0,0 +1,218 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import time
+
+import pytest
+
+from living_doc_utilities.decorators import safe_call_decorator
+from living_doc_utilities.fan_out import fan_out
+from living_doc_utilities.single_flight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_call():
+    # Arrange
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @single_flight
+    def get_repository(name):
+        calls.append(name)
+        started.set()
+        release.wait(timeout=5)
+        return {"name": name}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(get_repository("org/repo")))
+    leader.start()
+    started.wait(timeout=5)
+    followers = [threading.Thread(target=lambda: results.append(get_repository("org/repo"))) for _ in range(4)]
+    for follower in followers:
+        follower.start()
+
+    # Act
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    # Assert
+    assert calls == ["org/repo"]
+    assert results == [{"name": "org/repo"}] * 5
+    assert single_flight.shared == 4
+
+
+def test_different_arguments_are_not_coalesced():
+    # Arrange
+    single_flight = SingleFlight()
+    calls = []
+
+    @single_flight
+    def get_repository(name, archived=False):
+        calls.append((name, archived))
+        return name
+
+    # Act
+    get_repository("a")
+    get_repository("b")
+    get_repository("a", archived=True)
+
+    # Assert
+    assert calls == [("a", False), ("b", False), ("a", True)]
+
+
+def test_error_is_shared_with_waiting_callers():
+    # Arrange
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait(timeout=5)
+        raise RuntimeError("outage")
+
+    def call():
+        try:
+            single_flight.do("key", fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(timeout=5)
+    follower = threading.Thread(target=call)
+    follower.start()
+
+    # Act
+    time.sleep(0.05)
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    # Assert
+    assert len(errors) == 2
+    assert errors[0] is errors[1]
+
+
+def test_ttl_memoizes_results(mocker):
+    # Arrange
+    mock_monotonic = mocker.patch("living_doc_utilities.single_flight.time.monotonic", return_value=100.0)
+    single_flight = SingleFlight(ttl=10)
+    function = mocker.Mock(side_effect=["first", "second"])
+
+    # Act
+    first = single_flight.do("key", function)
+    memoized = single_flight.do("key", function)
+    mock_monotonic.return_value = 111.0
+    expired = single_flight.do("key", function)
+
+    # Assert
+    assert (first, memoized, expired) == ("first", "first", "second")
+    assert function.call_count == 2
+
+
+def test_none_results_are_not_memoized(mocker):
+    # Arrange
+    single_flight = SingleFlight(ttl=60)
+    function = mocker.Mock(side_effect=[None, "ok"])
+
+    # Act
+    results = [single_flight.do("key", function), single_flight.do("key", function)]
+
+    # Assert
+    assert results == [None, "ok"]
+
+
+def test_forget_and_clear(mocker):
+    # Arrange
+    single_flight = SingleFlight(ttl=60)
+    function = mocker.Mock(return_value="ok")
+    single_flight.do("a", function)
+    single_flight.do("b", function)
+
+    # Act
+    single_flight.forget("a")
+    single_flight.do("a", function)
+    single_flight.clear()
+    single_flight.do("b", function)
+
+    # Assert
+    assert function.call_count == 4
+
+
+def test_unhashable_arguments_are_not_coalesced(mocker):
+    # Arrange
+    single_flight = SingleFlight(ttl=60)
+    function = mocker.Mock(return_value="ok", __name__="function", __qualname__="function")
+    wrapped = single_flight(function)
+
+    # Act
+    wrapped(["org/repo"])
+    wrapped(["org/repo"])
+
+    # Assert
+    assert function.call_count == 2
+
+
+def test_bound_methods_of_different_objects_are_not_coalesced(rate_limiter):
+    # Arrange
+    class Repository:
+        def __init__(self, name):
+            self.name = name
+
+        def get_issues(self, state):
+            return f"{self.name} {state}"
+
+    single_flight = SingleFlight(ttl=60)
+    first = single_flight(safe_call_decorator(rate_limiter)(Repository("org/first").get_issues))
+    second = single_flight(safe_call_decorator(rate_limiter)(Repository("org/second").get_issues))
+
+    # Act
+    results = [first("open"), second("open"), first("open")]
+
+    # Assert
+    assert results == ["org/first open", "org/second open", "org/first open"]
+    assert single_flight.shared == 1
+
+
+def test_single_flight_with_safe_call_in_fan_out(rate_limiter):
+    # Arrange
+    calls = []
+
+    @SingleFlight()
+    @safe_call_decorator(rate_limiter)
+    def get_repository(name):
+        calls.append(name)
+        time.sleep(0.05)
+        return name.upper()
+
+    # Act
+    results = list(fan_out(get_repository, ["org/repo"] * 8, max_workers=8))
+
+    # Assert
+    assert [result.value for result in results] == ["ORG/REPO"] * 8
+    assert len(calls) < 8
+
+
+def test_invalid_ttl():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        SingleFlight(ttl=-1)
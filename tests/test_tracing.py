@@ -0,0 +1,172 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from living_doc_utilities.decorators import safe_call_decorator
+from living_doc_utilities.github.retry_policy import RetryPolicy
+from living_doc_utilities.model.issues import Issues
+from living_doc_utilities.tracing import NULL_SPAN, Tracer, traced, tracer
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer.clear()
+    tracer.enabled = True
+    yield tracer
+    tracer.enabled = False
+    tracer.clear()
+
+
+def test_disabled_tracer_returns_null_span():
+    # Arrange
+    disabled = Tracer()
+
+    # Act
+    with disabled.span("work", attribute=1) as span:
+        span.set_attribute("other", 2)
+
+    # Assert
+    assert span is NULL_SPAN
+    assert [] == disabled.spans
+
+
+def test_spans_nest_and_record_attributes():
+    # Arrange
+    enabled = Tracer(enabled=True)
+
+    # Act
+    with enabled.span("outer", "test", size=3) as outer:
+        with enabled.span("inner") as inner:
+            inner.set_attribute("key", "value")
+
+    # Assert
+    assert [inner, outer] == enabled.spans
+    assert inner.parent is outer
+    assert outer.parent is None
+    assert outer.start <= inner.start <= inner.end <= outer.end
+    assert {"size": 3} == outer.attributes
+    assert {"key": "value"} == inner.attributes
+    assert inner.thread_id == threading.get_ident()
+
+
+def test_span_records_error():
+    # Arrange
+    enabled = Tracer(enabled=True)
+
+    # Act
+    with pytest.raises(ValueError):
+        with enabled.span("failing"):
+            raise ValueError("boom")
+
+    # Assert
+    assert {"error": "ValueError"} == enabled.spans[0].attributes
+
+
+def test_tracer_drops_spans_over_limit():
+    # Arrange
+    enabled = Tracer(enabled=True, max_spans=2)
+
+    # Act
+    for _ in range(5):
+        with enabled.span("work"):
+            pass
+
+    # Assert
+    assert 2 == len(enabled.spans)
+    assert 3 == enabled.dropped
+
+
+def test_chrome_trace_export(tmp_path, mocker):
+    # Arrange
+    mock_log_info = mocker.patch("living_doc_utilities.tracing.logger.info")
+    enabled = Tracer(enabled=True)
+    with enabled.span("work", "test", size=3):
+        pass
+    path = tmp_path / "trace.json"
+
+    # Act
+    enabled.save_chrome_trace(path)
+
+    # Assert
+    with open(path, encoding="utf-8") as f:
+        trace = json.load(f)
+    metadata, event = trace["traceEvents"]
+    assert "thread_name" == metadata["name"]
+    assert threading.current_thread().name == metadata["args"]["name"]
+    assert {"name": "work", "cat": "test", "ph": "X", "args": {"size": 3}}.items() <= event.items()
+    assert event["ts"] >= 0 and event["dur"] >= 0
+    assert event["tid"] == metadata["tid"]
+    assert 1 == mock_log_info.call_args[0][1]
+
+
+def test_traced_decorator(enabled_tracer):
+    # Arrange
+    @traced(category="test")
+    def work():
+        return 1
+
+    @traced("async work")
+    async def async_work():
+        return 2
+
+    # Act
+    results = (work(), asyncio.run(async_work()))
+
+    # Assert
+    assert (1, 2) == results
+    assert ["test_traced_decorator.<locals>.work", "async work"] == [span.name for span in enabled_tracer.spans]
+
+
+def test_safe_call_spans(enabled_tracer, rate_limiter, mocker):
+    # Arrange
+    mocker.patch("living_doc_utilities.decorators.time.sleep")
+    method = mocker.Mock(side_effect=[ConnectionError("down"), "repo"], __name__="get_repo")
+
+    # Act
+    actual = safe_call_decorator(rate_limiter, retry_policy=RetryPolicy(jitter=False))(method)()
+
+    # Assert
+    assert "repo" == actual
+    spans = {span.name: span for span in enabled_tracer.spans}
+    assert ["rate_limit.acquire", "get_repo", "retry.backoff", "rate_limit.acquire", "get_repo", "safe_call:get_repo"] == [
+        span.name for span in enabled_tracer.spans
+    ]
+    assert spans["get_repo"].parent is spans["safe_call:get_repo"]
+    assert {"resource": "core", "client": 0} == spans["rate_limit.acquire"].attributes
+    assert {"seconds": 1.0} == spans["retry.backoff"].attributes
+
+
+def test_issues_io_spans(enabled_tracer, tmp_path):
+    # Arrange
+    path = tmp_path / "issues.jsonl"
+
+    # Act
+    Issues().save_to_json(path, format="jsonl")
+    Issues.load_from_json(path, format="jsonl")
+
+    # Assert
+    names = [(span.name, span.parent.name if span.parent else None) for span in enabled_tracer.spans]
+    assert [
+        ("Issues.save_to_jsonl", "Issues.save_to_json"),
+        ("Issues.save_to_json", None),
+        ("Issues.load_from_jsonl", "Issues.load_from_json"),
+        ("Issues.load_from_json", None),
+    ] == names